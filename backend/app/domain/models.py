@@ -1,6 +1,7 @@
 """Domain Models - Pydantic schemas for all entities"""
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import cached_property
+from typing import Any, Dict, List, Optional, Tuple
 from pydantic import BaseModel, Field, EmailStr, ConfigDict
 
 from .enums import (
@@ -18,23 +19,38 @@ from .enums import (
 
 class UserSnapshot(BaseModel):
     """Snapshot of user identity at a point in time"""
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
     
     aad_id: Optional[str] = Field(None, description="Azure AD object ID (oid)")
     email: EmailStr = Field(..., description="User email/UPN")
     display_name: str = Field(..., description="User display name")
     role_at_time: Optional[str] = Field(None, description="Role when snapshot was taken")
     manager_email: Optional[EmailStr] = Field(None, description="Manager email if known")
+    
+    @cached_property
+    def email_lower(self) -> str:
+        """Lower-cased email, computed once per snapshot (for case-insensitive matching)"""
+        return self.email.lower()
 
 
 class ActorContext(BaseModel):
     """Current actor context from JWT token"""
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
     
     aad_id: str = Field(..., description="Azure AD object ID")
     email: EmailStr = Field(..., description="User email")
     display_name: str = Field(..., description="User display name")
     roles: List[str] = Field(default_factory=list, description="Assigned roles")
+    
+    @cached_property
+    def roles_lc(self) -> frozenset:
+        """Lower-cased roles, computed once per actor"""
+        return frozenset(r.lower() for r in self.roles)
+    
+    @cached_property
+    def email_lower(self) -> str:
+        """Lower-cased email, computed once per actor (for case-insensitive matching)"""
+        return self.email.lower()
 
 
 # ============================================================================
@@ -370,6 +386,78 @@ class WorkflowDefinition(BaseModel):
     transitions: List[TransitionTemplate] = Field(default_factory=list)
     start_step_id: Optional[str] = Field(default=None, description="ID of first step")
     
+    @cached_property
+    def steps_by_id(self) -> Dict[str, Dict[str, Any]]:
+        """Step definitions keyed by step_id (first definition wins on duplicates)"""
+        index: Dict[str, Dict[str, Any]] = {}
+        for step in self.steps:
+            index.setdefault(step.get("step_id"), step)
+        return index
+    
+    @cached_property
+    def joins_by_source_fork(self) -> Dict[str, str]:
+        """Join step_id keyed by its source_fork_step_id (first join wins on duplicates)"""
+        index: Dict[str, str] = {}
+        for step in self.steps:
+            if step.get("step_type") == StepType.JOIN_STEP.value and step.get("source_fork_step_id"):
+                index.setdefault(step["source_fork_step_id"], step.get("step_id"))
+        return index
+    
+    @cached_property
+    def transitions_by_step(self) -> Dict[str, List[TransitionTemplate]]:
+        """Transitions leaving each step, keyed by from_step_id, in transition order"""
+        index: Dict[str, List[TransitionTemplate]] = {}
+        for t in self.transitions:
+            index.setdefault(t.from_step_id, []).append(t)
+        return index
+    
+    @cached_property
+    def transitions_by_key(self) -> Dict[Tuple[str, Optional[TransitionEvent]], List[TransitionTemplate]]:
+        """
+        Transitions keyed by (from_step_id, on_event), highest priority first
+        
+        Unconditional transitions rank at priority 0; ties keep transition order.
+        """
+        index: Dict[Tuple[str, Optional[TransitionEvent]], List[TransitionTemplate]] = {}
+        for t in self.transitions:
+            index.setdefault((t.from_step_id, t.on_event), []).append(t)
+        for candidates in index.values():
+            candidates.sort(key=lambda t: 0 if t.condition is None else t.priority, reverse=True)
+        return index
+    
+    @cached_property
+    def events_by_step(self) -> Dict[str, List[Optional[TransitionEvent]]]:
+        """Distinct events of the transitions leaving each step, in first-seen order"""
+        index: Dict[str, List[Optional[TransitionEvent]]] = {}
+        for from_step_id, on_event in self.transitions_by_key:
+            index.setdefault(from_step_id, []).append(on_event)
+        return index
+    
+    @cached_property
+    def next_step_ids(self) -> Dict[str, List[str]]:
+        """Target step_ids of the transitions leaving each step, in transition order"""
+        index: Dict[str, List[str]] = {}
+        for t in self.transitions:
+            index.setdefault(t.from_step_id, []).append(t.to_step_id)
+        return index
+    
+    @cached_property
+    def step_counts_by_type(self) -> Dict[str, int]:
+        """Number of step definitions per step_type ("UNKNOWN" where missing)"""
+        counts: Dict[str, int] = {}
+        for step in self.steps:
+            step_type = step.get("step_type", "UNKNOWN")
+            counts[step_type] = counts.get(step_type, 0) + 1
+        return counts
+    
+    @cached_property
+    def first_sub_workflow_step(self) -> Optional[Dict[str, Any]]:
+        """First SUB_WORKFLOW_STEP definition, if any (used to reject nested sub-workflows)"""
+        return next(
+            (step for step in self.steps if step.get("step_type") == StepType.SUB_WORKFLOW_STEP.value),
+            None
+        )
+    
     def get_start_step_id(self) -> Optional[str]:
         """Get start step ID, inferring from first step if not set"""
         if self.start_step_id:
@@ -484,6 +572,16 @@ class Ticket(BaseModel):
     form_version: int = Field(default=1, description="Current form data version number")
     form_versions: Optional[List[Dict[str, Any]]] = Field(default=None, description="Version history of form data")
     pending_change_request_id: Optional[str] = Field(default=None, description="ID of pending CR if any")
+    
+    @cached_property
+    def active_branches_by_id(self) -> Dict[str, Tuple[int, "BranchState"]]:
+        """
+        (index, branch) for each active branch, keyed by branch_id
+        
+        Built once per loaded ticket; callers replacing a branch should work on
+        a copy of active_branches rather than mutating the list in place.
+        """
+        return {branch.branch_id: (i, branch) for i, branch in enumerate(self.active_branches)}
 
 
 class TicketStep(BaseModel):
@@ -509,6 +607,9 @@ class TicketStep(BaseModel):
     parallel_completed_approvers: Optional[List[str]] = Field(None, description="List of emails of approvers who have approved")
     parallel_approval_rule: Optional[str] = Field(None, description="ALL or ANY")
     primary_approver_email: Optional[str] = Field(None, description="Primary approver responsible for task assignment")
+    # Read-only for permission checks: never serialized, so API responses do not expose
+    # approver aad_ids and new step documents do not gain the key
+    parallel_approvers_info: Optional[List[Dict[str, Any]]] = Field(None, exclude=True, description="Identity info (email, aad_id, display_name) of the parallel approvers")
     # Parallel branching fields
     branch_id: Optional[str] = Field(None, description="Branch this step belongs to (null for main flow)")
     branch_name: Optional[str] = Field(None, description="Display name of the branch")
@@ -20,6 +20,8 @@ class AuditWriter:
     
     def __init__(self):
         self.repo = AuditRepository()
+        # Events from buffer_event, written together by flush()
+        self._pending: List[AuditEvent] = []
     
     def write_event(
         self,
@@ -31,7 +33,68 @@ class AuditWriter:
         correlation_id: Optional[str] = None
     ) -> AuditEvent:
         """Write a single audit event"""
-        event = AuditEvent(
+        event = self._build_event(
+            ticket_id=ticket_id,
+            event_type=event_type,
+            actor=actor,
+            ticket_step_id=ticket_step_id,
+            details=details,
+            correlation_id=correlation_id
+        )
+        
+        return self.repo.create_event(event)
+    
+    def write_events(self, events: List[Dict[str, Any]]) -> List[AuditEvent]:
+        """
+        Write several audit events in one insert
+        
+        Each entry takes the same keyword arguments as write_event.
+        """
+        return self.repo.create_events_bulk([self._build_event(**event) for event in events])
+    
+    def buffer_event(
+        self,
+        ticket_id: str,
+        event_type: AuditEventType,
+        actor: ActorContext,
+        ticket_step_id: Optional[str] = None,
+        details: Optional[Dict[str, Any]] = None,
+        correlation_id: Optional[str] = None
+    ) -> AuditEvent:
+        """
+        Queue an audit event for the next flush() instead of writing it now
+        
+        The event is timestamped here, so ordering is preserved when it is written.
+        """
+        event = self._build_event(
+            ticket_id=ticket_id,
+            event_type=event_type,
+            actor=actor,
+            ticket_step_id=ticket_step_id,
+            details=details,
+            correlation_id=correlation_id
+        )
+        self._pending.append(event)
+        return event
+    
+    def flush(self) -> List[AuditEvent]:
+        """Write all buffered events in one insert"""
+        if not self._pending:
+            return []
+        events, self._pending = self._pending, []
+        return self.repo.create_events_bulk(events)
+    
+    def _build_event(
+        self,
+        ticket_id: str,
+        event_type: AuditEventType,
+        actor: ActorContext,
+        ticket_step_id: Optional[str] = None,
+        details: Optional[Dict[str, Any]] = None,
+        correlation_id: Optional[str] = None
+    ) -> AuditEvent:
+        """Build an audit event stamped with a new ID and the current time"""
+        return AuditEvent(
             audit_event_id=generate_audit_event_id(),
             ticket_id=ticket_id,
             ticket_step_id=ticket_step_id,
@@ -45,8 +108,6 @@ class AuditWriter:
             timestamp=utc_now(),
             correlation_id=correlation_id
         )
-        
-        return self.repo.create_event(event)
     
     def write_create_ticket(
         self,
@@ -1,5 +1,5 @@
 """Condition Evaluator - Safe evaluation of transition conditions"""
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
 from ..domain.models import ConditionGroup, Condition
 from ..domain.enums import ConditionOperator
@@ -43,6 +43,42 @@ class ConditionEvaluator:
         else:  # AND (default)
             return all(results)
     
+    def compile(self, condition_group: ConditionGroup) -> Callable[[Dict[str, Any]], bool]:
+        """
+        Compile a condition group into a predicate over the context
+        
+        Field paths are split and the AND/OR logic resolved once, so the
+        predicate can be reused across evaluations. Same result as evaluate().
+        """
+        if not condition_group.conditions:
+            return lambda context: True  # No conditions = always true
+        
+        predicates = [self._compile_single(condition) for condition in condition_group.conditions]
+        combine = any if condition_group.logic.upper() == "OR" else all
+        return lambda context: combine([predicate(context) for predicate in predicates])
+    
+    def _compile_single(self, condition: Condition) -> Callable[[Dict[str, Any]], bool]:
+        """Compile a single condition (fails closed like _evaluate_single)"""
+        parts = condition.field.split(".")
+        operator = condition.operator
+        compare_value = condition.value
+        compare = self._compare
+        
+        def predicate(context: Dict[str, Any]) -> bool:
+            try:
+                field_value = context
+                for part in parts:
+                    if not isinstance(field_value, dict):
+                        field_value = None
+                        break
+                    field_value = field_value.get(part)
+                return compare(field_value, operator, compare_value)
+            except Exception as e:
+                logger.warning(f"Condition evaluation failed: {e}")
+                return False  # Fail closed
+        
+        return predicate
+    
     def _evaluate_single(
         self,
         condition: Condition,
@@ -52,6 +52,7 @@ The WorkflowEngine class is organized into the following sections:
 
 6. TRANSITION LOGIC (lines ~2757-3220)
    - _transition_to_next: Core transition orchestration
+   - _advance_*: Per-case handlers dispatched from _transition_to_next
    - _update_branch_current_step: Track branch progress
    - _mark_branch_failed: Mark branch as failed
    - _are_all_branch_steps_completed: Check branch completion
@@ -82,19 +83,27 @@ Guards & Resolvers:
 =============================================================================
 """
 
-from typing import Any, Dict, List, Optional
-from datetime import datetime
+import logging
+import random
+import re
+import time
+from dataclasses import dataclass
+from functools import lru_cache, wraps
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from pydantic import TypeAdapter
+from datetime import date, datetime
 
 from ..domain.models import (
     Ticket, TicketStep, ApprovalTask, Assignment, InfoRequest,
     UserSnapshot, ActorContext, WorkflowVersion, HandoverRequest, SlaAcknowledgment,
-    BranchState
+    BranchState, AuditEvent
 )
 from ..domain.enums import (
     TicketStatus, StepState, StepType, ApprovalDecision,
     AssignmentStatus, InfoRequestStatus, TransitionEvent, AuditEventType,
     ApproverResolution, HandoverRequestStatus, ForkJoinMode, BranchFailurePolicy,
-    AdminAuditAction
+    AdminAuditAction, OnboardSource
 )
 from ..domain.errors import (
     TicketNotFoundError, StepNotFoundError, PermissionDeniedError,
@@ -106,6 +115,7 @@ from ..repositories.ticket_repo import TicketRepository
 from ..repositories.workflow_repo import WorkflowRepository
 from ..repositories.audit_repo import AuditRepository
 from ..repositories.notification_repo import NotificationRepository
+from ..repositories.admin_repo import AdminRepository
 from .permission_guard import PermissionGuard
 from .transition_resolver import TransitionResolver
 from .audit_writer import AuditWriter
@@ -123,6 +133,283 @@ from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# For the active_branches writes that replace the whole list (fork start, branch skip)
+_BRANCHES_ADAPTER = TypeAdapter(List[BranchState])
+
+# Serializes the newest audit events of an action response in one pass
+_AUDIT_EVENTS_ADAPTER = TypeAdapter(List[AuditEvent])
+
+# Shared pool for notification enqueues that should not block the request path.
+# Notifications are outbox writes, so running them after the response is safe.
+_notify_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="notify")
+
+
+# Upper bound on concurrent temp-attachment moves when linking attachments to a ticket
+_ATTACHMENT_MOVE_WORKERS = 8
+
+
+def _log_notification_failure(future: Future) -> None:
+    """Done-callback for background notification enqueues"""
+    error = future.exception()
+    if error is not None:
+        logger.error(f"Background notification enqueue failed: {error}")
+
+
+@lru_cache(maxsize=512)
+def _compile_regex(pattern: str) -> Optional["re.Pattern[str]"]:
+    """Compile a form field regex once per distinct pattern (None if invalid)"""
+    try:
+        return re.compile(pattern)
+    except re.error:
+        return None
+
+
+def _parse_iso_date(value: str) -> date:
+    """
+    Parse the date part of a YYYY-MM-DD[T...] string
+    
+    Slices the common zero-padded form directly and only falls back to
+    fromisoformat/strptime for anything else. Raises ValueError if unparseable.
+    """
+    date_part = value.split('T')[0]
+    if (
+        len(date_part) == 10 and date_part[4] == '-' and date_part[7] == '-'
+        and date_part[:4].isdigit() and date_part[5:7].isdigit() and date_part[8:].isdigit()
+    ):
+        return date(int(date_part[:4]), int(date_part[5:7]), int(date_part[8:]))
+    try:
+        return date.fromisoformat(date_part)
+    except ValueError:
+        return datetime.strptime(date_part, '%Y-%m-%d').date()
+
+
+# Value validator per form field type (method names, bound per engine instance).
+# Types without an entry only get the required check.
+_FIELD_VALIDATORS: Dict[str, str] = {
+    "TEXT": "_validate_text_value",
+    "TEXTAREA": "_validate_text_value",
+    "NUMBER": "_validate_number_value",
+    "DATE": "_validate_date_value",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class _FieldPlan:
+    """Validation attributes of one form field, extracted once per validation run"""
+    key: str
+    label: str
+    field_type: str
+    required: bool
+    min_length: Optional[int]
+    max_length: Optional[int]
+    regex_pattern: Optional[str]
+    regex: Optional["re.Pattern[str]"]
+    min_value: Optional[float]
+    max_value: Optional[float]
+    validation: Dict[str, Any]
+    conditional_requirements: List[Dict[str, Any]]
+    # Field keys read by the conditional rules (to tell if a row can change the outcome)
+    conditional_field_keys: frozenset
+    # _FIELD_VALIDATORS entry for field_type, resolved once
+    validator: Optional[str]
+
+
+def _compile_field_plan(field: Dict[str, Any]) -> _FieldPlan:
+    """Pre-extract the dict lookups _validate_single_field needs for a field"""
+    field_key = field.get("field_key")
+    validation = field.get("validation", {}) or {}
+    regex_pattern = validation.get("regex_pattern")
+    conditional_requirements = field.get("conditional_requirements", []) or []
+    conditional_field_keys = set()
+    for rule in conditional_requirements:
+        when = rule.get("when", {})
+        conditional_field_keys.add(when.get("field_key"))
+        for condition in when.get("conditions") or []:
+            conditional_field_keys.add(condition.get("field_key"))
+    field_type = field.get("field_type", "TEXT")
+    return _FieldPlan(
+        key=field_key,
+        label=field.get("field_label", field_key),
+        field_type=field_type,
+        required=field.get("required", False),
+        min_length=validation.get("min_length"),
+        max_length=validation.get("max_length"),
+        regex_pattern=regex_pattern,
+        regex=_compile_regex(regex_pattern) if regex_pattern else None,
+        min_value=validation.get("min_value"),
+        max_value=validation.get("max_value"),
+        validation=validation,
+        conditional_requirements=conditional_requirements,
+        conditional_field_keys=frozenset(conditional_field_keys),
+        validator=_FIELD_VALIDATORS.get(field_type),
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class _SectionPlan:
+    """Section attributes used by form validation, extracted once"""
+    section_id: str
+    is_repeating: bool
+    section_key: str
+    min_rows: int
+    title: str
+    fields: List[_FieldPlan]
+
+
+def _compile_form_plan(
+    field_definitions: List[Dict[str, Any]],
+    sections: List[Dict[str, Any]]
+) -> Tuple[List[_SectionPlan], List[_FieldPlan]]:
+    """
+    Partition field plans into sections (in order of first field) and ungrouped fields
+    
+    Section metadata is resolved here once, so validation only walks the plans.
+    """
+    section_map = {s.get("section_id"): s for s in sections}
+    fields_by_section: Dict[str, List[_FieldPlan]] = {}
+    ungrouped: List[_FieldPlan] = []
+    for field in field_definitions:
+        plan = _compile_field_plan(field)
+        section_id = field.get("section_id")
+        if section_id:
+            fields_by_section.setdefault(section_id, []).append(plan)
+        else:
+            ungrouped.append(plan)
+    
+    section_plans = []
+    for section_id, plans in fields_by_section.items():
+        section = section_map.get(section_id, {})
+        section_plans.append(_SectionPlan(
+            section_id=section_id,
+            is_repeating=section.get("is_repeating", False),
+            section_key=f"__section_{section_id}",
+            min_rows=section.get("min_rows", 0) or 0,
+            title=section.get("section_title", f"Section {section_id}"),
+            fields=plans,
+        ))
+    return section_plans, ungrouped
+
+
+def _flush_audit_after(method: Callable[..., Any]) -> Callable[..., Any]:
+    """Write the audit events a public engine call buffered once it returns or fails"""
+    @wraps(method)
+    def wrapper(self: "WorkflowEngine", *args: Any, **kwargs: Any) -> Any:
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.audit_writer.flush()
+    return wrapper
+
+
+def _retry_optimistic(
+    attempt_fn: Callable[[], Any],
+    description: str,
+    max_retries: int = 8,
+    base_delay: float = 0.01,
+    max_delay: float = 0.5
+) -> Any:
+    """
+    Run an optimistic read-modify-write, retrying on ConcurrencyError
+    
+    Retries sleep for a random time up to an exponentially growing cap ("full
+    jitter"), so writers that collided do not retry in lock-step and collide
+    again. attempt_fn must re-read whatever it writes on every call.
+    """
+    for attempt in range(max_retries):
+        try:
+            return attempt_fn()
+        except ConcurrencyError:
+            if attempt == max_retries - 1:
+                logger.error(f"Giving up on {description} after {max_retries} attempts")
+                raise
+            logger.warning(f"Concurrency conflict on {description}, retrying (attempt {attempt + 1})")
+            time.sleep(random.uniform(0, min(max_delay, base_delay * 2 ** attempt)))
+
+
+# Enum values used when building update documents in the hot action handlers.
+# Resolving them once here avoids the Enum descriptor lookup on every write.
+_SKIPPED = StepState.SKIPPED.value
+_APPROVED = HandoverRequestStatus.APPROVED.value
+_REJECTED = HandoverRequestStatus.REJECTED.value
+_CANCELLED = HandoverRequestStatus.CANCELLED.value
+_REASSIGNED = AssignmentStatus.REASSIGNED.value
+_STEP_STATE_VALUES: Dict[Any, str] = {state: state.value for state in StepState}
+_STEP_COMPLETED = StepState.COMPLETED.value
+_STEP_REJECTED = StepState.REJECTED.value
+_STEP_CANCELLED = StepState.CANCELLED.value
+_TICKET_COMPLETED = TicketStatus.COMPLETED.value
+
+# _transition_to_next handler per (current step location, next step kind).
+# Values are method names since the handlers are bound per engine instance.
+_NEXT_STEP_HANDLERS: Dict[tuple, str] = {
+    ("root", "end"): "_advance_root_to_end",
+    ("branch", "end"): "_advance_branch_to_end",
+    ("root", "join"): "_advance_to_join",
+    ("branch", "join"): "_advance_to_join",
+    ("root", "step"): "_advance_root_to_step",
+    ("branch", "step"): "_advance_branch_to_step",
+}
+
+# Steps in these states are finished and are never re-activated or cancelled
+_TERMINAL_STEP_STATES = frozenset({
+    StepState.COMPLETED,
+    StepState.REJECTED,
+    StepState.CANCELLED,
+    StepState.SKIPPED,
+})
+_TERMINAL_STEP_STATE_VALUES = [state.value for state in _TERMINAL_STEP_STATES]
+
+# Terminal states that mean a step/branch did not finish successfully
+_FAILED_STEP_STATES = frozenset({StepState.REJECTED, StepState.CANCELLED, StepState.SKIPPED})
+
+# Approval task decisions that close the task, and the subset that block the step
+_DECIDED_APPROVAL_DECISIONS = frozenset({
+    ApprovalDecision.APPROVED,
+    ApprovalDecision.REJECTED,
+    ApprovalDecision.SKIPPED,
+})
+_NEGATIVE_APPROVAL_DECISIONS = frozenset({ApprovalDecision.REJECTED, ApprovalDecision.SKIPPED})
+
+# States from which a manager/admin may skip a step
+_SKIPPABLE_STATES = frozenset({
+    StepState.ACTIVE,
+    StepState.WAITING_FOR_APPROVAL,
+    StepState.WAITING_FOR_REQUESTER,
+    StepState.ON_HOLD,
+})
+
+# States from which an assigned agent may put a step on hold
+_HOLDABLE_STATES = frozenset({StepState.ACTIVE, StepState.WAITING_FOR_APPROVAL})
+
+# Task step states in which a draft may still be saved
+_DRAFTABLE_STATES = frozenset({
+    StepState.ACTIVE,
+    StepState.ON_HOLD,
+    StepState.WAITING_FOR_REQUESTER,
+    StepState.WAITING_FOR_AGENT,
+    StepState.WAITING_FOR_CR,
+})
+
+# Open step states that are skipped when the ticket is cancelled
+_CANCEL_SKIP_STATES = frozenset({
+    StepState.ACTIVE,
+    StepState.WAITING_FOR_APPROVAL,
+    StepState.WAITING_FOR_REQUESTER,
+    StepState.WAITING_FOR_AGENT,
+})
+
+# Open step states cancelled when a ticket or branch is rejected/cancelled, and the
+# orphans cancelled when the ticket completes (e.g. after an ANY/MAJORITY join)
+_CANCELLABLE_STEP_STATES = frozenset({
+    StepState.NOT_STARTED,
+    StepState.ACTIVE,
+    StepState.WAITING_FOR_APPROVAL,
+})
+_ORPHAN_STEP_STATE_VALUES = [state.value for state in _CANCELLABLE_STEP_STATES]
+
+# Ticket statuses that no longer accept requester notes
+_CLOSED_TICKET_STATUSES = frozenset({TicketStatus.COMPLETED, TicketStatus.CANCELLED, TicketStatus.REJECTED})
+
 
 class WorkflowEngine:
     """
@@ -151,11 +438,30 @@ class WorkflowEngine:
             workflow_repo=self.workflow_repo,
             ticket_repo=self.ticket_repo
         )
+        self._admin_repo: Optional[AdminRepository] = None
+        # Per-engine (i.e. per-request) step cache: ticket_id -> (repo step write count, steps)
+        self._steps_cache: Dict[str, tuple] = {}
+        # Join ticket_step_ids this engine has seen through to COMPLETED, so the
+        # repeated join checks of one fan-in burst do not re-run the transition
+        self._completed_joins: set = set()
+    
+    @property
+    def admin_repo(self) -> AdminRepository:
+        """Admin repository, created on first use (its constructor ensures indexes)"""
+        if self._admin_repo is None:
+            self._admin_repo = AdminRepository()
+        return self._admin_repo
+    
+    def _enqueue_notification_in_background(self, enqueue: Callable[..., Any], **kwargs: Any) -> None:
+        """Submit a notification enqueue to the shared pool, logging any failure"""
+        future = _notify_pool.submit(enqueue, **kwargs)
+        future.add_done_callback(_log_notification_failure)
     
     # =========================================================================
     # Ticket Creation
     # =========================================================================
     
+    @_flush_audit_after
     def create_ticket(
         self,
         workflow_version: WorkflowVersion,
@@ -279,7 +585,7 @@ class WorkflowEngine:
                     self.ticket_repo.update_step(
                         form_step.ticket_step_id,
                         {
-                            "state": StepState.COMPLETED.value,
+                            "state": _STEP_COMPLETED,
                             "assigned_to": requester_snapshot.model_dump(mode="json"),
                             "started_at": now,
                             "completed_at": now
@@ -430,9 +736,7 @@ class WorkflowEngine:
             return
         
         # Notify secondary users (primary already notified via standard flow)
-        from app.repositories.admin_repo import AdminRepository
-        from app.domain.enums import OnboardSource
-        admin_repo = AdminRepository()
+        admin_repo = self.admin_repo
         
         for user in all_users:
             user_email = user.get("email")
@@ -549,9 +853,7 @@ class WorkflowEngine:
                         )
                         
                         # Auto-onboard the user
-                        from app.repositories.admin_repo import AdminRepository
-                        from app.domain.enums import OnboardSource
-                        admin_repo = AdminRepository()
+                        admin_repo = self.admin_repo
                         admin_repo.auto_onboard_user(
                             email=user_email,
                             display_name=user.get("display_name", user_email),
@@ -727,10 +1029,57 @@ class WorkflowEngine:
         workflow_version: WorkflowVersion
     ) -> Optional[Dict[str, Any]]:
         """Find step definition by ID"""
-        for step in workflow_version.definition.steps:
-            if step.get("step_id") == step_id:
-                return step
-        return None
+        return workflow_version.definition.steps_by_id.get(step_id)
+    
+    def _get_steps_cached(self, ticket_id: str) -> List[TicketStep]:
+        """
+        Get all steps for a ticket, reusing the last read while no step has been written
+        
+        The cache is invalidated by the repository's step write counter, so any
+        update_step/create_step issued through this engine forces a fresh read.
+        """
+        return self._get_steps_view(ticket_id)[1]
+    
+    def _get_step_by_id(self, ticket_id: str, step_id: str) -> Optional[TicketStep]:
+        """Get a single ticket step by step_id from the cached steps view"""
+        return self._get_steps_view(ticket_id)[2].get(step_id)
+    
+    def _get_steps_view(self, ticket_id: str) -> tuple:
+        """Return the cached (write_count, steps, steps_by_id) entry, refreshing if stale"""
+        write_count = self.ticket_repo.step_write_count
+        cached = self._steps_cache.get(ticket_id)
+        if cached is not None and cached[0] == write_count:
+            return cached
+        
+        steps = self.ticket_repo.get_steps_for_ticket(ticket_id)
+        steps_by_id: Dict[str, TicketStep] = {}
+        for step in steps:
+            steps_by_id.setdefault(step.step_id, step)
+        cached = (write_count, steps, steps_by_id)
+        self._steps_cache[ticket_id] = cached
+        return cached
+    
+    def _find_join_for_fork(
+        self,
+        ticket_id: str,
+        fork_step_id: Optional[str],
+        workflow_version: WorkflowVersion
+    ) -> tuple:
+        """
+        Find the join (ticket step, step definition) whose source fork is fork_step_id
+        
+        Returns (None, None) if the fork has no join or the join step was not created
+        for this ticket.
+        """
+        if not fork_step_id or not workflow_version.definition:
+            return None, None
+        join_step_id = workflow_version.definition.joins_by_source_fork.get(fork_step_id)
+        if not join_step_id:
+            return None, None
+        join_step = self._get_step_by_id(ticket_id, join_step_id)
+        if not join_step or join_step.step_type != StepType.JOIN_STEP:
+            return None, None
+        return join_step, self._find_step_definition(join_step_id, workflow_version)
     
     def _find_ticket_step(
         self,
@@ -782,7 +1131,8 @@ class WorkflowEngine:
                 step.step_id == workflow_version.definition.start_step_id
             )
             if not is_initial_form:
-                self.notification_service.enqueue_form_pending(
+                self._enqueue_notification_in_background(
+                    self.notification_service.enqueue_form_pending,
                     ticket_id=ticket.ticket_id,
                     requester_email=ticket.requester.email,
                     ticket_title=ticket.title,
@@ -873,8 +1223,7 @@ class WorkflowEngine:
                 ]
                 
                 # Auto-onboard all parallel approvers if not in system
-                from ..repositories.admin_repo import AdminRepository
-                admin_repo = AdminRepository()
+                admin_repo = self.admin_repo
                 
                 # Create approval tasks for all approvers
                 for approver in approvers_with_info:
@@ -912,8 +1261,9 @@ class WorkflowEngine:
                     self._create_approval_task(ticket, step, approver)
                     
                     # Notify each approver
-                    branch_name = getattr(step, 'branch_name', None) or (step.data.get("branch_name") if step.data else None)
-                    self.notification_service.enqueue_approval_pending(
+                    branch_name = step.branch_name or (step.data.get("branch_name") if step.data else None)
+                    self._enqueue_notification_in_background(
+                        self.notification_service.enqueue_approval_pending,
                         ticket_id=ticket.ticket_id,
                         approver_email=approver.email,
                         ticket_title=ticket.title,
@@ -932,8 +1282,7 @@ class WorkflowEngine:
                 updates["assigned_to"] = approver.model_dump(mode="json")
                 
                 # Auto-onboard approver if not in system
-                from ..repositories.admin_repo import AdminRepository
-                admin_repo = AdminRepository()
+                admin_repo = self.admin_repo
                 access, was_created, added_manager, added_agent = admin_repo.auto_onboard_user(
                     email=approver.email,
                     display_name=approver.display_name,
@@ -969,8 +1318,9 @@ class WorkflowEngine:
                 self._create_approval_task(ticket, step, approver)
                 
                 # Notify approver
-                branch_name = getattr(step, 'branch_name', None) or (step.data.get("branch_name") if step.data else None)
-                self.notification_service.enqueue_approval_pending(
+                branch_name = step.branch_name or (step.data.get("branch_name") if step.data else None)
+                self._enqueue_notification_in_background(
+                    self.notification_service.enqueue_approval_pending,
                     ticket_id=ticket.ticket_id,
                     approver_email=approver.email,
                     ticket_title=ticket.title,
@@ -1089,13 +1439,13 @@ class WorkflowEngine:
                 return  # Don't activate yet - wait for all branches
             
             # Auto-advance notification step
-            updates["state"] = StepState.COMPLETED.value
+            updates["state"] = _STEP_COMPLETED
             updates["completed_at"] = now
             is_notify_step = True
             
         elif step.step_type == StepType.FORK_STEP:
             # Fork step - activate all parallel branches
-            updates["state"] = StepState.COMPLETED.value
+            updates["state"] = _STEP_COMPLETED
             updates["completed_at"] = now
             
             # Handle fork activation after step update
@@ -1108,7 +1458,7 @@ class WorkflowEngine:
             
             # Check if all branches already completed (edge case)
             if self._check_join_completion(ticket, step, step_def, workflow_version):
-                updates["state"] = StepState.COMPLETED.value
+                updates["state"] = _STEP_COMPLETED
                 updates["completed_at"] = now
                 # Transition to next after join
                 self._transition_after_join(ticket, step, workflow_version, actor, correlation_id)
@@ -1291,7 +1641,7 @@ class WorkflowEngine:
         self.ticket_repo.update_step(
             step.ticket_step_id,
             {
-                "state": StepState.COMPLETED.value,
+                "state": _STEP_COMPLETED,
                 "outcome": outcome,
                 "completed_at": now
             },
@@ -1707,9 +2057,9 @@ class WorkflowEngine:
             return
         
         # Check if this fork is part of a sub-workflow
-        is_sub_workflow_fork = bool(getattr(fork_step, 'from_sub_workflow_id', None))
-        sub_workflow_id = getattr(fork_step, 'from_sub_workflow_id', None)
-        parent_branch_id = getattr(fork_step, 'branch_id', None)  # Parent workflow's branch context
+        is_sub_workflow_fork = bool(fork_step.from_sub_workflow_id)
+        sub_workflow_id = fork_step.from_sub_workflow_id
+        parent_branch_id = fork_step.branch_id  # Parent workflow's branch context
         
         logger.info(
             f"Activating fork: is_sub_workflow={is_sub_workflow_fork}, sub_wf_id={sub_workflow_id}, parent_branch={parent_branch_id}",
@@ -1720,7 +2070,7 @@ class WorkflowEngine:
         self.ticket_repo.update_step(
             fork_step.ticket_step_id,
             {
-                "state": StepState.COMPLETED.value,
+                "state": _STEP_COMPLETED,
                 "completed_at": now
             },
             expected_version=fork_step.version
@@ -1754,8 +2104,8 @@ class WorkflowEngine:
                 logger.warning(f"Branch start step {start_step_id} not found")
                 continue
             
-            # Update branch metadata on the step
-            self.ticket_repo.update_step(
+            # Update branch metadata on the step (returns the updated step)
+            branch_start_step = self.ticket_repo.update_step(
                 branch_start_step.ticket_step_id,
                 {
                     "branch_id": branch_id,
@@ -1766,9 +2116,6 @@ class WorkflowEngine:
                 expected_version=branch_start_step.version
             )
             
-            # Refresh step after update
-            branch_start_step = self.ticket_repo.get_step_or_raise(branch_start_step.ticket_step_id)
-            
             # Activate the branch start step
             # Refresh ticket for each branch activation
             ticket = self.ticket_repo.get_ticket_or_raise(ticket.ticket_id)
@@ -1791,24 +2138,19 @@ class WorkflowEngine:
             )
         
         # Update ticket with parallel execution state (with retry)
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                ticket = self.ticket_repo.get_ticket_or_raise(ticket.ticket_id)
-                self.ticket_repo.update_ticket(
-                    ticket.ticket_id,
-                    {
-                        "active_branches": [b.model_dump(mode="json") for b in active_branches],
-                        "current_step_ids": current_step_ids
-                    },
-                    expected_version=ticket.version
-                )
-                break
-            except ConcurrencyError:
-                if attempt == max_retries - 1:
-                    logger.error(f"Failed to update ticket with branches after {max_retries} attempts")
-                    raise
-                logger.warning(f"Concurrency conflict on fork state update, retrying (attempt {attempt + 1})")
+        def update_fork_state() -> Ticket:
+            current = self.ticket_repo.get_ticket_or_raise(ticket.ticket_id)
+            self.ticket_repo.update_ticket(
+                current.ticket_id,
+                {
+                    "active_branches": _BRANCHES_ADAPTER.dump_python(active_branches, mode="json"),
+                    "current_step_ids": current_step_ids
+                },
+                expected_version=current.version
+            )
+            return current
+        
+        ticket = _retry_optimistic(update_fork_state, "fork state update")
         
         # Audit fork activation
         self.audit_writer.write_event(
@@ -1854,7 +2196,7 @@ class WorkflowEngine:
             return True
         
         # Get all steps for this ticket
-        all_steps = self.ticket_repo.get_steps_for_ticket(ticket.ticket_id)
+        all_steps = self._get_steps_cached(ticket.ticket_id)
         
         # FIRST: Check active_branches state as primary source of truth
         # This is more reliable than checking individual step states
@@ -1878,7 +2220,7 @@ class WorkflowEngine:
             if branch_state.state == StepState.COMPLETED:
                 completed_branches += 1
                 logger.debug(f"Branch '{branch_state.branch_name}' completed (from active_branches)")
-            elif branch_state.state in [StepState.REJECTED, StepState.CANCELLED, StepState.SKIPPED]:
+            elif branch_state.state in _FAILED_STEP_STATES:
                 failed_branches += 1
                 logger.debug(f"Branch '{branch_state.branch_name}' failed/skipped (from active_branches)")
         
@@ -1897,32 +2239,32 @@ class WorkflowEngine:
                 last_step_id = self._get_last_step_in_branch(branch_def, workflow_version, join_step.step_id)
                 
                 if last_step_id:
-                    last_step = self._find_ticket_step(all_steps, last_step_id)
+                    last_step = self._get_step_by_id(ticket.ticket_id, last_step_id)
                     if last_step:
                         if last_step.state == StepState.COMPLETED:
                             completed_branches += 1
                             logger.debug(f"Branch '{branch_name}' completed (step {last_step_id})")
-                        elif last_step.state in [StepState.REJECTED, StepState.CANCELLED, StepState.SKIPPED]:
+                        elif last_step.state in _FAILED_STEP_STATES:
                             failed_branches += 1
                             logger.debug(f"Branch '{branch_name}' failed/skipped (step {last_step_id})")
                         else:
                             # Check if this is an approval step that was rejected/skipped via approval task
                             if last_step.step_type == StepType.APPROVAL_STEP:
                                 approval_tasks = self.ticket_repo.get_approval_tasks_for_step(last_step.ticket_step_id)
-                                if approval_tasks and all(task.decision in [ApprovalDecision.REJECTED, ApprovalDecision.SKIPPED] for task in approval_tasks):
+                                if approval_tasks and all(task.decision in _NEGATIVE_APPROVAL_DECISIONS for task in approval_tasks):
                                     failed_branches += 1
                                     logger.debug(f"Branch '{branch_name}' failed/skipped (approval step {last_step_id} has all tasks rejected/skipped)")
                             else:
                                 logger.debug(f"Branch '{branch_name}' still active (step {last_step_id} is {last_step.state})")
                 else:
                     # Fallback: check steps with branch_id
-                    branch_steps = [s for s in all_steps if getattr(s, 'branch_id', None) == branch_id]
+                    branch_steps = [s for s in all_steps if s.branch_id == branch_id]
                     if branch_steps:
                         # Find the most recently updated step
                         last_branch_step = max(branch_steps, key=lambda s: s.completed_at or s.started_at or datetime.min)
                         if last_branch_step.state == StepState.COMPLETED:
                             completed_branches += 1
-                        elif last_branch_step.state in [StepState.REJECTED, StepState.CANCELLED, StepState.SKIPPED]:
+                        elif last_branch_step.state in _FAILED_STEP_STATES:
                             failed_branches += 1
         
         # Check fork failure policy - if CONTINUE_OTHERS, only count non-failed branches
@@ -2039,6 +2381,11 @@ class WorkflowEngine:
         correlation_id: str
     ) -> None:
         """Handle transition after join step completes"""
+        # Already transitioned (or found completed) earlier in this request - the
+        # guards below would only re-read the ticket and step to find that out
+        if join_step.ticket_step_id in self._completed_joins:
+            return
+        
         # CRITICAL GUARD: Prevent duplicate transitions
         # If join_proceeded is already True, this transition already happened
         # Refresh ticket to get latest state
@@ -2053,6 +2400,7 @@ class WorkflowEngine:
         # Also check if join step is already completed
         join_step = self.ticket_repo.get_step_or_raise(join_step.ticket_step_id)
         if join_step.state == StepState.COMPLETED:
+            self._completed_joins.add(join_step.ticket_step_id)
             logger.debug(
                 f"Join step {join_step.step_id} already completed, skipping duplicate transition",
                 extra={"ticket_id": ticket.ticket_id, "join_step": join_step.step_id}
@@ -2083,44 +2431,33 @@ class WorkflowEngine:
         self.ticket_repo.update_step(
             join_step.ticket_step_id,
             {
-                "state": StepState.COMPLETED.value,
+                "state": _STEP_COMPLETED,
                 "completed_at": now
             },
             expected_version=join_step.version
         )
+        self._completed_joins.add(join_step.ticket_step_id)
         
         # Update ticket based on join mode
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                ticket = self.ticket_repo.get_ticket_or_raise(ticket.ticket_id)
-                
-                if is_any_majority:
-                    # ANY/MAJORITY: Keep active_branches for tracking, set join_proceeded flag
-                    self.ticket_repo.update_ticket(
-                        ticket.ticket_id,
-                        {
-                            "join_proceeded": True,
-                            "current_step_ids": []  # Clear current step IDs but keep branch tracking
-                        },
-                        expected_version=ticket.version
-                    )
-                else:
-                    # ALL mode: Clear everything
-                    self.ticket_repo.update_ticket(
-                        ticket.ticket_id,
-                        {
-                            "active_branches": [],
-                            "current_step_ids": []
-                        },
-                        expected_version=ticket.version
-                    )
-                break
-            except ConcurrencyError:
-                if attempt == max_retries - 1:
-                    logger.error(f"Failed to update ticket after join after {max_retries} attempts")
-                    raise
-                logger.warning(f"Concurrency conflict on join cleanup, retrying (attempt {attempt + 1})")
+        if is_any_majority:
+            # ANY/MAJORITY: Keep active_branches for tracking, set join_proceeded flag
+            join_updates = {
+                "join_proceeded": True,
+                "current_step_ids": []  # Clear current step IDs but keep branch tracking
+            }
+        else:
+            # ALL mode: Clear everything
+            join_updates = {
+                "active_branches": [],
+                "current_step_ids": []
+            }
+        
+        def update_after_join() -> Ticket:
+            current = self.ticket_repo.get_ticket_or_raise(ticket.ticket_id)
+            self.ticket_repo.update_ticket(current.ticket_id, dict(join_updates), expected_version=current.version)
+            return current
+        
+        ticket = _retry_optimistic(update_after_join, "join cleanup")
         
         # Audit join completion
         self.audit_writer.write_event(
@@ -2148,15 +2485,8 @@ class WorkflowEngine:
         if not active_branches:
             return False
         
-        terminal_states = {
-            StepState.COMPLETED,
-            StepState.REJECTED,
-            StepState.CANCELLED,
-            StepState.SKIPPED
-        }
-        
         for branch in active_branches:
-            if branch.state not in terminal_states:
+            if branch.state not in _TERMINAL_STEP_STATES:
                 logger.debug(
                     f"Branch {branch.branch_id} ({branch.branch_name}) still pending in state {branch.state}",
                     extra={"ticket_id": ticket.ticket_id}
@@ -2322,7 +2652,7 @@ class WorkflowEngine:
         Args:
             event: The actual transition event (e.g., SUBMIT_FORM for form steps, APPROVE for approvals)
         """
-        branch_id = getattr(completed_step, 'branch_id', None)
+        branch_id = completed_step.branch_id
         logger.info(
             f"_handle_branch_step_completion: step={completed_step.step_id}, branch_id={branch_id}, event={event}",
             extra={"ticket_id": ticket.ticket_id}
@@ -2351,25 +2681,22 @@ class WorkflowEngine:
                 extra={"ticket_id": ticket.ticket_id, "completed_step": completed_step.step_id}
             )
             # Mark branch as completed
-            self._mark_branch_completed(ticket, completed_step, actor, correlation_id, workflow_version)
+            fresh_ticket = self._mark_branch_completed(ticket, completed_step, actor, correlation_id, workflow_version)
             
             # Find the join step for this fork
-            parent_fork_id = getattr(completed_step, 'parent_fork_step_id', None)
-            if parent_fork_id:
-                all_steps = self.ticket_repo.get_steps_for_ticket(ticket.ticket_id)
-                for step in all_steps:
-                    if step.step_type == StepType.JOIN_STEP:
-                        join_step_def = self._find_step_definition(step.step_id, workflow_version)
-                        if join_step_def and join_step_def.get("source_fork_step_id") == parent_fork_id:
-                            # Check if join can proceed
-                            ticket = self.ticket_repo.get_ticket_or_raise(ticket.ticket_id)
-                            if self._check_join_completion(ticket, step, join_step_def, workflow_version):
-                                logger.info(
-                                    f"Join step {step.step_id} can proceed after branch {branch_id} completion (no next step)",
-                                    extra={"ticket_id": ticket.ticket_id, "join_step": step.step_id, "branch_id": branch_id}
-                                )
-                                self._transition_after_join(ticket, step, workflow_version, actor, correlation_id)
-                            break
+            parent_fork_id = completed_step.parent_fork_step_id
+            join_step, join_step_def = self._find_join_for_fork(
+                ticket.ticket_id, parent_fork_id, workflow_version
+            )
+            if join_step and join_step_def:
+                # Check if join can proceed
+                ticket = fresh_ticket or self.ticket_repo.get_ticket_or_raise(ticket.ticket_id)
+                if self._check_join_completion(ticket, join_step, join_step_def, workflow_version):
+                    logger.info(
+                        f"Join step {join_step.step_id} can proceed after branch {branch_id} completion (no next step)",
+                        extra={"ticket_id": ticket.ticket_id, "join_step": join_step.step_id, "branch_id": branch_id}
+                    )
+                    self._transition_after_join(ticket, join_step, workflow_version, actor, correlation_id)
             return True  # Branch handled, even if no join triggered
         
         # Check if next step is a join step
@@ -2378,14 +2705,13 @@ class WorkflowEngine:
             return False
         
         # Mark branch as completed (this updates active_branches and audits)
-        self._mark_branch_completed(ticket, completed_step, actor, correlation_id, workflow_version)
+        fresh_ticket = self._mark_branch_completed(ticket, completed_step, actor, correlation_id, workflow_version)
         
         # Check if join can proceed (after branch state is updated)
-        all_steps = self.ticket_repo.get_steps_for_ticket(ticket.ticket_id)
-        join_step = self._find_ticket_step(all_steps, next_step_id)
+        join_step = self._get_step_by_id(ticket.ticket_id, next_step_id)
         
         if join_step:
-            ticket = self.ticket_repo.get_ticket_or_raise(ticket.ticket_id)
+            ticket = fresh_ticket or self.ticket_repo.get_ticket_or_raise(ticket.ticket_id)
             if self._check_join_completion(ticket, join_step, next_step_def, workflow_version):
                 logger.info(
                     f"Join step {join_step.step_id} can proceed after branch {branch_id} completion",
@@ -2446,9 +2772,8 @@ class WorkflowEngine:
             parent_fork_step_id=parent_fork_step_id
         )
         
-        # Save all sub-workflow steps
-        for sub_step in sub_steps:
-            self.ticket_repo.create_step(sub_step)
+        # Save all sub-workflow steps in one insert
+        self.ticket_repo.create_steps_bulk(sub_steps)
         
         # Mark the SUB_WORKFLOW_STEP as ACTIVE
         self.ticket_repo.update_step(
@@ -2555,7 +2880,7 @@ class WorkflowEngine:
             return False
         
         # Idempotency check - if parent step already completed, don't process again
-        if parent_step.state in [StepState.COMPLETED, StepState.REJECTED, StepState.CANCELLED, StepState.SKIPPED]:
+        if parent_step.state in _TERMINAL_STEP_STATES:
             logger.info(
                 f"Parent sub-workflow step already in terminal state: {parent_step.state}",
                 extra={"ticket_id": ticket.ticket_id, "parent_step_id": parent_step.ticket_step_id}
@@ -2579,7 +2904,7 @@ class WorkflowEngine:
             self.ticket_repo.update_step(
                 parent_step.ticket_step_id,
                 {
-                    "state": StepState.COMPLETED.value,
+                    "state": _STEP_COMPLETED,
                     "completed_at": now,
                     "outcome": "COMPLETED"
                 },
@@ -2630,7 +2955,7 @@ class WorkflowEngine:
             self.ticket_repo.update_step(
                 parent_step.ticket_step_id,
                 {
-                    "state": StepState.REJECTED.value,
+                    "state": _STEP_REJECTED,
                     "completed_at": now,
                     "outcome": "REJECTED"
                 },
@@ -2735,20 +3060,18 @@ class WorkflowEngine:
             self._mark_branch_failed(ticket, rejected_step, actor, correlation_id)
             
             # Check if JOIN can proceed after branch rejection (for ANY/MAJORITY mode)
-            parent_fork_step_id = getattr(rejected_step, 'parent_fork_step_id', None)
-            if parent_fork_step_id:
+            parent_fork_step_id = rejected_step.parent_fork_step_id
+            join_step, join_step_def = self._find_join_for_fork(
+                ticket.ticket_id, parent_fork_step_id, workflow_version
+            )
+            if join_step and join_step_def:
                 ticket = self.ticket_repo.get_ticket_or_raise(ticket.ticket_id)
-                for join_step in all_steps:
-                    if join_step.step_type == StepType.JOIN_STEP:
-                        join_step_def = self._find_step_definition(join_step.step_id, workflow_version)
-                        if join_step_def and join_step_def.get("source_fork_step_id") == parent_fork_step_id:
-                            if self._check_join_completion(ticket, join_step, join_step_def, workflow_version):
-                                # Only transition if join step is NOT_STARTED or ACTIVE
-                                if join_step.state == StepState.NOT_STARTED:
-                                    self._activate_step(ticket, join_step, workflow_version, actor, correlation_id)
-                                elif join_step.state == StepState.ACTIVE:
-                                    self._transition_after_join(ticket, join_step, workflow_version, actor, correlation_id)
-                            break
+                if self._check_join_completion(ticket, join_step, join_step_def, workflow_version):
+                    # Only transition if join step is NOT_STARTED or ACTIVE
+                    if join_step.state == StepState.NOT_STARTED:
+                        self._activate_step(ticket, join_step, workflow_version, actor, correlation_id)
+                    elif join_step.state == StepState.ACTIVE:
+                        self._transition_after_join(ticket, join_step, workflow_version, actor, correlation_id)
             
             # After rejecting branch, check if there's a pending NOTIFY to activate
             # (JOIN may have already proceeded with ANY/MAJORITY mode)
@@ -2771,10 +3094,9 @@ class WorkflowEngine:
         
         # Cancel all remaining non-terminal steps (orphan tasks/approvals in branches)
         all_steps = self.ticket_repo.get_steps_for_ticket(ticket.ticket_id)
-        cancellable_states = {StepState.NOT_STARTED, StepState.ACTIVE, StepState.WAITING_FOR_APPROVAL}
         
         for remaining_step in all_steps:
-            if remaining_step.state in cancellable_states:
+            if remaining_step.state in _CANCELLABLE_STEP_STATES:
                 new_state = StepState.CANCELLED
                 try:
                     self.ticket_repo.update_step(
@@ -2822,6 +3144,7 @@ class WorkflowEngine:
     # Action Handlers
     # =========================================================================
     
+    @_flush_audit_after
     def handle_submit_form(
         self,
         ticket_id: str,
@@ -2872,25 +3195,20 @@ class WorkflowEngine:
         now = utc_now()
         
         # Update step with retry for concurrency
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                step = self.ticket_repo.get_step_or_raise(ticket_step_id)
-                self.ticket_repo.update_step(
-                    ticket_step_id,
-                    {
-                        "state": StepState.COMPLETED.value,
-                        "completed_at": now,
-                        "data.form_values": form_values
-                    },
-                    expected_version=step.version
-                )
-                break
-            except ConcurrencyError:
-                if attempt == max_retries - 1:
-                    logger.error(f"Failed to update step after {max_retries} attempts")
-                    raise
-                logger.warning(f"Concurrency conflict on step update, retrying (attempt {attempt + 1})")
+        def complete_form_step() -> TicketStep:
+            current = self.ticket_repo.get_step_or_raise(ticket_step_id)
+            self.ticket_repo.update_step(
+                ticket_step_id,
+                {
+                    "state": _STEP_COMPLETED,
+                    "completed_at": now,
+                    "data.form_values": form_values
+                },
+                expected_version=current.version
+            )
+            return current
+        
+        step = _retry_optimistic(complete_form_step, "step update")
         
         # Collect all attachment IDs from form values (FILE type fields store them as arrays)
         all_attachment_ids = list(attachment_ids) if attachment_ids else []
@@ -2904,29 +3222,25 @@ class WorkflowEngine:
                 all_attachment_ids.append(value)
         
         # Update ticket form values and attachment_ids with retry for concurrency
-        for attempt in range(max_retries):
-            try:
-                ticket = self.ticket_repo.get_ticket_or_raise(ticket_id)
-                # Merge new attachment IDs with existing ones
-                updated_attachment_ids = list(ticket.attachment_ids or [])
-                for att_id in all_attachment_ids:
-                    if att_id not in updated_attachment_ids:
-                        updated_attachment_ids.append(att_id)
-                
-                self.ticket_repo.update_ticket(
-                    ticket_id,
-                    {
-                        "form_values": {**ticket.form_values, **form_values},
-                        "attachment_ids": updated_attachment_ids
-                    },
-                    expected_version=ticket.version
-                )
-                break
-            except ConcurrencyError:
-                if attempt == max_retries - 1:
-                    logger.error(f"Failed to update ticket after {max_retries} attempts")
-                    raise
-                logger.warning(f"Concurrency conflict on ticket update, retrying (attempt {attempt + 1})")
+        def merge_form_values() -> Ticket:
+            current = self.ticket_repo.get_ticket_or_raise(ticket_id)
+            # Merge new attachment IDs with existing ones
+            updated_attachment_ids = list(current.attachment_ids or [])
+            for att_id in all_attachment_ids:
+                if att_id not in updated_attachment_ids:
+                    updated_attachment_ids.append(att_id)
+            
+            self.ticket_repo.update_ticket(
+                ticket_id,
+                {
+                    "form_values": {**current.form_values, **form_values},
+                    "attachment_ids": updated_attachment_ids
+                },
+                expected_version=current.version
+            )
+            return current
+        
+        ticket = _retry_optimistic(merge_form_values, "ticket update")
         
         # Link any new attachments to this ticket (move from temp to ticket folder)
         if all_attachment_ids:
@@ -2953,6 +3267,7 @@ class WorkflowEngine:
         
         return self._build_action_response(ticket_id, actor)
     
+    @_flush_audit_after
     def handle_approve(
         self,
         ticket_id: str,
@@ -3077,7 +3392,7 @@ class WorkflowEngine:
             }
             
             if should_complete_step:
-                step_updates["state"] = StepState.COMPLETED.value
+                step_updates["state"] = _STEP_COMPLETED
                 step_updates["outcome"] = "APPROVED"
                 step_updates["completed_at"] = now
             
@@ -3092,7 +3407,7 @@ class WorkflowEngine:
             self.ticket_repo.update_step(
                 ticket_step_id,
                 {
-                    "state": StepState.COMPLETED.value,
+                    "state": _STEP_COMPLETED,
                     "outcome": "APPROVED",
                     "completed_at": now
                 },
@@ -3132,6 +3447,7 @@ class WorkflowEngine:
         
         return self._build_action_response(ticket_id, actor)
     
+    @_flush_audit_after
     def handle_reject(
         self,
         ticket_id: str,
@@ -3187,7 +3503,7 @@ class WorkflowEngine:
         self.ticket_repo.update_step(
             ticket_step_id,
             {
-                "state": StepState.REJECTED.value,
+                "state": _STEP_REJECTED,
                 "outcome": "REJECTED",
                 "completed_at": now
             },
@@ -3195,9 +3511,9 @@ class WorkflowEngine:
         )
         
         # Check if this step is part of a branch
-        branch_id = getattr(step, 'branch_id', None)
-        branch_name = getattr(step, 'branch_name', None)
-        parent_fork_step_id = getattr(step, 'parent_fork_step_id', None)
+        branch_id = step.branch_id
+        branch_name = step.branch_name
+        parent_fork_step_id = step.parent_fork_step_id
         
         if branch_id and parent_fork_step_id:
             # This is a branch step - check fork failure policy
@@ -3226,7 +3542,7 @@ class WorkflowEngine:
                     all_steps = self.ticket_repo.get_steps_for_ticket(ticket_id)
                     
                     # First, find steps by branch_id
-                    branch_steps = [s for s in all_steps if getattr(s, 'branch_id', None) == branch_id]
+                    branch_steps = [s for s in all_steps if s.branch_id == branch_id]
                     
                     # Also find steps that SHOULD be in this branch by tracing from the branch start_step_id
                     # This handles cases where steps weren't assigned branch_id during creation
@@ -3270,7 +3586,7 @@ class WorkflowEngine:
                                     if step.step_id in branch_step_ids and step.step_id not in [s.step_id for s in branch_steps]:
                                         branch_steps.append(step)
                                         # Also update the step to have the correct branch_id
-                                        if not getattr(step, 'branch_id', None):
+                                        if not step.branch_id:
                                             self.ticket_repo.update_step(
                                                 step.ticket_step_id,
                                                 {
@@ -3282,17 +3598,16 @@ class WorkflowEngine:
                                             )
                     
                     # Cancel all non-terminal steps in the rejected branch
-                    cancellable_states = {StepState.NOT_STARTED, StepState.ACTIVE, StepState.WAITING_FOR_APPROVAL}
                     for branch_step in branch_steps:
-                        if branch_step.state in cancellable_states:
+                        if branch_step.state in _CANCELLABLE_STEP_STATES:
                             try:
                                 # Re-fetch step to get latest version
                                 step_latest = self.ticket_repo.get_step(branch_step.ticket_step_id)
-                                if step_latest and step_latest.state in cancellable_states:
+                                if step_latest and step_latest.state in _CANCELLABLE_STEP_STATES:
                                     self.ticket_repo.update_step(
                                         branch_step.ticket_step_id,
                                         {
-                                            "state": StepState.CANCELLED.value,
+                                            "state": _STEP_CANCELLED,
                                             "outcome": "CANCELLED",
                                             "completed_at": now,
                                             # Ensure branch_id is set even if it wasn't before
@@ -3312,20 +3627,20 @@ class WorkflowEngine:
                     # Check if join can proceed (other branches may have completed)
                     # CRITICAL: Refresh ticket to get updated active_branches after _mark_branch_failed
                     ticket = self.ticket_repo.get_ticket_or_raise(ticket_id)
-                    join_steps = [s for s in all_steps if s.step_type == StepType.JOIN_STEP]
+                    join_step, join_step_def = self._find_join_for_fork(
+                        ticket_id, parent_fork_step_id, workflow_version
+                    )
                     
-                    for join_step in join_steps:
-                        join_step_def = self._find_step_definition(join_step.step_id, workflow_version)
-                        if join_step_def and join_step_def.get("source_fork_step_id") == parent_fork_step_id:
-                            # Check if join can proceed
-                            if self._check_join_completion(ticket, join_step, join_step_def, workflow_version):
-                                # Only transition if join step is NOT_STARTED or ACTIVE (not if already COMPLETED)
-                                if join_step.state == StepState.NOT_STARTED:
-                                    self._activate_step(ticket, join_step, workflow_version, actor, correlation_id)
-                                elif join_step.state == StepState.ACTIVE:
-                                    self._transition_after_join(ticket, join_step, workflow_version, actor, correlation_id)
-                                # If COMPLETED, already transitioned - nothing to do
-                            break
+                    # Check if join can proceed
+                    if join_step and join_step_def and self._check_join_completion(
+                        ticket, join_step, join_step_def, workflow_version
+                    ):
+                        # Only transition if join step is NOT_STARTED or ACTIVE (not if already COMPLETED)
+                        if join_step.state == StepState.NOT_STARTED:
+                            self._activate_step(ticket, join_step, workflow_version, actor, correlation_id)
+                        elif join_step.state == StepState.ACTIVE:
+                            self._transition_after_join(ticket, join_step, workflow_version, actor, correlation_id)
+                        # If COMPLETED, already transitioned - nothing to do
                     
                     # After rejecting branch, check if there's a pending NOTIFY to activate
                     # (JOIN may have already proceeded with ANY/MAJORITY mode)
@@ -3341,7 +3656,7 @@ class WorkflowEngine:
                         actor=actor,
                         details={
                             "branch_id": branch_id,
-                            "branch_name": getattr(step, 'branch_name', ''),
+                            "branch_name": step.branch_name,
                             "comment": comment
                         },
                         correlation_id=correlation_id
@@ -3379,12 +3694,12 @@ class WorkflowEngine:
                     # Cancel any remaining NOT_STARTED steps in the failed branch too
                     all_steps = self.ticket_repo.get_steps_for_ticket(ticket_id)
                     for branch_step in all_steps:
-                        if getattr(branch_step, 'branch_id', None) == branch_id and branch_step.state == StepState.NOT_STARTED:
+                        if branch_step.branch_id == branch_id and branch_step.state == StepState.NOT_STARTED:
                             try:
                                 self.ticket_repo.update_step(
                                     branch_step.ticket_step_id,
                                     {
-                                        "state": StepState.CANCELLED.value,
+                                        "state": _STEP_CANCELLED,
                                         "outcome": "CANCELLED",
                                         "completed_at": now
                                     },
@@ -3416,11 +3731,10 @@ class WorkflowEngine:
         # - WAITING_FOR_APPROVAL steps → CANCELLED (orphan approvals in branches)
         # But NOTIFY steps should be TRIGGERED, not cancelled
         all_steps = self.ticket_repo.get_steps_for_ticket(ticket_id)
-        cancellable_states = {StepState.NOT_STARTED, StepState.ACTIVE, StepState.WAITING_FOR_APPROVAL}
         notify_steps_to_trigger = []  # Collect ALL notify steps to trigger
         
         for remaining_step in all_steps:
-            if remaining_step.state in cancellable_states:
+            if remaining_step.state in _CANCELLABLE_STEP_STATES:
                 # Check if this is a NOTIFY step - we'll trigger it instead of cancelling
                 if remaining_step.step_type == StepType.NOTIFY_STEP:
                     notify_steps_to_trigger.append(remaining_step)
@@ -3429,11 +3743,11 @@ class WorkflowEngine:
                 try:
                     # Re-fetch step to get latest version
                     step_latest = self.ticket_repo.get_step(remaining_step.ticket_step_id)
-                    if step_latest and step_latest.state in cancellable_states:
+                    if step_latest and step_latest.state in _CANCELLABLE_STEP_STATES:
                         self.ticket_repo.update_step(
                             remaining_step.ticket_step_id,
                             {
-                                "state": StepState.CANCELLED.value,
+                                "state": _STEP_CANCELLED,
                                 "outcome": "CANCELLED",
                                 "completed_at": now
                             },
@@ -3455,7 +3769,7 @@ class WorkflowEngine:
             try:
                 # Re-fetch to get latest version
                 notify_latest = self.ticket_repo.get_step(notify_step.ticket_step_id)
-                if notify_latest and notify_latest.state in cancellable_states:
+                if notify_latest and notify_latest.state in _CANCELLABLE_STEP_STATES:
                     # Determine correct workflow version based on whether this is a sub-workflow step
                     if notify_latest.from_sub_workflow_id:
                         step_workflow_version = self._get_sub_workflow_version_for_step(notify_latest)
@@ -3525,6 +3839,7 @@ class WorkflowEngine:
         
         return self._build_action_response(ticket_id, actor)
     
+    @_flush_audit_after
     def handle_skip(
         self,
         ticket_id: str,
@@ -3582,9 +3897,9 @@ class WorkflowEngine:
         )
         
         # Check if this step is part of a branch
-        branch_id = getattr(step, 'branch_id', None)
-        branch_name = getattr(step, 'branch_name', None)
-        parent_fork_step_id = getattr(step, 'parent_fork_step_id', None)
+        branch_id = step.branch_id
+        branch_name = step.branch_name
+        parent_fork_step_id = step.parent_fork_step_id
         
         if branch_id and parent_fork_step_id:
             # This is a branch step - check fork failure policy
@@ -3614,7 +3929,7 @@ class WorkflowEngine:
                     all_steps = self.ticket_repo.get_steps_for_ticket(ticket_id)
                     
                     # Find steps by branch_id
-                    branch_steps = [s for s in all_steps if getattr(s, 'branch_id', None) == branch_id]
+                    branch_steps = [s for s in all_steps if s.branch_id == branch_id]
                     
                     # Also find steps that SHOULD be in this branch by tracing
                     fork_step_def = self._find_step_definition(parent_fork_step_id, workflow_version)
@@ -3654,17 +3969,16 @@ class WorkflowEngine:
                                         branch_steps.append(step)
                     
                     # Cancel all non-terminal steps in the skipped branch
-                    cancellable_states = {StepState.NOT_STARTED, StepState.ACTIVE, StepState.WAITING_FOR_APPROVAL}
                     for branch_step in branch_steps:
-                        if branch_step.state in cancellable_states:
+                        if branch_step.state in _CANCELLABLE_STEP_STATES:
                             try:
                                 # Re-fetch step to get latest version
                                 step_latest = self.ticket_repo.get_step(branch_step.ticket_step_id)
-                                if step_latest and step_latest.state in cancellable_states:
+                                if step_latest and step_latest.state in _CANCELLABLE_STEP_STATES:
                                     self.ticket_repo.update_step(
                                         branch_step.ticket_step_id,
                                         {
-                                            "state": StepState.CANCELLED.value,
+                                            "state": _STEP_CANCELLED,
                                             "outcome": "CANCELLED",
                                             "completed_at": now,
                                             "branch_id": branch_id,
@@ -3691,7 +4005,7 @@ class WorkflowEngine:
                         actor=actor,
                         details={
                             "branch_id": branch_id,
-                            "branch_name": getattr(step, 'branch_name', ''),
+                            "branch_name": step.branch_name,
                             "comment": comment
                         },
                         correlation_id=correlation_id
@@ -3728,7 +4042,7 @@ class WorkflowEngine:
                     # Cancel any remaining NOT_STARTED steps in the skipped branch too
                     all_steps = self.ticket_repo.get_steps_for_ticket(ticket_id)
                     for branch_step in all_steps:
-                        if getattr(branch_step, 'branch_id', None) == branch_id and branch_step.state == StepState.NOT_STARTED:
+                        if branch_step.branch_id == branch_id and branch_step.state == StepState.NOT_STARTED:
                             try:
                                 self.ticket_repo.update_step(
                                     branch_step.ticket_step_id,
@@ -3763,11 +4077,10 @@ class WorkflowEngine:
         # for consistency - they're orphans, not deliberately skipped
         # But NOTIFY steps should be TRIGGERED, not cancelled
         all_steps = self.ticket_repo.get_steps_for_ticket(ticket_id)
-        cancellable_states = {StepState.NOT_STARTED, StepState.ACTIVE, StepState.WAITING_FOR_APPROVAL}
         notify_steps_to_trigger = []  # Collect ALL notify steps to trigger
         
         for remaining_step in all_steps:
-            if remaining_step.state in cancellable_states:
+            if remaining_step.state in _CANCELLABLE_STEP_STATES:
                 # Check if this is a NOTIFY step - we'll trigger it instead of cancelling
                 if remaining_step.step_type == StepType.NOTIFY_STEP:
                     notify_steps_to_trigger.append(remaining_step)
@@ -3776,11 +4089,11 @@ class WorkflowEngine:
                 try:
                     # Re-fetch step to get latest version
                     step_latest = self.ticket_repo.get_step(remaining_step.ticket_step_id)
-                    if step_latest and step_latest.state in cancellable_states:
+                    if step_latest and step_latest.state in _CANCELLABLE_STEP_STATES:
                         self.ticket_repo.update_step(
                             remaining_step.ticket_step_id,
                             {
-                                "state": StepState.CANCELLED.value,
+                                "state": _STEP_CANCELLED,
                                 "outcome": "CANCELLED",
                                 "completed_at": now
                             },
@@ -3802,7 +4115,7 @@ class WorkflowEngine:
             try:
                 # Re-fetch to get latest version
                 notify_latest = self.ticket_repo.get_step(notify_step.ticket_step_id)
-                if notify_latest and notify_latest.state in cancellable_states:
+                if notify_latest and notify_latest.state in _CANCELLABLE_STEP_STATES:
                     # Determine correct workflow version based on whether this is a sub-workflow step
                     if notify_latest.from_sub_workflow_id:
                         step_workflow_version = self._get_sub_workflow_version_for_step(notify_latest)
@@ -3881,60 +4194,41 @@ class WorkflowEngine:
         workflow_version: Optional[WorkflowVersion] = None
     ) -> None:
         """Mark a branch as skipped in the ticket's active_branches and check if JOIN can proceed"""
-        branch_id = getattr(step, 'branch_id', None)
-        branch_name = getattr(step, 'branch_name', None)
-        parent_fork_step_id = getattr(step, 'parent_fork_step_id', None)
+        branch_id = step.branch_id
+        branch_name = step.branch_name
+        parent_fork_step_id = step.parent_fork_step_id
         
         if not branch_id:
             return
         
         now = utc_now()
         
-        # Update branch state with retry for concurrency (consistent with _mark_branch_failed)
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                ticket = self.ticket_repo.get_ticket_or_raise(ticket.ticket_id)
-                active_branches = ticket.active_branches or []
-                
-                for i, branch in enumerate(active_branches):
-                    if branch.branch_id == branch_id:
-                        active_branches[i] = BranchState(
-                            branch_id=branch.branch_id,
-                            branch_name=branch.branch_name,
-                            parent_fork_step_id=branch.parent_fork_step_id,
-                            state=StepState.SKIPPED,
-                            current_step_id=step.step_id,
-                            started_at=branch.started_at,
-                            completed_at=now,
-                            outcome="SKIPPED"
-                        )
-                        break
-                
-                self.ticket_repo.update_ticket(
-                    ticket.ticket_id,
-                    {"active_branches": [b.model_dump(mode="json") for b in active_branches]},
-                    expected_version=ticket.version
-                )
-                
-                logger.info(
-                    f"Marked branch {branch_id} as skipped",
-                    extra={"ticket_id": ticket.ticket_id, "branch_id": branch_id, "branch_name": branch_name}
-                )
-                break
-                
-            except Exception as e:
-                if attempt < max_retries - 1:
-                    logger.warning(
-                        f"Retry {attempt + 1}/{max_retries} marking branch skipped due to: {e}",
-                        extra={"ticket_id": ticket.ticket_id, "branch_id": branch_id}
-                    )
-                else:
-                    logger.error(
-                        f"Failed to mark branch skipped after {max_retries} attempts: {e}",
-                        extra={"ticket_id": ticket.ticket_id, "branch_id": branch_id}
-                    )
-                    raise
+        # Update branch state with retry for concurrency
+        def mark_skipped() -> Ticket:
+            current = self.ticket_repo.get_ticket_or_raise(ticket.ticket_id)
+            active_branches = list(current.active_branches or [])
+            index, branch = current.active_branches_by_id.get(branch_id, (None, None))
+            
+            if branch is not None:
+                active_branches[index] = branch.model_copy(update={
+                    "state": StepState.SKIPPED,
+                    "current_step_id": step.step_id,
+                    "completed_at": now,
+                    "outcome": "SKIPPED"
+                })
+            
+            self.ticket_repo.update_ticket(
+                current.ticket_id,
+                {"active_branches": _BRANCHES_ADAPTER.dump_python(active_branches, mode="json")},
+                expected_version=current.version
+            )
+            return current
+        
+        ticket = _retry_optimistic(mark_skipped, "branch skip update")
+        logger.info(
+            f"Marked branch {branch_id} as skipped",
+            extra={"ticket_id": ticket.ticket_id, "branch_id": branch_id, "branch_name": branch_name}
+        )
         
         # Audit
         self.audit_writer.write_event(
@@ -3953,38 +4247,36 @@ class WorkflowEngine:
         # After marking branch as skipped, check if JOIN can proceed
         # This handles ANY/MAJORITY join modes where skipped branches count as terminal
         if workflow_version and parent_fork_step_id:
-            all_steps = self.ticket_repo.get_steps_for_ticket(ticket.ticket_id)
-            for join_step in all_steps:
-                if join_step.step_type == StepType.JOIN_STEP:
-                    join_step_def = self._find_step_definition(join_step.step_id, workflow_version)
-                    if join_step_def and join_step_def.get("source_fork_step_id") == parent_fork_step_id:
-                        # Refresh ticket to get latest branch states
-                        ticket = self.ticket_repo.get_ticket_or_raise(ticket.ticket_id)
-                        
-                        # Check if join can proceed
-                        if self._check_join_completion(ticket, join_step, join_step_def, workflow_version):
-                            logger.info(
-                                f"Join step {join_step.step_id} can proceed after branch {branch_id} skipped",
-                                extra={"ticket_id": ticket.ticket_id, "join_step": join_step.step_id, "branch_id": branch_id}
-                            )
-                            
-                            # If join step is NOT_STARTED, activate it first
-                            if join_step.state == StepState.NOT_STARTED:
-                                logger.info(
-                                    f"Activating join step {join_step.step_id} as it can proceed",
-                                    extra={"ticket_id": ticket.ticket_id, "join_step": join_step.step_id}
-                                )
-                                self._activate_step(ticket, join_step, workflow_version, actor, correlation_id)
-                            elif join_step.state == StepState.ACTIVE:
-                                # Join step is active, proceed with transition
-                                self._transition_after_join(ticket, join_step, workflow_version, actor, correlation_id)
-                            # If COMPLETED, already transitioned - nothing to do
-                        else:
-                            logger.debug(
-                                f"Join step {join_step.step_id} cannot proceed yet - waiting for more branches",
-                                extra={"ticket_id": ticket.ticket_id, "join_step": join_step.step_id, "branch_id": branch_id}
-                            )
-                        break
+            join_step, join_step_def = self._find_join_for_fork(
+                ticket.ticket_id, parent_fork_step_id, workflow_version
+            )
+            if join_step and join_step_def:
+                # Refresh ticket to get latest branch states
+                ticket = self.ticket_repo.get_ticket_or_raise(ticket.ticket_id)
+                
+                # Check if join can proceed
+                if self._check_join_completion(ticket, join_step, join_step_def, workflow_version):
+                    logger.info(
+                        f"Join step {join_step.step_id} can proceed after branch {branch_id} skipped",
+                        extra={"ticket_id": ticket.ticket_id, "join_step": join_step.step_id, "branch_id": branch_id}
+                    )
+                    
+                    # If join step is NOT_STARTED, activate it first
+                    if join_step.state == StepState.NOT_STARTED:
+                        logger.info(
+                            f"Activating join step {join_step.step_id} as it can proceed",
+                            extra={"ticket_id": ticket.ticket_id, "join_step": join_step.step_id}
+                        )
+                        self._activate_step(ticket, join_step, workflow_version, actor, correlation_id)
+                    elif join_step.state == StepState.ACTIVE:
+                        # Join step is active, proceed with transition
+                        self._transition_after_join(ticket, join_step, workflow_version, actor, correlation_id)
+                    # If COMPLETED, already transitioned - nothing to do
+                else:
+                    logger.debug(
+                        f"Join step {join_step.step_id} cannot proceed yet - waiting for more branches",
+                        extra={"ticket_id": ticket.ticket_id, "join_step": join_step.step_id, "branch_id": branch_id}
+                    )
         
         # Also check for pending NOTIFY to activate (for ANY/MAJORITY where JOIN already proceeded)
         if workflow_version:
@@ -3992,6 +4284,7 @@ class WorkflowEngine:
             if ticket.pending_end_step_id:
                 self._try_activate_pending_notify(ticket, workflow_version, actor, correlation_id)
     
+    @_flush_audit_after
     def handle_reassign_approval(
         self,
         ticket_id: str,
@@ -4011,7 +4304,6 @@ class WorkflowEngine:
         - Auto-onboards new approver if not in system (Reassign Agent)
         - Sends notification to new approver
         """
-        from ..repositories.admin_repo import AdminRepository
         
         ticket = self.ticket_repo.get_ticket_or_raise(ticket_id)
         step = self.ticket_repo.get_step_or_raise(ticket_step_id)
@@ -4032,8 +4324,7 @@ class WorkflowEngine:
             raise InvalidStateError("Cannot reassign approval to yourself")
         
         now = utc_now()
-        from ..domain.enums import OnboardSource
-        admin_repo = AdminRepository()
+        admin_repo = self.admin_repo
         
         # Auto-onboard new approver if not in system
         display_name = new_approver_display_name or new_approver_email.split("@")[0].replace(".", " ").title()
@@ -4193,6 +4484,7 @@ class WorkflowEngine:
         
         return self._build_action_response(ticket_id, actor)
     
+    @_flush_audit_after
     def handle_complete_task(
         self,
         ticket_id: str,
@@ -4275,7 +4567,7 @@ class WorkflowEngine:
         self.ticket_repo.update_step(
             ticket_step_id,
             {
-                "state": StepState.COMPLETED.value,
+                "state": _STEP_COMPLETED,
                 "completed_at": now,
                 "data.execution_notes": execution_notes,
                 "data.output_values": output_values
@@ -4303,7 +4595,7 @@ class WorkflowEngine:
         self._transition_to_next(ticket, step, TransitionEvent.COMPLETE_TASK, workflow_version, actor, correlation_id)
         
         # After transition, check if all steps in the branch are completed
-        branch_id = getattr(step, 'branch_id', None)
+        branch_id = step.branch_id
         if branch_id:
             ticket = self.ticket_repo.get_ticket_or_raise(ticket_id)
             if self._are_all_branch_steps_completed(ticket, branch_id, workflow_version):
@@ -4312,6 +4604,7 @@ class WorkflowEngine:
         
         return self._build_action_response(ticket_id, actor)
     
+    @_flush_audit_after
     def handle_add_note(
         self,
         ticket_id: str,
@@ -4413,6 +4706,7 @@ class WorkflowEngine:
         
         return self._build_action_response(ticket_id, actor)
     
+    @_flush_audit_after
     def handle_add_requester_note(
         self,
         ticket_id: str,
@@ -4434,7 +4728,7 @@ class WorkflowEngine:
             raise PermissionDeniedError("Only the ticket requester can add requester notes")
         
         # Check ticket is not in a terminal state
-        if ticket.status in [TicketStatus.COMPLETED, TicketStatus.CANCELLED, TicketStatus.REJECTED]:
+        if ticket.status in _CLOSED_TICKET_STATUSES:
             raise InvalidStateError(f"Cannot add notes to a {ticket.status.value} ticket")
         
         now = utc_now()
@@ -4533,6 +4827,7 @@ class WorkflowEngine:
         
         return self._build_action_response(ticket_id, actor)
     
+    @_flush_audit_after
     def handle_save_draft(
         self,
         ticket_id: str,
@@ -4550,7 +4845,7 @@ class WorkflowEngine:
         if step.step_type != StepType.TASK_STEP:
             raise InvalidStateError("Can only save draft for task steps")
         
-        if step.state not in [StepState.ACTIVE, StepState.ON_HOLD, StepState.WAITING_FOR_REQUESTER, StepState.WAITING_FOR_AGENT, StepState.WAITING_FOR_CR]:
+        if step.state not in _DRAFTABLE_STATES:
             raise InvalidStateError(f"Cannot save draft for step in state {step.state}")
         
         if not step.assigned_to or not self.permission_guard._is_same_user(actor, step.assigned_to):
@@ -4582,6 +4877,7 @@ class WorkflowEngine:
         
         return self._build_action_response(ticket_id, actor)
     
+    @_flush_audit_after
     def handle_request_info(
         self,
         ticket_id: str,
@@ -4753,6 +5049,7 @@ class WorkflowEngine:
         
         return self._build_action_response(ticket_id, actor)
     
+    @_flush_audit_after
     def handle_respond_info(
         self,
         ticket_id: str,
@@ -4813,7 +5110,7 @@ class WorkflowEngine:
         self.ticket_repo.update_step(
             ticket_step_id,
             {
-                "state": previous_state.value if isinstance(previous_state, StepState) else previous_state,
+                "state": _STEP_STATE_VALUES.get(previous_state, previous_state),
                 "previous_state": None
             },
             expected_version=step.version
@@ -4847,6 +5144,7 @@ class WorkflowEngine:
         
         return self._build_action_response(ticket_id, actor)
     
+    @_flush_audit_after
     def handle_assign(
         self,
         ticket_id: str,
@@ -4858,7 +5156,6 @@ class WorkflowEngine:
         agent_display_name: Optional[str] = None
     ) -> Dict[str, Any]:
         """Handle agent assignment with auto-onboarding"""
-        from ..repositories.admin_repo import AdminRepository
         
         ticket = self.ticket_repo.get_ticket_or_raise(ticket_id)
         step = self.ticket_repo.get_step_or_raise(ticket_step_id)
@@ -4883,7 +5180,7 @@ class WorkflowEngine:
             display_name = agent_snapshot.display_name
         
         # Auto-onboard agent if not in system (first-time task assignment)
-        admin_repo = AdminRepository()
+        admin_repo = self.admin_repo
         access, was_created, added_manager, added_agent = admin_repo.auto_onboard_user(
             email=agent_email,
             display_name=display_name,
@@ -4962,6 +5259,7 @@ class WorkflowEngine:
         
         return self._build_action_response(ticket_id, actor)
     
+    @_flush_audit_after
     def handle_reassign(
         self,
         ticket_id: str,
@@ -4974,7 +5272,6 @@ class WorkflowEngine:
         reason: Optional[str] = None
     ) -> Dict[str, Any]:
         """Handle agent reassignment with auto-onboarding"""
-        from ..repositories.admin_repo import AdminRepository
         
         ticket = self.ticket_repo.get_ticket_or_raise(ticket_id)
         step = self.ticket_repo.get_step_or_raise(ticket_step_id)
@@ -5001,8 +5298,7 @@ class WorkflowEngine:
             display_name = agent_snapshot.display_name
         
         # Auto-onboard agent if not in system (Reassign Agent feature)
-        from ..domain.enums import OnboardSource
-        admin_repo = AdminRepository()
+        admin_repo = self.admin_repo
         access, was_created, added_manager, added_agent = admin_repo.auto_onboard_user(
             email=agent_email,
             display_name=display_name,
@@ -5043,7 +5339,7 @@ class WorkflowEngine:
             self.ticket_repo.update_assignment(
                 old_assignment.assignment_id,
                 {
-                    "status": AssignmentStatus.REASSIGNED.value,
+                    "status": _REASSIGNED,
                     "ended_at": now
                 }
             )
@@ -5095,6 +5391,7 @@ class WorkflowEngine:
         
         return self._build_action_response(ticket_id, actor)
     
+    @_flush_audit_after
     def handle_cancel(
         self,
         ticket_id: str,
@@ -5124,7 +5421,7 @@ class WorkflowEngine:
         # Update all active steps to SKIPPED
         steps = self.ticket_repo.get_steps_for_ticket(ticket_id)
         for step in steps:
-            if step.state in [StepState.ACTIVE, StepState.WAITING_FOR_APPROVAL, StepState.WAITING_FOR_REQUESTER, StepState.WAITING_FOR_AGENT]:
+            if step.state in _CANCEL_SKIP_STATES:
                 self.ticket_repo.update_step(
                     step.ticket_step_id,
                     {"state": StepState.SKIPPED.value},
@@ -5162,6 +5459,7 @@ class WorkflowEngine:
         
         return self._build_action_response(ticket_id, actor)
     
+    @_flush_audit_after
     def handle_hold(
         self,
         ticket_id: str,
@@ -5188,7 +5486,7 @@ class WorkflowEngine:
             raise PermissionDeniedError("Only assigned agent can put step on hold")
         
         # State check
-        if step.state not in [StepState.ACTIVE, StepState.WAITING_FOR_APPROVAL]:
+        if step.state not in _HOLDABLE_STATES:
             raise InvalidStateError(f"Cannot put step on hold from state {step.state}")
         
         now = utc_now()
@@ -5218,6 +5516,7 @@ class WorkflowEngine:
         
         return self._build_action_response(ticket_id, actor)
     
+    @_flush_audit_after
     def handle_resume(
         self,
         ticket_id: str,
@@ -5255,16 +5554,16 @@ class WorkflowEngine:
         previous_state = step.previous_state or StepState.ACTIVE
         
         # Update step
-        self.ticket_repo.update_step(
-            ticket_step_id,
-            {
-                "state": previous_state.value if isinstance(previous_state, StepState) else previous_state,
+        update_doc = {
+            "$set": {
+                "state": _STEP_STATE_VALUES.get(previous_state, previous_state),
                 "previous_state": None,
                 "data.resumed_at": utc_now().isoformat(),
                 "data.resumed_by": actor.email
             },
-            expected_version=step.version
-        )
+            "$inc": {"version": 1}
+        }
+        self.ticket_repo.update_step_raw(ticket_step_id, update_doc, expected_version=step.version)
         
         # Audit
         self.audit_writer.write_resume(
@@ -5276,6 +5575,7 @@ class WorkflowEngine:
         
         return self._build_action_response(ticket_id, actor)
     
+    @_flush_audit_after
     def handle_handover_request(
         self,
         ticket_id: str,
@@ -5345,6 +5645,7 @@ class WorkflowEngine:
         
         return self._build_action_response(ticket_id, actor)
     
+    @_flush_audit_after
     def handle_handover_decision(
         self,
         ticket_id: str,
@@ -5425,7 +5726,6 @@ class WorkflowEngine:
         now = utc_now()
         
         if approved:
-            from ..repositories.admin_repo import AdminRepository
             
             # Resolve new agent
             if not new_agent_email:
@@ -5445,8 +5745,7 @@ class WorkflowEngine:
                 display_name = new_agent_snapshot.display_name
             
             # Auto-onboard new agent if not in system (Handover approval)
-            from ..domain.enums import OnboardSource
-            admin_repo = AdminRepository()
+            admin_repo = self.admin_repo
             access, was_created, added_manager, added_agent = admin_repo.auto_onboard_user(
                 email=new_agent_email,
                 display_name=display_name,
@@ -5483,7 +5782,7 @@ class WorkflowEngine:
             self.ticket_repo.update_handover_request(
                 handover_request_id,
                 {
-                    "status": HandoverRequestStatus.APPROVED.value,
+                    "status": _APPROVED,
                     "decided_by": UserSnapshot(
                         aad_id=actor.aad_id,
                         email=actor.email,
@@ -5498,41 +5797,48 @@ class WorkflowEngine:
             # Perform the reassignment
             old_agent = step.assigned_to
             
-            # Update old assignment
-            old_assignment = self.ticket_repo.get_active_assignment(ticket_step_id)
-            if old_assignment:
-                self.ticket_repo.update_assignment(
-                    old_assignment.assignment_id,
-                    {
-                        "status": AssignmentStatus.REASSIGNED.value,
-                        "ended_at": now
-                    }
-                )
-            
-            # Create new assignment
-            from ..utils.idgen import generate_assignment_id
-            assignment = Assignment(
-                assignment_id=generate_assignment_id(),
-                ticket_id=ticket_id,
-                ticket_step_id=ticket_step_id,
-                assigned_to=new_agent_snapshot,
-                assigned_by=UserSnapshot(
-                    aad_id=actor.aad_id,
-                    email=actor.email,
-                    display_name=actor.display_name
-                ),
-                status=AssignmentStatus.ACTIVE,
-                reason=f"Handover approved: {comment or 'No comment'}",
-                assigned_at=now
+            # Approving a handover back to the current assignee leaves the step
+            # unchanged: record the decision but skip the reassignment writes
+            is_same_agent = bool(old_agent) and bool(
+                (new_agent_snapshot.aad_id and new_agent_snapshot.aad_id == old_agent.aad_id)
+                or new_agent_snapshot.email.lower() == old_agent.email.lower()
             )
-            self.ticket_repo.create_assignment(assignment)
             
-            # Update step
-            self.ticket_repo.update_step(
-                ticket_step_id,
-                {"assigned_to": new_agent_snapshot.model_dump(mode="json")},
-                expected_version=step.version
-            )
+            if not is_same_agent:
+                # Update old assignment
+                old_assignment = self.ticket_repo.get_active_assignment(ticket_step_id)
+                if old_assignment:
+                    self.ticket_repo.update_assignment(
+                        old_assignment.assignment_id,
+                        {
+                            "status": _REASSIGNED,
+                            "ended_at": now
+                        }
+                    )
+                
+                # Create new assignment
+                assignment = Assignment(
+                    assignment_id=generate_assignment_id(),
+                    ticket_id=ticket_id,
+                    ticket_step_id=ticket_step_id,
+                    assigned_to=new_agent_snapshot,
+                    assigned_by=UserSnapshot(
+                        aad_id=actor.aad_id,
+                        email=actor.email,
+                        display_name=actor.display_name
+                    ),
+                    status=AssignmentStatus.ACTIVE,
+                    reason=f"Handover approved: {comment or 'No comment'}",
+                    assigned_at=now
+                )
+                self.ticket_repo.create_assignment(assignment)
+                
+                # Update step
+                self.ticket_repo.update_step(
+                    ticket_step_id,
+                    {"assigned_to": new_agent_snapshot.model_dump(mode="json")},
+                    expected_version=step.version
+                )
             
             # Audit
             self.audit_writer.write_handover_approved(
@@ -5545,20 +5851,22 @@ class WorkflowEngine:
             )
             
             # Notify new agent
-            self.notification_service.enqueue_task_reassigned(
-                ticket_id=ticket_id,
-                new_agent_email=new_agent_email,
-                ticket_title=ticket.title,
-                reassigned_by_name=actor.display_name,
-                previous_agent_email=old_agent.email if old_agent else None,
-                reason=f"Handover approved{': ' + comment if comment else ''}"
-            )
+            if not is_same_agent:
+                self._enqueue_notification_in_background(
+                    self.notification_service.enqueue_task_reassigned,
+                    ticket_id=ticket_id,
+                    new_agent_email=new_agent_email,
+                    ticket_title=ticket.title,
+                    reassigned_by_name=actor.display_name,
+                    previous_agent_email=old_agent.email if old_agent else None,
+                    reason=f"Handover approved{': ' + comment if comment else ''}"
+                )
         else:
             # Reject handover
             self.ticket_repo.update_handover_request(
                 handover_request_id,
                 {
-                    "status": HandoverRequestStatus.REJECTED.value,
+                    "status": _REJECTED,
                     "decided_by": UserSnapshot(
                         aad_id=actor.aad_id,
                         email=actor.email,
@@ -5579,6 +5887,7 @@ class WorkflowEngine:
         
         return self._build_action_response(ticket_id, actor)
     
+    @_flush_audit_after
     def handle_cancel_handover(
         self,
         ticket_id: str,
@@ -5613,7 +5922,7 @@ class WorkflowEngine:
         self.ticket_repo.update_handover_request(
             handover_request_id,
             {
-                "status": HandoverRequestStatus.CANCELLED.value,
+                "status": _CANCELLED,
                 "decided_at": now,
                 "decision_comment": "Cancelled by agent"
             }
@@ -5636,6 +5945,7 @@ class WorkflowEngine:
         
         return self._build_action_response(ticket_id, actor)
     
+    @_flush_audit_after
     def handle_skip_step(
         self,
         ticket_id: str,
@@ -5650,28 +5960,28 @@ class WorkflowEngine:
         
         # Permission check - must be manager or admin
         is_manager = ticket.manager_snapshot and ticket.manager_snapshot.email.lower() == actor.email.lower()
-        is_admin = "admin" in [r.lower() for r in actor.roles]
+        is_admin = "admin" in actor.roles_lc
         
         if not is_manager and not is_admin:
             raise PermissionDeniedError("Only manager or admin can skip steps")
         
         # State check - can only skip active/waiting steps
-        if step.state not in [StepState.ACTIVE, StepState.WAITING_FOR_APPROVAL, StepState.WAITING_FOR_REQUESTER, StepState.ON_HOLD]:
+        if step.state not in _SKIPPABLE_STATES:
             raise InvalidStateError(f"Cannot skip step in state {step.state}")
         
         now = utc_now()
         
         # Update step
-        self.ticket_repo.update_step(
-            ticket_step_id,
-            {
-                "state": StepState.SKIPPED.value,
+        update_doc = {
+            "$set": {
+                "state": _SKIPPED,
                 "completed_at": now,
                 "data.skipped_reason": reason,
                 "data.skipped_by": actor.email
             },
-            expected_version=step.version
-        )
+            "$inc": {"version": 1}
+        }
+        self.ticket_repo.update_step_raw(ticket_step_id, update_doc, expected_version=step.version)
         
         # Audit
         self.audit_writer.write_step_skipped(
@@ -5688,6 +5998,7 @@ class WorkflowEngine:
         
         return self._build_action_response(ticket_id, actor)
     
+    @_flush_audit_after
     def handle_acknowledge_sla(
         self,
         ticket_id: str,
@@ -5724,11 +6035,11 @@ class WorkflowEngine:
         self.ticket_repo.create_sla_acknowledgment(acknowledgment)
         
         # Update step with acknowledgment flag
-        self.ticket_repo.update_step(
-            ticket_step_id,
-            {"data.sla_acknowledged": True, "data.sla_acknowledged_at": utc_now().isoformat()},
-            expected_version=step.version
-        )
+        update_doc = {
+            "$set": {"data.sla_acknowledged": True, "data.sla_acknowledged_at": utc_now().isoformat()},
+            "$inc": {"version": 1}
+        }
+        self.ticket_repo.update_step_raw(ticket_step_id, update_doc, expected_version=step.version)
         
         # Audit
         self.audit_writer.write_sla_acknowledged(
@@ -5754,12 +6065,21 @@ class WorkflowEngine:
         correlation_id: str
     ) -> None:
         """Transition to next step"""
+        branch_id = current_step.branch_id
+        
         # Check if this step is part of a sub-workflow
         if current_step.parent_sub_workflow_step_id:
             # This step is part of a sub-workflow - check if sub-workflow is complete
             # We need to use the sub-workflow's definition for internal transitions
+            # (cheap from_sub_workflow_id check happens before any repo fetch)
             sub_workflow_version = self._get_sub_workflow_version_for_step(current_step)
             
+            def get_parent_workflow_version() -> Optional[WorkflowVersion]:
+                # Callers usually pass the parent version already - only refetch if not
+                if workflow_version and workflow_version.workflow_version_id == ticket.workflow_version_id:
+                    return workflow_version
+                return self.workflow_repo.get_version(ticket.workflow_version_id)
+            
             if sub_workflow_version:
                 # Try to resolve next step within sub-workflow
                 ticket_context = {
@@ -5790,14 +6110,15 @@ class WorkflowEngine:
                         if next_step:
                             # CRITICAL: If current step is in a branch and next step is JOIN,
                             # mark the branch as completed BEFORE activating the join
-                            branch_id = getattr(current_step, 'branch_id', None)
                             if branch_id and next_step.step_type == StepType.JOIN_STEP:
                                 logger.info(
                                     f"Sub-workflow branch {branch_id} completing (step {current_step.step_id} -> JOIN {next_step_id})",
                                     extra={"ticket_id": ticket.ticket_id}
                                 )
-                                self._mark_branch_completed(ticket, current_step, actor, correlation_id, sub_workflow_version)
-                                ticket = self.ticket_repo.get_ticket_or_raise(ticket.ticket_id)
+                                ticket = (
+                                    self._mark_branch_completed(ticket, current_step, actor, correlation_id, sub_workflow_version)
+                                    or self.ticket_repo.get_ticket_or_raise(ticket.ticket_id)
+                                )
                                 
                                 # Check if all branches are now complete for the join
                                 join_step_def = self._find_step_definition(next_step_id, sub_workflow_version)
@@ -5816,26 +6137,23 @@ class WorkflowEngine:
                     
                     # No next step - sub-workflow has ended, check completion
                     # IMPORTANT: Use PARENT workflow version, not sub-workflow version
-                    parent_workflow_version = self.workflow_repo.get_version(ticket.workflow_version_id)
+                    parent_workflow_version = get_parent_workflow_version()
                     self._check_and_complete_sub_workflow(
                         ticket, current_step, actor, correlation_id, parent_workflow_version
                     )
                     return
                     
                 except Exception as e:
-                    logger.debug(
-                        f"No transition found in sub-workflow, checking completion: {e}"
-                    )
+                    logger.debug("No transition found in sub-workflow, checking completion: %s", e)
                     # No transition found - sub-workflow may have ended
                     # IMPORTANT: Use PARENT workflow version, not sub-workflow version
-                    parent_workflow_version = self.workflow_repo.get_version(ticket.workflow_version_id)
+                    parent_workflow_version = get_parent_workflow_version()
                     self._check_and_complete_sub_workflow(
                         ticket, current_step, actor, correlation_id, parent_workflow_version
                     )
                     return
         
         # Check if this step is part of a parallel branch
-        branch_id = getattr(current_step, 'branch_id', None)
         if branch_id:
             # Check if completion triggers join - PASS THE ACTUAL EVENT TYPE
             if self._handle_branch_step_completion(ticket, current_step, workflow_version, actor, correlation_id, event):
@@ -5856,284 +6174,274 @@ class WorkflowEngine:
             workflow_version=workflow_version
         )
         
+        # Dispatch on (where the current step runs, what comes next); the next
+        # step's definition is looked up once and handed to the handler
+        next_step_def = self._find_step_definition(next_step_id, workflow_version) if next_step_id else None
         if next_step_id is None:
-            # Check if we're in a branch - don't complete ticket, wait for join
-            if branch_id:
-                logger.info(f"Branch {branch_id} has no explicit next step, checking if all steps are completed")
-                # Check if all steps in branch are completed before marking as completed
-                if self._are_all_branch_steps_completed(ticket, branch_id, workflow_version):
-                    self._mark_branch_completed(ticket, current_step, actor, correlation_id, workflow_version)
-                else:
-                    # Clear current_step_id since we've reached the end but not all steps are done
-                    self._update_branch_current_step(ticket, branch_id, None)
-                
-                # Find the join step that this branch should lead to
-                # Look for a join step that has this fork as its source
-                all_steps = self.ticket_repo.get_steps_for_ticket(ticket.ticket_id)
-                fork_step = None
-                for step in all_steps:
-                    if step.step_type == StepType.FORK_STEP:
-                        # Check if this branch belongs to this fork
-                        if getattr(current_step, 'parent_fork_step_id', None) == step.step_id:
-                            fork_step = step
-                            break
-                
-                if fork_step:
-                    # Find the join step for this fork
-                    for step in all_steps:
-                        if step.step_type == StepType.JOIN_STEP:
-                            join_step_def = self._find_step_definition(step.step_id, workflow_version)
-                            if join_step_def and join_step_def.get("source_fork_step_id") == fork_step.step_id:
-                                # Check if join can proceed
-                                ticket = self.ticket_repo.get_ticket_or_raise(ticket.ticket_id)
-                                if self._check_join_completion(ticket, step, join_step_def, workflow_version):
-                                    self._transition_after_join(ticket, step, workflow_version, actor, correlation_id)
-                                break
-                return
-            # Terminal - complete ticket
-            self._complete_ticket(ticket, actor, correlation_id)
-            return
+            next_kind = "end"
+        elif next_step_def and next_step_def.get("step_type") == StepType.JOIN_STEP.value:
+            next_kind = "join"
+        else:
+            next_kind = "step"
         
-        # Check if next step is a JOIN step
-        next_step_def = self._find_step_definition(next_step_id, workflow_version)
-        if next_step_def and next_step_def.get("step_type") == StepType.JOIN_STEP.value:
-            # This branch is ending, check if join can proceed
-            all_steps = self.ticket_repo.get_steps_for_ticket(ticket.ticket_id)
-            join_step = self._find_ticket_step(all_steps, next_step_id)
-            
-            if join_step:
-                ticket = self.ticket_repo.get_ticket_or_raise(ticket.ticket_id)
-                if self._check_join_completion(ticket, join_step, next_step_def, workflow_version):
-                    self._transition_after_join(ticket, join_step, workflow_version, actor, correlation_id)
-                else:
-                    # Mark this branch as completed, wait for others
-                    self._mark_branch_completed(ticket, current_step, actor, correlation_id, workflow_version)
-            return
+        handler = getattr(self, _NEXT_STEP_HANDLERS[("branch" if branch_id else "root", next_kind)])
+        handler(ticket, current_step, next_step_id, next_step_def, workflow_version, actor, correlation_id)
+    
+    def _advance_root_to_end(
+        self,
+        ticket: Ticket,
+        current_step: TicketStep,
+        next_step_id: Optional[str],
+        next_step_def: Optional[Dict[str, Any]],
+        workflow_version: WorkflowVersion,
+        actor: ActorContext,
+        correlation_id: str
+    ) -> None:
+        """No next step outside a branch - the ticket is complete"""
+        self._complete_ticket(ticket, actor, correlation_id)
+    
+    def _advance_branch_to_end(
+        self,
+        ticket: Ticket,
+        current_step: TicketStep,
+        next_step_id: Optional[str],
+        next_step_def: Optional[Dict[str, Any]],
+        workflow_version: WorkflowVersion,
+        actor: ActorContext,
+        correlation_id: str
+    ) -> None:
+        """No next step inside a branch - don't complete ticket, wait for join"""
+        branch_id = current_step.branch_id
+        logger.info("Branch %s has no explicit next step, checking if all steps are completed", branch_id)
+        # Check if all steps in branch are completed before marking as completed
+        if self._are_all_branch_steps_completed(ticket, branch_id, workflow_version):
+            fresh_ticket = self._mark_branch_completed(ticket, current_step, actor, correlation_id, workflow_version)
+        else:
+            # Clear current_step_id since we've reached the end but not all steps are done
+            fresh_ticket = self._update_branch_current_step(ticket, branch_id, None)
         
-        # Get next step and activate
-        steps = self.ticket_repo.get_steps_for_ticket(ticket.ticket_id)
-        next_step = self._find_ticket_step(steps, next_step_id)
+        # Find the join step that this branch should lead to
+        # Look for a join step that has this fork as its source
+        join_step, join_step_def = self._find_join_for_fork(
+            ticket.ticket_id, current_step.parent_fork_step_id, workflow_version
+        )
+        if join_step:
+            # Check if join can proceed
+            ticket = fresh_ticket or self.ticket_repo.get_ticket_or_raise(ticket.ticket_id)
+            if self._check_join_completion(ticket, join_step, join_step_def, workflow_version):
+                self._transition_after_join(ticket, join_step, workflow_version, actor, correlation_id)
+    
+    def _advance_to_join(
+        self,
+        ticket: Ticket,
+        current_step: TicketStep,
+        next_step_id: Optional[str],
+        next_step_def: Optional[Dict[str, Any]],
+        workflow_version: WorkflowVersion,
+        actor: ActorContext,
+        correlation_id: str
+    ) -> None:
+        """Next step is a JOIN - this branch is ending, check if join can proceed"""
+        join_step = self._get_step_by_id(ticket.ticket_id, next_step_id)
         
-        # Check if we're in a rejected branch - don't activate subsequent steps
-        if branch_id:
+        if join_step:
             ticket = self.ticket_repo.get_ticket_or_raise(ticket.ticket_id)
-            active_branches = ticket.active_branches or []
-            branch_state = next((b for b in active_branches if b.branch_id == branch_id), None)
-            if branch_state and branch_state.state == StepState.REJECTED:
-                logger.info(
-                    f"Branch {branch_id} is rejected, skipping activation of step {next_step_id}",
-                    extra={"ticket_id": ticket.ticket_id, "branch_id": branch_id, "next_step_id": next_step_id}
-                )
-                # Mark branch as completed (it's done, just rejected)
+            if self._check_join_completion(ticket, join_step, next_step_def, workflow_version):
+                self._transition_after_join(ticket, join_step, workflow_version, actor, correlation_id)
+            else:
+                # Mark this branch as completed, wait for others
                 self._mark_branch_completed(ticket, current_step, actor, correlation_id, workflow_version)
-                return
+    
+    def _advance_root_to_step(
+        self,
+        ticket: Ticket,
+        current_step: TicketStep,
+        next_step_id: Optional[str],
+        next_step_def: Optional[Dict[str, Any]],
+        workflow_version: WorkflowVersion,
+        actor: ActorContext,
+        correlation_id: str
+    ) -> None:
+        """Activate the next step outside any branch"""
+        next_step = self._get_step_by_id(ticket.ticket_id, next_step_id)
+        if not next_step:
+            return
         
-        if next_step:
-            # CRITICAL: Check if next step is in a DIFFERENT branch (cross-branch transition)
-            # This can happen with incorrectly designed workflows or when branches share steps
-            # In this case, mark the CURRENT branch as completed before transitioning
-            if branch_id:
-                next_step_branch_id = getattr(next_step, 'branch_id', None)
-                if next_step_branch_id and next_step_branch_id != branch_id:
-                    logger.info(
-                        f"Cross-branch transition detected: {current_step.step_id} (branch={branch_id}) -> "
-                        f"{next_step_id} (branch={next_step_branch_id}). Marking current branch as completed.",
-                        extra={"ticket_id": ticket.ticket_id}
-                    )
-                    # Mark current branch as completed since we're leaving it
-                    self._mark_branch_completed(ticket, current_step, actor, correlation_id, workflow_version)
-                    
-                    # Refresh ticket to get updated branch states
-                    ticket = self.ticket_repo.get_ticket_or_raise(ticket.ticket_id)
-                    
-                    # Check if this completes a join
-                    parent_fork_id = getattr(current_step, 'parent_fork_step_id', None)
-                    if parent_fork_id:
-                        all_steps = self.ticket_repo.get_steps_for_ticket(ticket.ticket_id)
-                        for step in all_steps:
-                            if step.step_type == StepType.JOIN_STEP:
-                                join_step_def = self._find_step_definition(step.step_id, workflow_version)
-                                if join_step_def and join_step_def.get("source_fork_step_id") == parent_fork_id:
-                                    if self._check_join_completion(ticket, step, join_step_def, workflow_version):
-                                        logger.info(
-                                            f"Join step {step.step_id} can proceed after cross-branch transition",
-                                            extra={"ticket_id": ticket.ticket_id}
-                                        )
-                                        self._transition_after_join(ticket, step, workflow_version, actor, correlation_id)
-                                        return
-                                    break
-                    
-                    # If next step is not started yet, activate it (in the other branch)
-                    if next_step.state == StepState.NOT_STARTED:
-                        self._activate_step(ticket, next_step, workflow_version, actor, correlation_id)
-                    return
+        if self._is_next_step_done(next_step):
+            # Don't recursively transition from completed/rejected steps
+            logger.warning(
+                f"Next step {next_step_id} is already done (state: {next_step.state}). "
+                f"Skipping transition from step {current_step.step_id}.",
+                extra={"ticket_id": ticket.ticket_id, "current_step": current_step.step_id, "next_step": next_step_id}
+            )
+            return
+        
+        # Refresh ticket for version
+        ticket = self.ticket_repo.get_ticket_or_raise(ticket.ticket_id)
+        self._activate_step(ticket, next_step, workflow_version, actor, correlation_id)
+    
+    def _advance_branch_to_step(
+        self,
+        ticket: Ticket,
+        current_step: TicketStep,
+        next_step_id: Optional[str],
+        next_step_def: Optional[Dict[str, Any]],
+        workflow_version: WorkflowVersion,
+        actor: ActorContext,
+        correlation_id: str
+    ) -> None:
+        """Activate the next step of a parallel branch, tracking branch progress"""
+        branch_id = current_step.branch_id
+        next_step = self._get_step_by_id(ticket.ticket_id, next_step_id)
+        
+        # Check if we're in a rejected branch - don't activate subsequent steps.
+        # The caller's ticket may predate its own writes, so it is re-read once
+        # here and then reused while nothing mutates it
+        ticket = self.ticket_repo.get_ticket_or_raise(ticket.ticket_id)
+        _, branch_state = ticket.active_branches_by_id.get(branch_id, (None, None))
+        if branch_state and branch_state.state == StepState.REJECTED:
+            logger.info(
+                f"Branch {branch_id} is rejected, skipping activation of step {next_step_id}",
+                extra={"ticket_id": ticket.ticket_id, "branch_id": branch_id, "next_step_id": next_step_id}
+            )
+            # Mark branch as completed (it's done, just rejected)
+            self._mark_branch_completed(ticket, current_step, actor, correlation_id, workflow_version)
+            return
+        
+        if not next_step:
+            return
+        
+        # CRITICAL: Check if next step is in a DIFFERENT branch (cross-branch transition)
+        # This can happen with incorrectly designed workflows or when branches share steps
+        # In this case, mark the CURRENT branch as completed before transitioning
+        next_step_branch_id = next_step.branch_id
+        if next_step_branch_id and next_step_branch_id != branch_id:
+            logger.info(
+                f"Cross-branch transition detected: {current_step.step_id} (branch={branch_id}) -> "
+                f"{next_step_id} (branch={next_step_branch_id}). Marking current branch as completed.",
+                extra={"ticket_id": ticket.ticket_id}
+            )
+            # Mark current branch as completed since we're leaving it
+            fresh_ticket = self._mark_branch_completed(ticket, current_step, actor, correlation_id, workflow_version)
             
-            # Check if next step is already completed or rejected
-            # Also check if it's an approval step with all tasks rejected
-            is_step_done = False
-            if next_step.state in [StepState.COMPLETED, StepState.REJECTED, StepState.CANCELLED, StepState.SKIPPED]:
-                is_step_done = True
-            elif next_step.step_type == StepType.APPROVAL_STEP:
-                # Check approval task status - if all tasks are rejected/skipped, step is effectively done
-                approval_tasks = self.ticket_repo.get_approval_tasks_for_step(next_step.ticket_step_id)
-                if approval_tasks:
-                    all_rejected_or_skipped = all(task.decision in [ApprovalDecision.REJECTED, ApprovalDecision.SKIPPED] for task in approval_tasks)
-                    all_approved = all(task.decision == ApprovalDecision.APPROVED for task in approval_tasks)
-                    if all_rejected_or_skipped:
-                        is_step_done = True
-                        # Update step state to REJECTED if not already
-                        if next_step.state != StepState.REJECTED:
-                            self.ticket_repo.update_step(
-                                next_step.ticket_step_id,
-                                {"state": StepState.REJECTED.value},
-                                expected_version=next_step.version
-                            )
-                            next_step.state = StepState.REJECTED
-                    elif all_approved and next_step.state != StepState.COMPLETED:
-                        # All approved but step not marked complete - mark it complete
-                        self.ticket_repo.update_step(
-                            next_step.ticket_step_id,
-                            {"state": StepState.COMPLETED.value, "completed_at": utc_now()},
-                            expected_version=next_step.version
-                        )
-                        next_step.state = StepState.COMPLETED
-                        is_step_done = True
-            
-            if is_step_done:
-                if branch_id:
-                    # Check if the next step is in the same branch
-                    next_step_branch_id = getattr(next_step, 'branch_id', None)
-                    if next_step_branch_id != branch_id:
-                        # Next step is from a different branch - this shouldn't happen with correct transitions
-                        # But if it does, just mark our branch as completed and check for join
-                        logger.warning(
-                            f"Next step {next_step_id} is from different branch {next_step_branch_id}, "
-                            f"not current branch {branch_id}. Marking current branch as completed.",
-                            extra={"ticket_id": ticket.ticket_id, "current_step": current_step.step_id, 
-                                   "next_step": next_step_id, "current_branch": branch_id, "next_branch": next_step_branch_id}
-                        )
-                        # Mark branch as completed and check for join
-                        self._mark_branch_completed(ticket, current_step, actor, correlation_id, workflow_version)
-                        return
-                    
-                    # Step is already done and in same branch - check if this triggers join completion
-                    # Find join step that this branch leads to
-                    next_step_def = self._find_step_definition(next_step_id, workflow_version)
-                    if next_step_def and next_step_def.get("step_type") == StepType.JOIN_STEP.value:
-                        # Next step is a join - check if it can proceed
-                        ticket = self.ticket_repo.get_ticket_or_raise(ticket.ticket_id)
-                        if self._check_join_completion(ticket, next_step, next_step_def, workflow_version):
-                            self._transition_after_join(ticket, next_step, workflow_version, actor, correlation_id)
-                        else:
-                            # Mark this branch as completed, wait for others
-                            self._mark_branch_completed(ticket, current_step, actor, correlation_id, workflow_version)
-                    else:
-                        # Step is done but not a join - skip it and mark branch as completed
-                        # Don't try to recursively transition from completed steps - just mark branch done
-                        logger.info(
-                            f"Next step {next_step_id} is already done (state: {next_step.state}). "
-                            f"Marking branch {branch_id} as completed.",
-                            extra={"ticket_id": ticket.ticket_id, "current_step": current_step.step_id, 
-                                   "next_step": next_step_id, "branch_id": branch_id}
-                        )
-                        self._mark_branch_completed(ticket, current_step, actor, correlation_id, workflow_version)
-                        return
-                else:
-                    # Not in a branch - if next step is done, skip it and continue
-                    # But don't recursively transition from completed/rejected steps
-                    # Instead, find the step after the completed one in the workflow definition
-                    logger.warning(
-                        f"Next step {next_step_id} is already done (state: {next_step.state}). "
-                        f"Skipping transition from step {current_step.step_id}.",
-                        extra={"ticket_id": ticket.ticket_id, "current_step": current_step.step_id, "next_step": next_step_id}
-                    )
-                    # Mark branch as completed if in a branch
-                    if branch_id:
-                        self._mark_branch_completed(ticket, current_step, actor, correlation_id, workflow_version)
-                    return
+            # Refresh ticket to get updated branch states (unless it came back unchanged)
+            ticket = fresh_ticket or self.ticket_repo.get_ticket_or_raise(ticket.ticket_id)
             
-            # If we're in a branch, propagate branch info to next step and update branch tracking
-            # CRITICAL: Only propagate if next step doesn't already belong to a different branch
-            if branch_id:
-                next_step_branch_id = getattr(next_step, 'branch_id', None)
-                
-                # Only update branch metadata if:
-                # 1. Next step has no branch_id (not yet assigned to a branch), OR
-                # 2. Next step has the same branch_id (same branch, just updating metadata)
-                if not next_step_branch_id or next_step_branch_id == branch_id:
-                    self.ticket_repo.update_step(
-                        next_step.ticket_step_id,
-                        {
-                            "branch_id": branch_id,
-                            "branch_name": getattr(current_step, 'branch_name', None),
-                            "parent_fork_step_id": getattr(current_step, 'parent_fork_step_id', None)
-                        },
-                        expected_version=next_step.version
-                    )
-                    next_step = self.ticket_repo.get_step_or_raise(next_step.ticket_step_id)
-                    
-                    # Update branch's current_step_id to track progress
-                    self._update_branch_current_step(ticket, branch_id, next_step_id)
-                else:
-                    # Next step belongs to a different branch - don't overwrite!
-                    logger.warning(
-                        f"Not propagating branch metadata: next step {next_step_id} already belongs to branch {next_step_branch_id}, "
-                        f"not {branch_id} from current step {current_step.step_id}",
-                        extra={
-                            "ticket_id": ticket.ticket_id,
-                            "current_step": current_step.step_id,
-                            "next_step": next_step_id,
-                            "current_branch_id": branch_id,
-                            "next_branch_id": next_step_branch_id
-                        }
-                    )
+            # Check if this completes a join
+            join_step, join_step_def = self._find_join_for_fork(
+                ticket.ticket_id, current_step.parent_fork_step_id, workflow_version
+            )
+            if join_step and self._check_join_completion(ticket, join_step, join_step_def, workflow_version):
+                logger.info(
+                    f"Join step {join_step.step_id} can proceed after cross-branch transition",
+                    extra={"ticket_id": ticket.ticket_id}
+                )
+                self._transition_after_join(ticket, join_step, workflow_version, actor, correlation_id)
+                return
             
-            # Refresh ticket for version
+            # If next step is not started yet, activate it (in the other branch)
+            if next_step.state == StepState.NOT_STARTED:
+                self._activate_step(ticket, next_step, workflow_version, actor, correlation_id)
+            return
+        
+        if self._is_next_step_done(next_step):
+            if next_step_branch_id != branch_id:
+                # Next step is outside any branch - this shouldn't happen with correct transitions
+                # But if it does, just mark our branch as completed
+                logger.warning(
+                    f"Next step {next_step_id} is from different branch {next_step_branch_id}, "
+                    f"not current branch {branch_id}. Marking current branch as completed.",
+                    extra={"ticket_id": ticket.ticket_id, "current_step": current_step.step_id, 
+                           "next_step": next_step_id, "current_branch": branch_id, "next_branch": next_step_branch_id}
+                )
+            else:
+                # Step is done but not a join (joins are dispatched separately) - skip it.
+                # Don't try to recursively transition from completed steps - just mark branch done
+                logger.info(
+                    f"Next step {next_step_id} is already done (state: {next_step.state}). "
+                    f"Marking branch {branch_id} as completed.",
+                    extra={"ticket_id": ticket.ticket_id, "current_step": current_step.step_id, 
+                           "next_step": next_step_id, "branch_id": branch_id}
+                )
+            self._mark_branch_completed(ticket, current_step, actor, correlation_id, workflow_version)
+            return
+        
+        # Propagate branch info to next step and update branch tracking
+        # CRITICAL: Only propagate if next step doesn't already belong to a different branch
+        # (cross-branch steps were handled above, so it has no branch_id or the same one)
+        next_step = self.ticket_repo.update_step(
+            next_step.ticket_step_id,
+            {
+                "branch_id": branch_id,
+                "branch_name": current_step.branch_name,
+                "parent_fork_step_id": current_step.parent_fork_step_id
+            },
+            expected_version=next_step.version
+        )
+        
+        # Update branch's current_step_id to track progress; the update returns the
+        # latest ticket, otherwise refresh it for version
+        updated_ticket = self._update_branch_current_step(ticket, branch_id, next_step_id)
+        if updated_ticket is not None:
+            ticket = updated_ticket
+        else:
             ticket = self.ticket_repo.get_ticket_or_raise(ticket.ticket_id)
-            self._activate_step(ticket, next_step, workflow_version, actor, correlation_id)
+        self._activate_step(ticket, next_step, workflow_version, actor, correlation_id)
+    
+    def _is_next_step_done(self, next_step: TicketStep) -> bool:
+        """
+        Check whether the next step is already completed or rejected
+        
+        An approval step whose tasks are all decided is treated as done, and its
+        state is synced to REJECTED/COMPLETED to match the tasks.
+        """
+        if next_step.state in _TERMINAL_STEP_STATES:
+            return True
+        if next_step.step_type != StepType.APPROVAL_STEP or next_step.state == StepState.NOT_STARTED:
+            # Tasks are only created on activation, so a NOT_STARTED step has none to read
+            return False
+        
+        approval_tasks = self.ticket_repo.get_approval_tasks_for_step(next_step.ticket_step_id)
+        if not approval_tasks:
+            return False
+        
+        if all(task.decision in _NEGATIVE_APPROVAL_DECISIONS for task in approval_tasks):
+            # Update step state to REJECTED if not already
+            if next_step.state != StepState.REJECTED:
+                self.ticket_repo.update_step(
+                    next_step.ticket_step_id,
+                    {"state": _STEP_REJECTED},
+                    expected_version=next_step.version
+                )
+                next_step.state = StepState.REJECTED
+            return True
+        
+        if all(task.decision == ApprovalDecision.APPROVED for task in approval_tasks) and next_step.state != StepState.COMPLETED:
+            # All approved but step not marked complete - mark it complete
+            self.ticket_repo.update_step(
+                next_step.ticket_step_id,
+                {"state": _STEP_COMPLETED, "completed_at": utc_now()},
+                expected_version=next_step.version
+            )
+            next_step.state = StepState.COMPLETED
+            return True
+        
+        return False
     
     def _update_branch_current_step(
         self,
         ticket: Ticket,
         branch_id: str,
         new_step_id: Optional[str]
-    ) -> None:
-        """Update a branch's current_step_id to track progress within the branch"""
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                ticket = self.ticket_repo.get_ticket_or_raise(ticket.ticket_id)
-                active_branches = ticket.active_branches or []
-                updated = False
-                
-                for i, branch in enumerate(active_branches):
-                    if branch.branch_id == branch_id:
-                        # Update branch with new current step
-                        active_branches[i] = BranchState(
-                            branch_id=branch.branch_id,
-                            branch_name=branch.branch_name,
-                            parent_fork_step_id=branch.parent_fork_step_id,
-                            state=branch.state,
-                            current_step_id=new_step_id,
-                            started_at=branch.started_at,
-                            completed_at=branch.completed_at,
-                            outcome=branch.outcome
-                        )
-                        updated = True
-                        break
-                
-                if updated:
-                    self.ticket_repo.update_ticket(
-                        ticket.ticket_id,
-                        {"active_branches": [b.model_dump(mode="json") for b in active_branches]},
-                        expected_version=ticket.version
-                    )
-                break
-            except ConcurrencyError:
-                if attempt == max_retries - 1:
-                    logger.warning(f"Failed to update branch current step after {max_retries} attempts - non-critical")
-                    break
-                logger.warning(f"Concurrency conflict on branch current step update, retrying (attempt {attempt + 1})")
+    ) -> Optional[Ticket]:
+        """
+        Update a branch's current_step_id to track progress within the branch
+        
+        Returns the updated ticket (None if the ticket has no such branch).
+        """
+        return self.ticket_repo.update_branches(
+            ticket.ticket_id, [branch_id], {"current_step_id": new_step_id}
+        )
     
     def _mark_branch_failed(
         self,
@@ -6143,44 +6451,23 @@ class WorkflowEngine:
         correlation_id: str
     ) -> None:
         """Mark a branch as failed (rejected/cancelled)"""
-        branch_id = getattr(failed_step, 'branch_id', None)
+        branch_id = failed_step.branch_id
         if not branch_id:
             return
         
         now = utc_now()
         
-        # Update branch state with retry for concurrency
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                ticket = self.ticket_repo.get_ticket_or_raise(ticket.ticket_id)
-                active_branches = ticket.active_branches or []
-                
-                for i, branch in enumerate(active_branches):
-                    if branch.branch_id == branch_id:
-                        active_branches[i] = BranchState(
-                            branch_id=branch.branch_id,
-                            branch_name=branch.branch_name,
-                            parent_fork_step_id=branch.parent_fork_step_id,
-                            state=StepState.REJECTED,
-                            current_step_id=failed_step.step_id,
-                            started_at=branch.started_at,
-                            completed_at=now,
-                            outcome="REJECTED"
-                        )
-                        break
-                
-                self.ticket_repo.update_ticket(
-                    ticket.ticket_id,
-                    {"active_branches": [b.model_dump(mode="json") for b in active_branches]},
-                    expected_version=ticket.version
-                )
-                break
-            except ConcurrencyError:
-                if attempt == max_retries - 1:
-                    logger.error(f"Failed to update branch state after {max_retries} attempts")
-                    raise
-                logger.warning(f"Concurrency conflict on branch state update, retrying (attempt {attempt + 1})")
+        # Update branch state in place (atomic, no version retry needed)
+        self.ticket_repo.update_branches(
+            ticket.ticket_id,
+            [branch_id],
+            {
+                "state": _STEP_REJECTED,
+                "current_step_id": failed_step.step_id,
+                "completed_at": now,
+                "outcome": "REJECTED"
+            }
+        )
     
     def _cancel_other_branches(
         self,
@@ -6224,10 +6511,10 @@ class WorkflowEngine:
         
         try:
             # Get all steps for this ticket
-            all_steps = self.ticket_repo.get_steps_for_ticket(ticket.ticket_id)
+            all_steps = self._get_steps_cached(ticket.ticket_id)
             
             # Get the parent fork step to find all branches
-            parent_fork_step_id = getattr(failed_step, 'parent_fork_step_id', None)
+            parent_fork_step_id = failed_step.parent_fork_step_id
             if not parent_fork_step_id:
                 logger.warning(
                     f"CANCEL_OTHERS: Failed step has no parent_fork_step_id, cannot determine other branches",
@@ -6245,134 +6532,145 @@ class WorkflowEngine:
                 return 0
             
             branches = fork_step_def.get("branches", [])
-            other_branch_ids = [
+            other_branch_ids = frozenset(
                 b.get("branch_id") for b in branches 
                 if b.get("branch_id") and b.get("branch_id") != failed_branch_id
-            ]
+            )
             
             logger.info(
-                f"CANCEL_OTHERS: Found {len(other_branch_ids)} other branches to cancel: {other_branch_ids}",
+                f"CANCEL_OTHERS: Found {len(other_branch_ids)} other branches to cancel: {sorted(other_branch_ids)}",
                 extra={"ticket_id": ticket.ticket_id}
             )
             
-            # Cancel all in-progress or not-started steps in other branches
+            # Per-step logs are only formatted when their level is enabled
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+            info_enabled = logger.isEnabledFor(logging.INFO)
+            
+            # Collect in-progress or not-started steps in other branches
+            steps_to_cancel = []
             for step in all_steps:
-                step_branch_id = getattr(step, 'branch_id', None)
+                step_branch_id = step.branch_id
                 
                 # Skip if not in one of the other branches
                 if step_branch_id not in other_branch_ids:
                     continue
                 
                 # Skip if already in a terminal state
-                if step.state in [StepState.COMPLETED, StepState.REJECTED, StepState.CANCELLED, StepState.SKIPPED]:
-                    logger.debug(
-                        f"CANCEL_OTHERS: Step {step.step_id} already in terminal state {step.state}, skipping",
-                        extra={"ticket_id": ticket.ticket_id}
-                    )
+                if step.state in _TERMINAL_STEP_STATES:
+                    if debug_enabled:
+                        logger.debug(
+                            f"CANCEL_OTHERS: Step {step.step_id} already in terminal state {step.state}, skipping",
+                            extra={"ticket_id": ticket.ticket_id}
+                        )
                     continue
                 
-                # Cancel this step
+                steps_to_cancel.append(step)
+            
+            # Cancel them in one round-trip; the terminal-state filter replaces the
+            # per-step version guard (steps finished concurrently are left alone)
+            try:
+                cancelled_count = self.ticket_repo.bulk_update_steps(
+                    [step.ticket_step_id for step in steps_to_cancel],
+                    {
+                        "state": _STEP_CANCELLED,
+                        "outcome": "CANCELLED",
+                        "completed_at": now
+                    },
+                    exclude_states=_TERMINAL_STEP_STATE_VALUES
+                )
+            except Exception as e:
+                logger.error(
+                    f"CANCEL_OTHERS: Failed to cancel steps: {e}",
+                    extra={"ticket_id": ticket.ticket_id, "error": str(e)}
+                )
+                steps_to_cancel = []
+            
+            # Steps that finished concurrently were skipped by the update: keep only the
+            # ones it actually cancelled, so they alone get approval-task updates and audits
+            if cancelled_count < len(steps_to_cancel):
                 try:
-                    self.ticket_repo.update_step(
-                        step.ticket_step_id,
+                    cancelled_ids = set(self.ticket_repo.get_step_ids_matching(
+                        [step.ticket_step_id for step in steps_to_cancel],
+                        {"state": _STEP_CANCELLED, "completed_at": now}
+                    ))
+                except Exception as e:
+                    logger.error(
+                        f"CANCEL_OTHERS: Failed to re-read cancelled steps: {e}",
+                        extra={"ticket_id": ticket.ticket_id, "error": str(e)}
+                    )
+                    cancelled_ids = set()
+                steps_to_cancel = [
+                    step for step in steps_to_cancel if step.ticket_step_id in cancelled_ids
+                ]
+            
+            # Cancel any pending approval tasks for the cancelled approval steps
+            approval_step_ids = [
+                step.ticket_step_id for step in steps_to_cancel
+                if step.step_type == StepType.APPROVAL_STEP
+            ]
+            if approval_step_ids:
+                try:
+                    self.ticket_repo.update_pending_approval_tasks_for_steps(
+                        approval_step_ids,
                         {
-                            "state": StepState.CANCELLED.value,
-                            "outcome": "CANCELLED",
-                            "completed_at": now
-                        },
-                        expected_version=step.version
+                            "decision": ApprovalDecision.CANCELLED.value,
+                            "comment": f"Cancelled: {reason}",
+                            "decided_at": now
+                        }
                     )
-                    cancelled_count += 1
-                    
+                except Exception as e:
+                    logger.warning(
+                        f"CANCEL_OTHERS: Could not cancel approval tasks for steps {approval_step_ids}: {e}",
+                        extra={"ticket_id": ticket.ticket_id}
+                    )
+            
+            audit_batch = []
+            for step in steps_to_cancel:
+                if info_enabled:
                     logger.info(
-                        f"CANCEL_OTHERS: Cancelled step {step.step_name} ({step.step_id}) in branch {step_branch_id}",
+                        f"CANCEL_OTHERS: Cancelled step {step.step_name} ({step.step_id}) in branch {step.branch_id}",
                         extra={
                             "ticket_id": ticket.ticket_id,
                             "step_id": step.step_id,
-                            "branch_id": step_branch_id,
+                            "branch_id": step.branch_id,
                             "previous_state": step.state.value if hasattr(step.state, 'value') else str(step.state)
                         }
                     )
-                    
-                    # Cancel any pending approval tasks for this step
-                    if step.step_type == StepType.APPROVAL_STEP:
-                        try:
-                            approval_tasks = self.ticket_repo.get_approval_tasks_for_step(step.ticket_step_id)
-                            for task in approval_tasks:
-                                if task.decision == ApprovalDecision.PENDING:
-                                    self.ticket_repo.update_approval_task(
-                                        task.approval_task_id,
-                                        {
-                                            "decision": ApprovalDecision.CANCELLED.value if hasattr(ApprovalDecision, 'CANCELLED') else "CANCELLED",
-                                            "comment": f"Cancelled: {reason}",
-                                            "decided_at": now
-                                        }
-                                    )
-                                    logger.debug(
-                                        f"CANCEL_OTHERS: Cancelled approval task for step {step.step_id}",
-                                        extra={"ticket_id": ticket.ticket_id, "task_id": task.approval_task_id}
-                                    )
-                        except Exception as e:
-                            logger.warning(
-                                f"CANCEL_OTHERS: Could not cancel approval tasks for step {step.step_id}: {e}",
-                                extra={"ticket_id": ticket.ticket_id}
-                            )
-                    
-                    # Audit the cancellation
-                    self.audit_writer.write_event(
-                        ticket_id=ticket.ticket_id,
-                        ticket_step_id=step.ticket_step_id,
-                        event_type=AuditEventType.STEP_CANCELLED,
-                        actor=actor,
-                        details={
-                            "reason": reason,
-                            "cancelled_branch_id": step_branch_id,
-                            "triggered_by_branch": failed_branch_id,
-                            "triggered_by_step": failed_step.step_id
-                        },
-                        correlation_id=correlation_id
-                    )
-                    
-                except ConcurrencyError:
-                    logger.warning(
-                        f"CANCEL_OTHERS: Concurrency conflict cancelling step {step.step_id}, may already be updated",
-                        extra={"ticket_id": ticket.ticket_id}
-                    )
-                except Exception as e:
-                    logger.error(
-                        f"CANCEL_OTHERS: Failed to cancel step {step.step_id}: {e}",
-                        extra={"ticket_id": ticket.ticket_id, "error": str(e)}
-                    )
+                
+                audit_batch.append({
+                    "ticket_id": ticket.ticket_id,
+                    "ticket_step_id": step.ticket_step_id,
+                    "event_type": AuditEventType.STEP_CANCELLED,
+                    "actor": actor,
+                    "details": {
+                        "reason": reason,
+                        "cancelled_branch_id": step.branch_id,
+                        "triggered_by_branch": failed_branch_id,
+                        "triggered_by_step": failed_step.step_id
+                    },
+                    "correlation_id": correlation_id
+                })
+            
+            # Audit all cancellations in one insert
+            self.audit_writer.write_events(audit_batch)
             
             # Update branch states for other branches to CANCELLED
             try:
-                ticket = self.ticket_repo.get_ticket_or_raise(ticket.ticket_id)
-                active_branches = ticket.active_branches or []
-                updated = False
-                
-                for i, branch in enumerate(active_branches):
-                    if branch.branch_id in other_branch_ids and branch.state not in [StepState.COMPLETED, StepState.REJECTED, StepState.CANCELLED, StepState.SKIPPED]:
-                        active_branches[i] = BranchState(
-                            branch_id=branch.branch_id,
-                            branch_name=branch.branch_name,
-                            parent_fork_step_id=branch.parent_fork_step_id,
-                            state=StepState.CANCELLED,
-                            current_step_id=branch.current_step_id,
-                            started_at=branch.started_at,
-                            completed_at=now,
-                            outcome="CANCELLED"
-                        )
-                        updated = True
-                        logger.info(
-                            f"CANCEL_OTHERS: Marked branch '{branch.branch_name}' ({branch.branch_id}) as CANCELLED",
-                            extra={"ticket_id": ticket.ticket_id}
-                        )
-                
-                if updated:
-                    self.ticket_repo.update_ticket(
-                        ticket.ticket_id,
-                        {"active_branches": [b.model_dump(mode="json") for b in active_branches]},
-                        expected_version=ticket.version
+                updated_ticket = self.ticket_repo.update_branches(
+                    ticket.ticket_id,
+                    sorted(other_branch_ids),
+                    {
+                        "state": _STEP_CANCELLED,
+                        "completed_at": now,
+                        "outcome": "CANCELLED"
+                    },
+                    exclude_states=_TERMINAL_STEP_STATE_VALUES
+                )
+                if updated_ticket is not None:
+                    ticket = updated_ticket
+                    logger.info(
+                        f"CANCEL_OTHERS: Marked non-terminal branches in {sorted(other_branch_ids)} as CANCELLED",
+                        extra={"ticket_id": ticket.ticket_id}
                     )
             except Exception as e:
                 logger.error(
@@ -6385,7 +6683,7 @@ class WorkflowEngine:
                 extra={
                     "ticket_id": ticket.ticket_id,
                     "cancelled_count": cancelled_count,
-                    "other_branches": other_branch_ids
+                    "other_branches": sorted(other_branch_ids)
                 }
             )
             
@@ -6405,13 +6703,31 @@ class WorkflowEngine:
         workflow_version: WorkflowVersion
     ) -> bool:
         """Check if all steps in a branch are completed"""
-        all_steps = self.ticket_repo.get_steps_for_ticket(ticket.ticket_id)
-        branch_steps = [step for step in all_steps if getattr(step, 'branch_id', None) == branch_id]
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        cached = self._steps_cache.get(ticket.ticket_id)
+        if cached is None or cached[0] != self.ticket_repo.step_write_count:
+            # No fresh step list to scan: let the database answer the common
+            # "branch still running" case before reading every step. Approval
+            # steps are left to the task check below.
+            if self.ticket_repo.has_non_terminal_branch_step(
+                ticket.ticket_id, branch_id, _TERMINAL_STEP_STATE_VALUES,
+                ignore_step_types=[StepType.APPROVAL_STEP.value]
+            ):
+                if debug_enabled:
+                    logger.debug(
+                        f"_are_all_branch_steps_completed: branch {branch_id} has a non-terminal step",
+                        extra={"ticket_id": ticket.ticket_id, "branch_id": branch_id}
+                    )
+                return False
         
-        logger.info(
-            f"_are_all_branch_steps_completed: branch_id={branch_id}, found {len(branch_steps)} steps",
-            extra={"ticket_id": ticket.ticket_id}
-        )
+        all_steps = self._get_steps_cached(ticket.ticket_id)
+        branch_steps = [step for step in all_steps if step.branch_id == branch_id]
+        
+        if debug_enabled:
+            logger.debug(
+                f"_are_all_branch_steps_completed: branch_id={branch_id}, found {len(branch_steps)} steps",
+                extra={"ticket_id": ticket.ticket_id}
+            )
         
         if not branch_steps:
             logger.warning(
@@ -6420,44 +6736,54 @@ class WorkflowEngine:
             )
             return False
         
-        # Check if all steps in the branch are completed, rejected, cancelled, or skipped
+        # Check if all steps in the branch are completed, rejected, cancelled, or skipped.
+        # Non-approval steps answer from state alone, so they short-circuit before any
+        # approval tasks are read; open approval steps are then checked in one query.
+        open_approval_steps = []
         for step in branch_steps:
-            logger.debug(
-                f"_are_all_branch_steps_completed: step {step.step_name} state={step.state}",
-                extra={"ticket_id": ticket.ticket_id, "step_id": step.step_id}
+            if debug_enabled:
+                logger.debug(
+                    f"_are_all_branch_steps_completed: step {step.step_name} state={step.state}",
+                    extra={"ticket_id": ticket.ticket_id, "step_id": step.step_id}
+                )
+            if step.state in _TERMINAL_STEP_STATES:
+                continue
+            if step.step_type != StepType.APPROVAL_STEP:
+                if debug_enabled:
+                    logger.debug(
+                        f"_are_all_branch_steps_completed: step {step.step_name} not in terminal state: {step.state}",
+                        extra={"ticket_id": ticket.ticket_id, "step_id": step.step_id}
+                    )
+                return False
+            open_approval_steps.append(step)
+        
+        if open_approval_steps:
+            # For approval steps, check if all approval tasks are decided
+            tasks_by_step = self.ticket_repo.get_approval_tasks_for_steps(
+                [step.ticket_step_id for step in open_approval_steps]
             )
-            if step.state not in [StepState.COMPLETED, StepState.REJECTED, StepState.CANCELLED, StepState.SKIPPED]:
-                # For approval steps, check if all approval tasks are decided
-                if step.step_type == StepType.APPROVAL_STEP:
-                    approval_tasks = self.ticket_repo.get_approval_tasks_for_step(step.ticket_step_id)
-                    if approval_tasks:
-                        all_decided = all(
-                            task.decision in [ApprovalDecision.APPROVED, ApprovalDecision.REJECTED, ApprovalDecision.SKIPPED]
-                            for task in approval_tasks
-                        )
-                        if not all_decided:
-                            logger.info(
-                                f"_are_all_branch_steps_completed: step {step.step_name} has undecided tasks",
-                                extra={"ticket_id": ticket.ticket_id, "step_id": step.step_id}
-                            )
-                            return False
-                    else:
-                        logger.info(
+            for step in open_approval_steps:
+                approval_tasks = tasks_by_step.get(step.ticket_step_id)
+                if not approval_tasks:
+                    if debug_enabled:
+                        logger.debug(
                             f"_are_all_branch_steps_completed: step {step.step_name} has no approval tasks",
                             extra={"ticket_id": ticket.ticket_id, "step_id": step.step_id}
                         )
-                        return False
-                else:
-                    logger.info(
-                        f"_are_all_branch_steps_completed: step {step.step_name} not in terminal state: {step.state}",
-                        extra={"ticket_id": ticket.ticket_id, "step_id": step.step_id}
-                    )
+                    return False
+                if not all(task.decision in _DECIDED_APPROVAL_DECISIONS for task in approval_tasks):
+                    if debug_enabled:
+                        logger.debug(
+                            f"_are_all_branch_steps_completed: step {step.step_name} has undecided tasks",
+                            extra={"ticket_id": ticket.ticket_id, "step_id": step.step_id}
+                        )
                     return False
         
-        logger.info(
-            f"_are_all_branch_steps_completed: all {len(branch_steps)} steps are in terminal state",
-            extra={"ticket_id": ticket.ticket_id, "branch_id": branch_id}
-        )
+        if debug_enabled:
+            logger.debug(
+                f"_are_all_branch_steps_completed: all {len(branch_steps)} steps are in terminal state",
+                extra={"ticket_id": ticket.ticket_id, "branch_id": branch_id}
+            )
         return True
     
     def _mark_branch_completed(
@@ -6467,77 +6793,69 @@ class WorkflowEngine:
         actor: ActorContext,
         correlation_id: str,
         workflow_version: Optional[WorkflowVersion] = None
-    ) -> None:
-        """Mark a parallel branch as completed - only if all steps in the branch are completed"""
-        branch_id = getattr(last_step, 'branch_id', None)
-        logger.info(
-            f"_mark_branch_completed called: branch_id={branch_id}, last_step={last_step.step_id}",
-            extra={"ticket_id": ticket.ticket_id}
-        )
+    ) -> Optional[Ticket]:
+        """
+        Mark a parallel branch as completed - only if all steps in the branch are completed
+        
+        Returns the ticket as last written when nothing has changed it since, so callers
+        can skip their refresh; None if they must re-read it.
+        """
+        branch_id = last_step.branch_id
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            logger.debug(
+                f"_mark_branch_completed called: branch_id={branch_id}, last_step={last_step.step_id}",
+                extra={"ticket_id": ticket.ticket_id}
+            )
         
         if not branch_id:
             logger.warning(f"_mark_branch_completed: no branch_id on step {last_step.step_id}")
-            return
+            return None
         
         # Verify all steps in the branch are completed before marking branch as completed
         if workflow_version:
             all_completed = self._are_all_branch_steps_completed(ticket, branch_id, workflow_version)
-            logger.info(
-                f"_mark_branch_completed: _are_all_branch_steps_completed returned {all_completed}",
-                extra={"ticket_id": ticket.ticket_id, "branch_id": branch_id}
-            )
+            if debug_enabled:
+                logger.debug(
+                    f"_mark_branch_completed: _are_all_branch_steps_completed returned {all_completed}",
+                    extra={"ticket_id": ticket.ticket_id, "branch_id": branch_id}
+                )
             if not all_completed:
                 logger.warning(
                     f"Branch {branch_id} not all steps completed yet, not marking branch as completed",
                     extra={"ticket_id": ticket.ticket_id, "branch_id": branch_id, "last_step": last_step.step_id}
                 )
-                return
+                return None
         
         now = utc_now()
         
-        # Update branch state with retry for concurrency
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                # Refresh ticket to get latest version (parallel branches may have updated it)
-                ticket = self.ticket_repo.get_ticket_or_raise(ticket.ticket_id)
-                active_branches = ticket.active_branches or []
-                
-                for i, branch in enumerate(active_branches):
-                    if branch.branch_id == branch_id:
-                        active_branches[i] = BranchState(
-                            branch_id=branch.branch_id,
-                            branch_name=branch.branch_name,
-                            parent_fork_step_id=branch.parent_fork_step_id,
-                            state=StepState.COMPLETED,
-                            current_step_id=None,  # Clear current_step_id when branch is completed
-                            started_at=branch.started_at,
-                            completed_at=now,
-                            outcome="COMPLETED"
-                        )
-                        break
-                
-                self.ticket_repo.update_ticket(
-                    ticket.ticket_id,
-                    {"active_branches": [b.model_dump(mode="json") for b in active_branches]},
-                    expected_version=ticket.version
-                )
-                break
-            except ConcurrencyError:
-                if attempt == max_retries - 1:
-                    logger.error(f"Failed to mark branch completed after {max_retries} attempts")
-                    raise
-                logger.warning(f"Concurrency conflict on branch completion, retrying (attempt {attempt + 1})")
-        
-        # Audit
-        self.audit_writer.write_event(
+        # Update branch state in place - parallel branches may be updating the same
+        # ticket, so the database patches just this entry instead of the whole list
+        updated_ticket = self.ticket_repo.update_branches(
+            ticket.ticket_id,
+            [branch_id],
+            {
+                "state": _STEP_COMPLETED,
+                "current_step_id": None,  # Clear current_step_id when branch is completed
+                "completed_at": now,
+                "outcome": "COMPLETED"
+            }
+        )
+        # The update returns the ticket as written, so it is reused below until
+        # something else (join activation/transition) mutates it
+        ticket_is_fresh = updated_ticket is not None
+        if ticket_is_fresh:
+            ticket = updated_ticket
+        
+        # Audit (buffered - branches completing in a burst are written in one insert)
+        self.audit_writer.buffer_event(
             ticket_id=ticket.ticket_id,
             ticket_step_id=last_step.ticket_step_id,
             event_type=AuditEventType.BRANCH_COMPLETED,
             actor=actor,
             details={
                 "branch_id": branch_id,
-                "branch_name": getattr(last_step, 'branch_name', '')
+                "branch_name": last_step.branch_name
             },
             correlation_id=correlation_id
         )
@@ -6545,48 +6863,54 @@ class WorkflowEngine:
         # After marking branch as completed, check if join can proceed
         # This handles the case where a branch completes and we need to check join
         if workflow_version:
-            parent_fork_id = getattr(last_step, 'parent_fork_step_id', None)
+            parent_fork_id = last_step.parent_fork_step_id
             if parent_fork_id:
-                # Find the join step for this fork
-                all_steps = self.ticket_repo.get_steps_for_ticket(ticket.ticket_id)
-                for step in all_steps:
-                    if step.step_type == StepType.JOIN_STEP:
-                        join_step_def = self._find_step_definition(step.step_id, workflow_version)
-                        if join_step_def and join_step_def.get("source_fork_step_id") == parent_fork_id:
-                            # Refresh ticket to get latest branch states
-                            ticket = self.ticket_repo.get_ticket_or_raise(ticket.ticket_id)
-                            
-                            # Check if join can proceed (regardless of join step state)
-                            if self._check_join_completion(ticket, step, join_step_def, workflow_version):
-                                logger.info(
-                                    f"Join step {step.step_id} can proceed after branch {branch_id} completion",
-                                    extra={"ticket_id": ticket.ticket_id, "join_step": step.step_id, "branch_id": branch_id}
-                                )
-                                
-                                # If join step is NOT_STARTED, activate it first
-                                if step.state == StepState.NOT_STARTED:
-                                    logger.info(
-                                        f"Activating join step {step.step_id} as it can proceed",
-                                        extra={"ticket_id": ticket.ticket_id, "join_step": step.step_id}
-                                    )
-                                    self._activate_step(ticket, step, workflow_version, actor, correlation_id)
-                                elif step.state == StepState.ACTIVE:
-                                    # Join step is active, proceed with transition
-                                    self._transition_after_join(ticket, step, workflow_version, actor, correlation_id)
-                                # If COMPLETED, already transitioned - nothing to do
-                            else:
-                                logger.debug(
-                                    f"Join step {step.step_id} cannot proceed yet - waiting for more branches",
-                                    extra={"ticket_id": ticket.ticket_id, "join_step": step.step_id, "branch_id": branch_id}
-                                )
-                            break
+                # Find the join step for this fork (indexed by source fork)
+                join_step, join_step_def = self._find_join_for_fork(
+                    ticket.ticket_id, parent_fork_id, workflow_version
+                )
+                if join_step:
+                    # Refresh ticket to get latest branch states
+                    if not ticket_is_fresh:
+                        ticket = self.ticket_repo.get_ticket_or_raise(ticket.ticket_id)
+                        ticket_is_fresh = True
+                    
+                    # Check if join can proceed (regardless of join step state)
+                    if self._check_join_completion(ticket, join_step, join_step_def, workflow_version):
+                        ticket_is_fresh = False
+                        logger.info(
+                            f"Join step {join_step.step_id} can proceed after branch {branch_id} completion",
+                            extra={"ticket_id": ticket.ticket_id, "join_step": join_step.step_id, "branch_id": branch_id}
+                        )
+                        
+                        # If join step is NOT_STARTED, activate it first
+                        if join_step.state == StepState.NOT_STARTED:
+                            logger.info(
+                                f"Activating join step {join_step.step_id} as it can proceed",
+                                extra={"ticket_id": ticket.ticket_id, "join_step": join_step.step_id}
+                            )
+                            self._activate_step(ticket, join_step, workflow_version, actor, correlation_id)
+                        elif join_step.state == StepState.ACTIVE:
+                            # Join step is active, proceed with transition
+                            self._transition_after_join(ticket, join_step, workflow_version, actor, correlation_id)
+                        # If COMPLETED, already transitioned - nothing to do
+                    elif debug_enabled:
+                        logger.debug(
+                            f"Join step {join_step.step_id} cannot proceed yet - waiting for more branches",
+                            extra={"ticket_id": ticket.ticket_id, "join_step": join_step.step_id, "branch_id": branch_id}
+                        )
         
         # After marking branch complete, check if there's a pending NOTIFY to activate
         # This handles the ANY/MAJORITY case where JOIN already proceeded but NOTIFY was deferred
         if workflow_version:
-            ticket = self.ticket_repo.get_ticket_or_raise(ticket.ticket_id)
+            if not ticket_is_fresh:
+                ticket = self.ticket_repo.get_ticket_or_raise(ticket.ticket_id)
+                ticket_is_fresh = True
             if ticket.pending_end_step_id:
                 self._try_activate_pending_notify(ticket, workflow_version, actor, correlation_id)
+                return None
+        
+        return ticket if ticket_is_fresh else None
     
     def _validate_form_values(
         self,
@@ -6604,53 +6928,47 @@ class WorkflowEngine:
             field_definitions: List of field definitions
             sections: Optional list of section definitions (to handle repeating sections)
         """
-        import re
-        
         errors = []
-        sections = sections or []
-        
-        # Build a map of section_id -> section for quick lookup
-        section_map = {s.get("section_id"): s for s in sections}
-        
-        # Group fields by section
-        fields_by_section = {}
-        ungrouped_fields = []
-        for field in field_definitions:
-            section_id = field.get("section_id")
-            if section_id:
-                if section_id not in fields_by_section:
-                    fields_by_section[section_id] = []
-                fields_by_section[section_id].append(field)
-            else:
-                ungrouped_fields.append(field)
+        
+        # Compile field plans and section metadata in one pass
+        # (repeating sections re-validate the same fields for every row)
+        section_plans, ungrouped_fields = _compile_form_plan(field_definitions, sections or [])
         
         # Validate fields in repeating sections
-        for section_id, section_fields in fields_by_section.items():
-            section = section_map.get(section_id, {})
-            is_repeating = section.get("is_repeating", False)
+        for section in section_plans:
+            section_fields = section.fields
             
-            if is_repeating:
+            if section.is_repeating:
                 # For repeating sections, values are in form_values["__section_<sectionId>"]
-                section_key = f"__section_{section_id}"
-                rows = form_values.get(section_key, [])
+                rows = form_values.get(section.section_key, [])
                 
                 if not isinstance(rows, list):
                     rows = []
                 
                 # Check minimum rows requirement
-                min_rows = section.get("min_rows", 0) or 0
-                section_title = section.get("section_title", f"Section {section_id}")
+                min_rows = section.min_rows
                 if min_rows > 0 and len(rows) < min_rows:
                     errors.append(
-                        f"{section_title} requires at least {min_rows} row{'s' if min_rows > 1 else ''}"
+                        f"{section.title} requires at least {min_rows} row{'s' if min_rows > 1 else ''}"
                     )
                 
+                # Conditional requirements that only read top-level values give the
+                # same answer for every row, so evaluate them once for the section
+                top_level_required = [
+                    self._is_field_required(field.required, field.conditional_requirements, form_values)
+                    if field.conditional_requirements else field.required
+                    for field in section_fields
+                ]
+                
                 # Validate each row
                 for row_index, row in enumerate(rows):
                     row_label = f"Row {row_index + 1}"
-                    for field in section_fields:
+                    for field, required in zip(section_fields, top_level_required):
+                        # A rule reading a key present in the row must be re-evaluated for it
+                        if field.conditional_requirements and not field.conditional_field_keys.isdisjoint(row):
+                            required = None
                         field_errors = self._validate_single_field(
-                            field, row, form_values, row_label, row
+                            field, row, form_values, row_label, row, is_required=required
                         )
                         errors.extend(field_errors)
             else:
@@ -6668,39 +6986,36 @@ class WorkflowEngine:
     
     def _validate_single_field(
         self,
-        field: Dict[str, Any],
+        field: _FieldPlan,
         value_source: Dict[str, Any],
         all_form_values: Dict[str, Any],
         row_label: str = None,
-        row_context: Dict[str, Any] = None
+        row_context: Dict[str, Any] = None,
+        is_required: Optional[bool] = None
     ) -> List[str]:
         """
         Validate a single field.
         
         Args:
-            field: Field definition
+            field: Compiled field plan (see _compile_field_plan)
             value_source: Where to look up the field value (row dict for repeating sections)
             all_form_values: All form values (for conditional requirements referencing other fields)
             row_label: Optional label for error messages in repeating sections
             row_context: Optional row context for conditional requirements in repeating sections
+            is_required: Already-evaluated required flag, if the caller has one
         """
-        import re
-        
         errors = []
         
-        field_key = field.get("field_key")
-        field_label = field.get("field_label", field_key)
-        field_type = field.get("field_type", "TEXT")
-        static_required = field.get("required", False)
-        validation = field.get("validation", {}) or {}
-        conditional_requirements = field.get("conditional_requirements", []) or []
-        
         # Determine if field is required (static or conditional)
-        is_required = self._is_field_required(
-            static_required, conditional_requirements, all_form_values, row_context
-        )
+        if is_required is None:
+            if field.conditional_requirements:
+                is_required = self._is_field_required(
+                    field.required, field.conditional_requirements, all_form_values, row_context
+                )
+            else:
+                is_required = field.required
         
-        value = value_source.get(field_key)
+        value = value_source.get(field.key)
         
         # Check if value is empty
         is_empty = (
@@ -6711,7 +7026,7 @@ class WorkflowEngine:
         
         # Required check
         if is_required and is_empty:
-            label = f"{field_label} ({row_label})" if row_label else field_label
+            label = f"{field.label} ({row_label})" if row_label else field.label
             errors.append(f"{label} is required")
             return errors
         
@@ -6719,66 +7034,94 @@ class WorkflowEngine:
         if is_empty:
             return errors
         
-        # Text length validation (for TEXT and TEXTAREA)
-        if field_type in ("TEXT", "TEXTAREA"):
-            text_value = str(value)
-            char_count = len(text_value)
-            
-            min_length = validation.get("min_length")
-            max_length = validation.get("max_length")
-            regex_pattern = validation.get("regex_pattern")
+        # Type-specific validation
+        if field.validator:
+            label = f"{field.label} ({row_label})" if row_label else field.label
+            errors.extend(getattr(self, field.validator)(
+                field, value, label, all_form_values, row_context, row_label
+            ))
+        
+        return errors
+    
+    def _validate_text_value(
+        self,
+        field: _FieldPlan,
+        value: Any,
+        label: str,
+        all_form_values: Dict[str, Any],
+        row_context: Dict[str, Any] = None,
+        row_label: str = None
+    ) -> List[str]:
+        """Text length and regex validation (TEXT and TEXTAREA)"""
+        errors = []
+        text_value = str(value)
+        char_count = len(text_value)
+        
+        min_length = field.min_length
+        max_length = field.max_length
+        
+        if min_length and char_count < min_length:
+            errors.append(
+                f"{label} must be at least {min_length} characters (currently {char_count})"
+            )
+        
+        if max_length and char_count > max_length:
+            errors.append(
+                f"{label} must not exceed {max_length} characters (currently {char_count})"
+            )
+        
+        if field.regex_pattern:
+            if field.regex is None:
+                # Invalid regex pattern - skip validation
+                logger.warning(f"Invalid regex pattern for field {field.key}: {field.regex_pattern}")
+            elif not field.regex.match(text_value):
+                errors.append(f"{label} format is invalid")
+        
+        return errors
+    
+    def _validate_number_value(
+        self,
+        field: _FieldPlan,
+        value: Any,
+        label: str,
+        all_form_values: Dict[str, Any],
+        row_context: Dict[str, Any] = None,
+        row_label: str = None
+    ) -> List[str]:
+        """Numeric range validation (NUMBER)"""
+        errors = []
+        try:
+            num_value = float(value) if not isinstance(value, (int, float)) else value
             
-            if min_length and char_count < min_length:
-                label = f"{field_label} ({row_label})" if row_label else field_label
-                errors.append(
-                    f"{label} must be at least {min_length} characters (currently {char_count})"
-                )
+            min_value = field.min_value
+            max_value = field.max_value
             
-            if max_length and char_count > max_length:
-                label = f"{field_label} ({row_label})" if row_label else field_label
-                errors.append(
-                    f"{label} must not exceed {max_length} characters (currently {char_count})"
-                )
+            if min_value is not None and num_value < min_value:
+                errors.append(f"{label} must be at least {min_value}")
             
-            if regex_pattern:
-                try:
-                    if not re.match(regex_pattern, text_value):
-                        label = f"{field_label} ({row_label})" if row_label else field_label
-                        errors.append(f"{label} format is invalid")
-                except re.error:
-                    # Invalid regex pattern - skip validation
-                    logger.warning(f"Invalid regex pattern for field {field_key}: {regex_pattern}")
-        
-        # Number validation
-        elif field_type == "NUMBER":
-            try:
-                num_value = float(value) if not isinstance(value, (int, float)) else value
-                
-                min_value = validation.get("min_value")
-                max_value = validation.get("max_value")
-                
-                if min_value is not None and num_value < min_value:
-                    label = f"{field_label} ({row_label})" if row_label else field_label
-                    errors.append(f"{label} must be at least {min_value}")
-                
-                if max_value is not None and num_value > max_value:
-                    label = f"{field_label} ({row_label})" if row_label else field_label
-                    errors.append(f"{label} must not exceed {max_value}")
-            except (ValueError, TypeError):
-                label = f"{field_label} ({row_label})" if row_label else field_label
-                errors.append(f"{label} must be a valid number")
-        
-        # Date validation
-        elif field_type == "DATE":
-            date_error = self._validate_date_field(
-                value, field_label, validation, conditional_requirements,
-                all_form_values, row_context, row_label
-            )
-            if date_error:
-                errors.append(date_error)
+            if max_value is not None and num_value > max_value:
+                errors.append(f"{label} must not exceed {max_value}")
+        except (ValueError, TypeError):
+            errors.append(f"{label} must be a valid number")
         
         return errors
     
+    def _validate_date_value(
+        self,
+        field: _FieldPlan,
+        value: Any,
+        label: str,
+        all_form_values: Dict[str, Any],
+        row_context: Dict[str, Any] = None,
+        row_label: str = None
+    ) -> List[str]:
+        """Static and conditional date rules (DATE)"""
+        date_error = self._validate_date_field(
+            value, field.label, field.validation, field.conditional_requirements,
+            all_form_values, row_context, row_label
+        )
+        return [date_error] if date_error else []
+    
     def _is_field_required(
         self,
         static_required: bool,
@@ -6857,19 +7200,22 @@ class WorkflowEngine:
         if not additional_conditions:
             return primary_result
         
-        # Get logic (default: AND)
+        # Apply AND (default) or OR logic, stopping at the first deciding condition
         logic = when.get("logic", "AND")
-        
-        # Evaluate all conditions including primary
-        all_results = [primary_result]
-        for condition in additional_conditions:
-            all_results.append(self._evaluate_single_condition(condition, form_values, row_context))
-        
-        # Apply AND or OR logic
         if logic == "AND":
-            return all(all_results)
+            if not primary_result:
+                return False
+            return all(
+                self._evaluate_single_condition(condition, form_values, row_context)
+                for condition in additional_conditions
+            )
         else:  # OR
-            return any(all_results)
+            if primary_result:
+                return True
+            return any(
+                self._evaluate_single_condition(condition, form_values, row_context)
+                for condition in additional_conditions
+            )
     
     def _evaluate_condition(
         self,
@@ -6924,8 +7270,7 @@ class WorkflowEngine:
             elif isinstance(value, datetime):
                 date_value = value.date()
             elif isinstance(value, str):
-                # Try ISO format first
-                date_value = datetime.strptime(value.split('T')[0], '%Y-%m-%d').date()
+                date_value = _parse_iso_date(value)
             else:
                 return None  # Skip validation for unexpected types
         except (ValueError, TypeError):
@@ -6988,13 +7333,29 @@ class WorkflowEngine:
         
         logger.info(f"Linking {len(attachment_ids)} attachments to ticket {ticket_id}: {attachment_ids}")
         
+        if not attachment_ids:
+            return
+        
+        # Client-supplied ids may repeat; two concurrent moves of one file would race
+        attachment_ids = list(dict.fromkeys(attachment_ids))
+        
         attachment_service = AttachmentService()
-        for att_id in attachment_ids:
-            try:
-                attachment_service.move_temp_attachment(att_id, ticket_id)
-                logger.info(f"Successfully linked attachment {att_id} to ticket {ticket_id}")
-            except Exception as e:
-                logger.error(f"Failed to link attachment {att_id} to ticket {ticket_id}: {e}", exc_info=True)
+        # Each move is a file rename plus a DB write, so the moves run side by side
+        with ThreadPoolExecutor(
+            max_workers=min(_ATTACHMENT_MOVE_WORKERS, len(attachment_ids)),
+            thread_name_prefix="attachment-move"
+        ) as executor:
+            futures = {
+                executor.submit(attachment_service.move_temp_attachment, att_id, ticket_id): att_id
+                for att_id in attachment_ids
+            }
+            for future in as_completed(futures):
+                att_id = futures[future]
+                try:
+                    future.result()
+                    logger.info(f"Successfully linked attachment {att_id} to ticket {ticket_id}")
+                except Exception as e:
+                    logger.error(f"Failed to link attachment {att_id} to ticket {ticket_id}: {e}", exc_info=True)
     
     def _complete_ticket(
         self,
@@ -7005,51 +7366,42 @@ class WorkflowEngine:
         """Complete ticket and cancel any remaining orphan steps (from incomplete branches)"""
         now = utc_now()
         
-        # Refresh ticket to get latest version
-        ticket = self.ticket_repo.get_ticket_or_raise(ticket.ticket_id)
-        
         # Cancel all remaining non-terminal steps (orphan tasks/approvals in branches)
-        # This can happen with ANY/MAJORITY join modes where not all branches complete
-        all_steps = self.ticket_repo.get_steps_for_ticket(ticket.ticket_id)
-        cancellable_states = {StepState.NOT_STARTED, StepState.ACTIVE, StepState.WAITING_FOR_APPROVAL}
-        
-        for remaining_step in all_steps:
-            if remaining_step.state in cancellable_states:
-                new_state = StepState.CANCELLED
-                try:
-                    # Re-fetch step to get latest version
-                    step_latest = self.ticket_repo.get_step(remaining_step.ticket_step_id)
-                    if step_latest and step_latest.state in cancellable_states:
-                        self.ticket_repo.update_step(
-                            remaining_step.ticket_step_id,
-                            {
-                                "state": new_state.value,
-                                "outcome": "CANCELLED",
-                                "completed_at": now
-                            },
-                            expected_version=step_latest.version
-                        )
-                        logger.info(
-                            f"Cancelled orphan step {remaining_step.step_id} (was {remaining_step.state.value})",
-                            extra={"ticket_id": ticket.ticket_id, "step_id": remaining_step.step_id}
-                        )
-                except Exception as e:
-                    logger.warning(f"Could not cancel orphan step {remaining_step.step_id}: {e}")
+        # This can happen with ANY/MAJORITY join modes where not all branches complete.
+        # One conditional bulk write; steps that moved on concurrently are left alone.
+        try:
+            cancelled_count = self.ticket_repo.update_steps_in_states(
+                ticket.ticket_id,
+                _ORPHAN_STEP_STATE_VALUES,
+                {
+                    "state": _STEP_CANCELLED,
+                    "outcome": "CANCELLED",
+                    "completed_at": now
+                }
+            )
+            if cancelled_count:
+                logger.info(
+                    f"Cancelled {cancelled_count} orphan steps",
+                    extra={"ticket_id": ticket.ticket_id}
+                )
+        except Exception as e:
+            logger.warning(f"Could not cancel orphan steps: {e}", extra={"ticket_id": ticket.ticket_id})
         
-        # Re-fetch ticket version after step updates
+        # Refresh ticket to get latest version
         ticket = self.ticket_repo.get_ticket_or_raise(ticket.ticket_id)
         
         self.ticket_repo.update_ticket(
             ticket.ticket_id,
             {
-                "status": TicketStatus.COMPLETED.value,
+                "status": _TICKET_COMPLETED,
                 "completed_at": now
             },
             expected_version=ticket.version
         )
         
-        self.audit_writer.write_ticket_completed(
+        self.audit_writer.buffer_event(
             ticket_id=ticket.ticket_id,
+            event_type=AuditEventType.TICKET_COMPLETED,
             actor=actor,
             correlation_id=correlation_id
         )
@@ -7064,20 +7416,22 @@ class WorkflowEngine:
         actor: ActorContext
     ) -> Dict[str, Any]:
         """Build response after action"""
+        # Write buffered audit events first so newest_audit_events includes them
+        self.audit_writer.flush()
         ticket = self.ticket_repo.get_ticket_or_raise(ticket_id)
         steps = self.ticket_repo.get_steps_for_ticket(ticket_id)
         
-        # Get current step
-        current_step = None
+        # Get current step (first step wins on duplicate step_ids, as in a scan)
+        steps_by_id: Dict[str, TicketStep] = {}
         for step in steps:
-            if step.step_id == ticket.current_step_id:
-                current_step = step
-                break
+            steps_by_id.setdefault(step.step_id, step)
+        current_step = steps_by_id.get(ticket.current_step_id)
         
         # Get actionable tasks
+        actions_by_step = self.permission_guard.get_available_actions_bulk(actor, ticket, steps)
         actionable_tasks = []
         for step in steps:
-            actions = self.permission_guard.get_available_actions(actor, ticket, step)
+            actions = actions_by_step.get(step.ticket_step_id)
             if actions:
                 actionable_tasks.append({
                     "ticket_step_id": step.ticket_step_id,
@@ -7095,13 +7449,11 @@ class WorkflowEngine:
                 })
         
         # Get recent audit events
-        from ..repositories.audit_repo import AuditRepository
-        audit_repo = AuditRepository()
-        recent_events = audit_repo.get_events_for_ticket(ticket_id, limit=5)
+        recent_events = AuditRepository().get_events_for_ticket(ticket_id, limit=5)
         
         return {
             "ticket": ticket.model_dump(mode="json"),
             "current_step": current_step.model_dump(mode="json") if current_step else None,
             "actionable_tasks": actionable_tasks,
-            "newest_audit_events": [e.model_dump(mode="json") for e in recent_events]
+            "newest_audit_events": _AUDIT_EVENTS_ADAPTER.dump_python(recent_events, mode="json")
         }
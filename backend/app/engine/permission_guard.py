@@ -1,9 +1,12 @@
 """Permission Guard - Authorization enforcement for all actions
 Updated: Force reload for AAD ID matching fix
 """
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+import logging
+from contextlib import contextmanager
+from enum import IntFlag, auto
+from typing import Any, Dict, Iterator, List, Optional, Tuple, TYPE_CHECKING
 
-from ..domain.models import Ticket, TicketStep, ActorContext, UserSnapshot
+from ..domain.models import Ticket, TicketStep, ActorContext, UserSnapshot, InfoRequest, ApprovalTask
 from ..domain.enums import StepType, StepState, TicketStatus
 from ..utils.logger import get_logger
 
@@ -13,6 +16,157 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
+# Ticket statuses in which no step action is allowed
+_FINAL_TICKET_STATUSES = frozenset({
+    TicketStatus.COMPLETED,
+    TicketStatus.REJECTED,
+    TicketStatus.CANCELLED,
+    TicketStatus.SKIPPED,
+})
+
+# Ticket statuses from which the requester can no longer cancel
+_UNCANCELLABLE_TICKET_STATUSES = frozenset({
+    TicketStatus.COMPLETED,
+    TicketStatus.REJECTED,
+    TicketStatus.CANCELLED,
+})
+
+# Step states in which no action is allowed
+_CLOSED_STEP_STATES = frozenset({
+    StepState.REJECTED,
+    StepState.CANCELLED,
+    StepState.COMPLETED,
+    StepState.SKIPPED,
+})
+
+# Approval step states in which the approver may approve/reject (incl. while waiting for info)
+_APPROVER_ACT_STATES = frozenset({
+    StepState.WAITING_FOR_APPROVAL,
+    StepState.WAITING_FOR_REQUESTER,
+    StepState.WAITING_FOR_AGENT,
+})
+_APPROVAL_NOTE_STATES = _APPROVER_ACT_STATES | {StepState.WAITING_FOR_CR}
+
+# Task step states in which notes may be added and the task (re)assigned
+_TASK_NOTE_STATES = frozenset({
+    StepState.ACTIVE,
+    StepState.ON_HOLD,
+    StepState.WAITING_FOR_REQUESTER,
+    StepState.WAITING_FOR_AGENT,
+    StepState.WAITING_FOR_CR,
+})
+_TASK_ASSIGN_STATES = frozenset({StepState.ACTIVE, StepState.WAITING_FOR_APPROVAL})
+
+# Step states in which an info request is awaiting a response
+_WAITING_FOR_INFO_STATES = frozenset({StepState.WAITING_FOR_REQUESTER, StepState.WAITING_FOR_AGENT})
+
+class _ActorRole(IntFlag):
+    """What the actor is to a step, as far as step actions are concerned"""
+    NONE = 0
+    REQUESTER = auto()
+    MANAGER = auto()
+    ASSIGNED = auto()
+    PARALLEL_APPROVER = auto()
+    INFO_TARGET = auto()
+    # Listed in the raw approval step's parallel_pending_approvers (email match only)
+    PENDING_APPROVER = auto()
+    # Only resolved when all_steps is given
+    PREVIOUS_APPROVER = auto()
+    TASK_APPROVER = auto()
+
+
+# Ticket statuses and step states in which no action is listed
+_LISTING_CLOSED_TICKET_STATUSES = _FINAL_TICKET_STATUSES | {TicketStatus.WAITING_FOR_CR}
+_LISTING_CLOSED_STEP_STATES = _CLOSED_STEP_STATES | {StepState.WAITING_FOR_CR}
+
+_ActionRules = Tuple[Tuple[_ActorRole, frozenset], ...]
+
+_APPROVER_DECIDE_RULES: _ActionRules = (
+    (_ActorRole.ASSIGNED | _ActorRole.PARALLEL_APPROVER, _APPROVER_ACT_STATES),
+)
+_RESPOND_INFO_RULES: _ActionRules = (
+    (_ActorRole.INFO_TARGET, _WAITING_FOR_INFO_STATES),
+    (_ActorRole.REQUESTER, frozenset({StepState.WAITING_FOR_REQUESTER})),
+)
+_TASK_ASSIGN_RULES: _ActionRules = (
+    (_ActorRole.MANAGER | _ActorRole.TASK_APPROVER, _TASK_ASSIGN_STATES),
+)
+# Roles that may still add notes while the ticket or step waits for a Change Request
+_CR_NOTE_ROLES = (
+    _ActorRole.REQUESTER | _ActorRole.MANAGER | _ActorRole.ASSIGNED | _ActorRole.PENDING_APPROVER
+)
+_TASK_WORK_RULES: _ActionRules = ((_ActorRole.ASSIGNED, frozenset({StepState.ACTIVE})),)
+
+# Step actions per step type. An action is allowed if any of its (roles, states) rules
+# matches: the actor holds one of the roles and the step is in one of the states.
+_STEP_ACTION_RULES: Dict[StepType, Dict[str, _ActionRules]] = {
+    StepType.FORM_STEP: {
+        "submit_form": ((_ActorRole.REQUESTER, frozenset({StepState.ACTIVE})),),
+    },
+    StepType.APPROVAL_STEP: {
+        "approve": _APPROVER_DECIDE_RULES,
+        "reject": _APPROVER_DECIDE_RULES,
+        "request_info": (
+            (_ActorRole.ASSIGNED | _ActorRole.PARALLEL_APPROVER, frozenset({StepState.WAITING_FOR_APPROVAL})),
+        ),
+        "add_note": (
+            (_ActorRole.ASSIGNED | _ActorRole.PARALLEL_APPROVER | _ActorRole.MANAGER, _APPROVAL_NOTE_STATES),
+        ),
+        "respond_info": _RESPOND_INFO_RULES,
+    },
+    StepType.TASK_STEP: {
+        "complete_task": _TASK_WORK_RULES,
+        "request_info": _TASK_WORK_RULES,
+        "add_note": (
+            (_ActorRole.ASSIGNED | _ActorRole.MANAGER | _ActorRole.PREVIOUS_APPROVER, _TASK_NOTE_STATES),
+        ),
+        "respond_info": _RESPOND_INFO_RULES,
+        "assign": _TASK_ASSIGN_RULES,
+        "reassign": _TASK_ASSIGN_RULES,
+    },
+}
+
+# Actions listed by get_available_actions per step type, in listing order
+_LISTED_ACTIONS: Dict[StepType, Tuple[str, ...]] = {
+    StepType.FORM_STEP: ("submit_form",),
+    StepType.APPROVAL_STEP: ("approve", "reject", "request_info", "respond_info"),
+    StepType.TASK_STEP: ("complete_task", "request_info", "respond_info", "assign", "reassign"),
+}
+
+
+def _build_allowed_roles() -> Dict[Tuple[StepType, StepState, str], _ActorRole]:
+    """Flatten _STEP_ACTION_RULES into (step_type, state, action) -> roles allowed"""
+    allowed: Dict[Tuple[StepType, StepState, str], _ActorRole] = {}
+    for step_type, action_rules in _STEP_ACTION_RULES.items():
+        for action, rules in action_rules.items():
+            for roles, states in rules:
+                for state in states:
+                    key = (step_type, state, action)
+                    allowed[key] = allowed.get(key, _ActorRole.NONE) | roles
+    return allowed
+
+
+def _build_listed_roles(
+    allowed: Dict[Tuple[StepType, StepState, str], _ActorRole]
+) -> Dict[Tuple[StepType, StepState], Tuple[Tuple[str, _ActorRole], ...]]:
+    """(step_type, state) -> listed actions possible in that state, with the roles allowed"""
+    listed: Dict[Tuple[StepType, StepState], Tuple[Tuple[str, _ActorRole], ...]] = {}
+    for step_type, actions in _LISTED_ACTIONS.items():
+        for state in StepState:
+            entries = tuple(
+                (action, allowed[(step_type, state, action)])
+                for action in actions
+                if (step_type, state, action) in allowed
+            )
+            if entries:
+                listed[(step_type, state)] = entries
+    return listed
+
+
+_ALLOWED_ROLES = _build_allowed_roles()
+_LISTED_ACTION_ROLES = _build_listed_roles(_ALLOWED_ROLES)
+
+
 class PermissionGuard:
     """
     Permission enforcement for ticket operations
@@ -28,6 +182,121 @@ class PermissionGuard:
     def __init__(self, ticket_repo: "TicketRepository" = None):
         """Initialize with optional ticket repository for info request checks"""
         self._ticket_repo = ticket_repo
+        # Guards live for one request, so the logger level is read once
+        self._info_enabled = logger.isEnabledFor(logging.INFO)
+        # ticket_step_id -> raw step document, only while a permission check is running
+        self._step_raw_cache: Optional[Dict[str, Optional[Dict[str, Any]]]] = None
+        # id(all_steps) -> completed approval steps among them
+        self._completed_approvals_cache: Optional[Dict[int, List[TicketStep]]] = None
+        # id(all_steps) -> (aad_ids, lower-cased emails) of completed approval step assignees
+        self._approver_indexes: Optional[Dict[int, Tuple[frozenset, frozenset]]] = None
+        # ticket_step_id -> open info request (or None)
+        self._info_request_cache: Optional[Dict[str, Optional[InfoRequest]]] = None
+        # ticket_step_id -> approval tasks of the step
+        self._approval_tasks_cache: Optional[Dict[str, List[ApprovalTask]]] = None
+        # ticket_step_id -> lower-cased parallel_pending_approvers of the raw step
+        self._pending_lower_cache: Optional[Dict[str, frozenset]] = None
+    
+    @contextmanager
+    def _step_raw_scope(self) -> Iterator[None]:
+        """
+        Share raw step, open info request and approval task reads and indexes
+        built from all_steps across one permission check or action listing
+        
+        Nested scopes reuse the outermost caches. They are dropped on exit so a
+        later check in the same request sees steps written in between.
+        """
+        if self._step_raw_cache is not None:
+            yield
+            return
+        self._step_raw_cache = {}
+        self._completed_approvals_cache = {}
+        self._approver_indexes = {}
+        self._info_request_cache = {}
+        self._approval_tasks_cache = {}
+        self._pending_lower_cache = {}
+        try:
+            yield
+        finally:
+            self._step_raw_cache = None
+            self._completed_approvals_cache = None
+            self._approver_indexes = None
+            self._info_request_cache = None
+            self._approval_tasks_cache = None
+            self._pending_lower_cache = None
+    
+    def _get_step_raw(self, ticket_step_id: str) -> Optional[Dict[str, Any]]:
+        """Get a raw step document, at most once per permission check"""
+        cache = self._step_raw_cache
+        if cache is None:
+            return self._ticket_repo.get_step_raw(ticket_step_id)
+        if ticket_step_id not in cache:
+            cache[ticket_step_id] = self._ticket_repo.get_step_raw(ticket_step_id)
+        return cache[ticket_step_id]
+    
+    def _get_step_raws(self, ticket_step_ids: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Get several raw step documents, reading those not yet cached in one query"""
+        cache = self._step_raw_cache
+        if cache is None:
+            return self._ticket_repo.get_step_raws(ticket_step_ids)
+        missing = [step_id for step_id in ticket_step_ids if step_id not in cache]
+        if missing:
+            cache.update(self._ticket_repo.get_step_raws(missing))
+        return cache
+    
+    def _get_open_info_request(self, ticket_step_id: str) -> Optional[InfoRequest]:
+        """Get a step's open info request, at most once per permission check"""
+        cache = self._info_request_cache
+        if cache is None:
+            return self._ticket_repo.get_open_info_request_for_step(ticket_step_id)
+        if ticket_step_id not in cache:
+            cache[ticket_step_id] = self._ticket_repo.get_open_info_request_for_step(ticket_step_id)
+        return cache[ticket_step_id]
+    
+    def _get_approval_tasks(self, ticket_step_id: str) -> List[ApprovalTask]:
+        """Get a step's approval tasks, at most once per permission check"""
+        cache = self._approval_tasks_cache
+        if cache is None:
+            return self._ticket_repo.get_approval_tasks_for_step(ticket_step_id)
+        if ticket_step_id not in cache:
+            cache[ticket_step_id] = self._ticket_repo.get_approval_tasks_for_step(ticket_step_id)
+        return cache[ticket_step_id]
+    
+    def _completed_approval_steps(self, all_steps: List[TicketStep]) -> List[TicketStep]:
+        """Completed approval steps of all_steps, filtered once per permission check"""
+        cache = self._completed_approvals_cache
+        if cache is not None and id(all_steps) in cache:
+            return cache[id(all_steps)]
+        completed = [
+            prev_step for prev_step in all_steps
+            if prev_step.step_type == StepType.APPROVAL_STEP and prev_step.state == StepState.COMPLETED
+        ]
+        if cache is not None:
+            cache[id(all_steps)] = completed
+        return completed
+    
+    def _is_previous_approver(self, actor: ActorContext, all_steps: List[TicketStep]) -> bool:
+        """
+        Check if actor is the assignee of a completed approval step in all_steps
+        
+        Same matching as _is_same_user, against an index of those assignees that is
+        built once per permission check.
+        """
+        indexes = self._approver_indexes
+        index = indexes.get(id(all_steps)) if indexes is not None else None
+        if index is None:
+            approvers = [
+                prev_step.assigned_to for prev_step in self._completed_approval_steps(all_steps)
+                if prev_step.assigned_to
+            ]
+            index = (
+                frozenset(a.aad_id for a in approvers if a.aad_id),
+                frozenset(a.email_lower for a in approvers),
+            )
+            if indexes is not None:
+                indexes[id(all_steps)] = index
+        aad_ids, emails_lower = index
+        return (bool(actor.aad_id) and actor.aad_id in aad_ids) or actor.email_lower in emails_lower
     
     def _is_same_user(self, actor: ActorContext, user_snapshot: Optional[UserSnapshot]) -> bool:
         """
@@ -45,7 +314,7 @@ class PermissionGuard:
                 return True
         
         # Fallback: match by email (case-insensitive)
-        if actor.email.lower() == user_snapshot.email.lower():
+        if actor.email_lower == user_snapshot.email_lower:
             return True
         
         return False
@@ -61,7 +330,7 @@ class PermissionGuard:
             return False
         
         try:
-            info_request = self._ticket_repo.get_open_info_request_for_step(ticket_step_id)
+            info_request = self._get_open_info_request(ticket_step_id)
             if not info_request:
                 return False
             
@@ -75,7 +344,7 @@ class PermissionGuard:
             
             # Fallback: match by email (case-insensitive)
             if info_request.requested_from.email:
-                if actor.email.lower() == info_request.requested_from.email.lower():
+                if actor.email_lower == info_request.requested_from.email_lower:
                     return True
             
             return False
@@ -119,28 +388,29 @@ class PermissionGuard:
         Returns:
             True if allowed
         """
+        with self._step_raw_scope():
+            return self._can_act_on_step(actor, ticket, step, action, all_steps)
+    
+    def _can_act_on_step(
+        self,
+        actor: ActorContext,
+        ticket: Ticket,
+        step: TicketStep,
+        action: str,
+        all_steps: list = None
+    ) -> bool:
+        """can_act_on_step body (runs inside a raw step scope)"""
         # Check ticket status allows action
-        if ticket.status in [TicketStatus.COMPLETED, TicketStatus.REJECTED, TicketStatus.CANCELLED, TicketStatus.SKIPPED]:
+        if ticket.status in _FINAL_TICKET_STATUSES:
             return False
         
         # WAITING_FOR_CR: Only allow notes, block all other actions
         if ticket.status == TicketStatus.WAITING_FOR_CR or step.state == StepState.WAITING_FOR_CR:
             if action == "add_note":
                 # Allow notes from requester, assigned user, manager, or any participant
-                if self._is_same_user(actor, ticket.requester):
-                    return True
-                if self._is_same_user(actor, ticket.manager_snapshot):
-                    return True
-                if step.assigned_to and self._is_same_user(actor, step.assigned_to):
-                    return True
-                # Also check if actor is a parallel approver
-                if self._ticket_repo and step.step_type == StepType.APPROVAL_STEP:
-                    step_raw = self._ticket_repo.get_step_raw(step.ticket_step_id)
-                    if step_raw:
-                        parallel_pending = step_raw.get('parallel_pending_approvers', [])
-                        if any(email.lower() == actor.email.lower() for email in parallel_pending):
-                            return True
-                return False
+                return bool(
+                    self._resolve_actor_roles(actor, ticket, step, _CR_NOTE_ROLES, first_match=True)
+                )
             # Block all other actions during CR wait
             logger.info(
                 f"Action {action} blocked: ticket/step is waiting for Change Request resolution",
@@ -149,269 +419,166 @@ class PermissionGuard:
             return False
         
         # Check step state allows action - cannot act on rejected/cancelled/completed/skipped steps
-        if step.state in [StepState.REJECTED, StepState.CANCELLED, StepState.COMPLETED, StepState.SKIPPED]:
+        if step.state in _CLOSED_STEP_STATES:
             return False
         
-        # Handle by step type and action
-        if step.step_type == StepType.FORM_STEP:
-            return self._can_act_form_step(actor, ticket, step, action)
-        
-        elif step.step_type == StepType.APPROVAL_STEP:
-            return self._can_act_approval_step(actor, ticket, step, action)
+        allowed_roles = _ALLOWED_ROLES.get((step.step_type, step.state, action))
+        if not allowed_roles:
+            return False
         
-        elif step.step_type == StepType.TASK_STEP:
-            return self._can_act_task_step(actor, ticket, step, action, all_steps)
+        if step.step_type == StepType.TASK_STEP and not step.assigned_to and action not in ("assign", "reassign"):
+            logger.warning(
+                f"Task step has no assigned_to: step_id={step.step_id}, step_state={step.state}, "
+                f"action={action}, actor_email={actor.email}"
+            )
         
-        return False
-    
-    def _can_act_form_step(
-        self,
-        actor: ActorContext,
-        ticket: Ticket,
-        step: TicketStep,
-        action: str
-    ) -> bool:
-        """Check permissions for form step"""
-        if action == "submit_form":
-            # Debug logging
-            is_same_user = self._is_same_user(actor, ticket.requester)
-            is_active = step.state == StepState.ACTIVE
-            
+        actor_roles = self._resolve_actor_roles(actor, ticket, step, allowed_roles, all_steps, first_match=True)
+        result = bool(actor_roles & allowed_roles)
+        if self._info_enabled:
             logger.info(
-                f"Form permission check: action={action}, step_id={step.step_id}, "
-                f"step_state={step.state}, is_active={is_active}, "
+                f"Step permission check: action={action}, step_id={step.ticket_step_id}, "
+                f"step_type={step.step_type}, step_state={step.state}, "
                 f"actor_email={actor.email}, actor_aad_id={actor.aad_id}, "
-                f"requester_email={ticket.requester.email}, requester_aad_id={ticket.requester.aad_id}, "
-                f"is_same_user={is_same_user}, result={is_same_user and is_active}"
+                f"assigned_to_email={step.assigned_to.email if step.assigned_to else None}, "
+                f"actor_roles={actor_roles!r}, result={result}"
             )
-            
-            # Only requester can submit form
-            return is_same_user and is_active
-        return False
+        return result
+    
+    def _pending_approvers_lower(self, ticket_step_id: str, step_raw: Dict[str, Any]) -> frozenset:
+        """Lower-cased parallel_pending_approvers of a raw step, at most once per permission check"""
+        cache = self._pending_lower_cache
+        pending_lower = cache.get(ticket_step_id) if cache is not None else None
+        if pending_lower is None:
+            pending_lower = frozenset(
+                email.lower() for email in step_raw.get('parallel_pending_approvers') or []
+            )
+            if cache is not None:
+                cache[ticket_step_id] = pending_lower
+        return pending_lower
+    
+    def _is_pending_approver(self, actor: ActorContext, step: TicketStep) -> bool:
+        """Check if actor's email is listed as pending on the raw approval step document"""
+        if not self._ticket_repo or step.step_type != StepType.APPROVAL_STEP:
+            return False
+        step_raw = self._get_step_raw(step.ticket_step_id)
+        return bool(step_raw) and actor.email_lower in self._pending_approvers_lower(step.ticket_step_id, step_raw)
     
-    def _can_act_approval_step(
+    def _is_parallel_approver(
         self,
         actor: ActorContext,
-        ticket: Ticket,
         step: TicketStep,
-        action: str
+        action: Optional[str] = None
     ) -> bool:
-        """Check permissions for approval step"""
-        # For parallel approvals, check if actor is in the pending approvers list
-        parallel_pending = getattr(step, 'parallel_pending_approvers', None) or []
-        parallel_approvers_info = []
+        """Check if actor is one of the pending parallel approvers of an approval step"""
+        parallel_pending = step.parallel_pending_approvers or []
+        parallel_approvers_info = step.parallel_approvers_info or []
         step_raw = None
         
         # If step doesn't have parallel_pending_approvers, try fetching from repo
         if not parallel_pending and self._ticket_repo:
-            step_raw = self._ticket_repo.get_step_raw(step.ticket_step_id)
+            step_raw = self._get_step_raw(step.ticket_step_id)
             if step_raw:
                 parallel_pending = step_raw.get('parallel_pending_approvers', [])
                 parallel_approvers_info = step_raw.get('parallel_approvers_info', [])
         
         # Also get approvers info if not already fetched
         if parallel_pending and not parallel_approvers_info and self._ticket_repo and not step_raw:
-            step_raw = self._ticket_repo.get_step_raw(step.ticket_step_id)
+            step_raw = self._get_step_raw(step.ticket_step_id)
             if step_raw:
                 parallel_approvers_info = step_raw.get('parallel_approvers_info', [])
         
-        is_parallel_approver = False
-        if parallel_pending and action in ["approve", "reject", "request_info", "add_note"]:
-            actor_email_lower = actor.email.lower()
-            
-            # Check by email first
-            is_parallel_approver = any(email.lower() == actor_email_lower for email in parallel_pending)
-            
-            # If not found by email and we have AAD ID, check by AAD ID in parallel_approvers_info
-            if not is_parallel_approver and actor.aad_id and parallel_approvers_info:
-                is_parallel_approver = any(
-                    info.get('aad_id') == actor.aad_id 
-                    for info in parallel_approvers_info 
-                    if info.get('aad_id')
-                )
-            
-            # If still not found and we have AAD ID, check approval_tasks as fallback
-            # (for tickets created before parallel_approvers_info was stored)
-            if not is_parallel_approver and actor.aad_id and self._ticket_repo:
-                approval_tasks = self._ticket_repo.get_approval_tasks_for_step(step.ticket_step_id)
-                for task in approval_tasks:
-                    if task.approver and task.approver.aad_id == actor.aad_id:
-                        # Check if this approver's email is in the pending list
-                        if task.approver.email.lower() in [e.lower() for e in parallel_pending]:
-                            is_parallel_approver = True
-                            logger.info(
-                                f"Matched parallel approver by AAD ID from approval_tasks: {actor.email} -> {task.approver.email}",
-                                extra={"step_id": step.ticket_step_id, "aad_id": actor.aad_id}
-                            )
-                            break
-            
-            if is_parallel_approver:
-                logger.info(
-                    f"Parallel approver check passed for {actor.email} (action={action})",
-                    extra={"step_id": step.ticket_step_id, "parallel_pending": parallel_pending}
-                )
+        if not parallel_pending:
+            return False
+        
+        if step_raw is not None and parallel_pending is step_raw.get('parallel_pending_approvers'):
+            pending_lower = self._pending_approvers_lower(step.ticket_step_id, step_raw)
+        else:
+            pending_lower = frozenset(email.lower() for email in parallel_pending)
+        
+        # Check by email first
+        is_parallel_approver = actor.email_lower in pending_lower
         
-        # Check if actor is the assigned approver (using aad_id or email) OR a parallel approver
-        is_assigned_approver = self._is_same_user(actor, step.assigned_to)
-        
-        logger.info(
-            f"Approval permission check: action={action}, step_id={step.ticket_step_id}, "
-            f"step_state={step.state}, is_assigned_approver={is_assigned_approver}, "
-            f"is_parallel_approver={is_parallel_approver}, "
-            f"actor_email={actor.email}, actor_aad_id={actor.aad_id}, "
-            f"assigned_to_email={step.assigned_to.email if step.assigned_to else None}, "
-            f"assigned_to_aad_id={step.assigned_to.aad_id if step.assigned_to else None}"
-        )
-        
-        if is_assigned_approver or is_parallel_approver:
-            if action in ["approve", "reject"]:
-                # Allow approve/reject when waiting for approval OR when waiting for info response
-                # Approver can still reject even while waiting for info
-                allowed_states = [StepState.WAITING_FOR_APPROVAL, StepState.WAITING_FOR_REQUESTER, StepState.WAITING_FOR_AGENT]
-                result = step.state in allowed_states
+        # If not found by email and we have AAD ID, check by AAD ID in parallel_approvers_info
+        if not is_parallel_approver and actor.aad_id and parallel_approvers_info:
+            is_parallel_approver = any(
+                info.get('aad_id') == actor.aad_id 
+                for info in parallel_approvers_info 
+                if info.get('aad_id')
+            )
+        
+        # If still not found and we have AAD ID, check approval_tasks as fallback
+        # (for tickets created before parallel_approvers_info was stored). Skipped
+        # when parallel_approvers_info already has an AAD ID for every pending approver.
+        if (
+            not is_parallel_approver
+            and actor.aad_id
+            and self._ticket_repo
+            and not pending_lower <= {
+                info.get('email', '').lower() for info in parallel_approvers_info if info.get('aad_id')
+            }
+        ):
+            # Pending emails of the approvers with the actor's AAD ID
+            matched_emails = {
+                task.approver.email_lower
+                for task in self._get_approval_tasks(step.ticket_step_id)
+                if task.approver and task.approver.aad_id == actor.aad_id
+            } & pending_lower
+            if matched_emails:
+                is_parallel_approver = True
                 logger.info(
-                    f"Approve/reject check: step.state={step.state}, allowed_states={allowed_states}, result={result}"
+                    f"Matched parallel approver by AAD ID from approval_tasks: {actor.email} -> {', '.join(sorted(matched_emails))}",
+                    extra={"step_id": step.ticket_step_id, "aad_id": actor.aad_id}
                 )
-                return result
-            if action == "request_info":
-                return step.state == StepState.WAITING_FOR_APPROVAL
-            if action == "add_note":
-                return step.state in [StepState.WAITING_FOR_APPROVAL, StepState.WAITING_FOR_REQUESTER, StepState.WAITING_FOR_AGENT, StepState.WAITING_FOR_CR]
-        
-        # Manager can also add notes to approval steps
-        if action == "add_note":
-            if step.state not in [StepState.WAITING_FOR_APPROVAL, StepState.WAITING_FOR_REQUESTER, StepState.WAITING_FOR_AGENT, StepState.WAITING_FOR_CR]:
-                return False
-            # Allow if actor is the AD manager
-            if self._is_same_user(actor, ticket.manager_snapshot):
-                return True
         
-        # Requester or targeted recipient can respond to info requests
-        if action == "respond_info":
-            # Check for BOTH waiting states - WAITING_FOR_REQUESTER (when asking requester)
-            # and WAITING_FOR_AGENT (when asking another agent/manager)
-            if step.state not in [StepState.WAITING_FOR_REQUESTER, StepState.WAITING_FOR_AGENT]:
-                return False
-            # Check if actor is the targeted recipient of the info request
-            if self._is_info_request_target(actor, step.ticket_step_id):
-                return True
-            # Requester can respond if the step is waiting for them
-            if step.state == StepState.WAITING_FOR_REQUESTER and self._is_same_user(actor, ticket.requester):
-                return True
-            return False
+        if is_parallel_approver and self._info_enabled:
+            logger.info(
+                f"Parallel approver check passed for {actor.email} (action={action})",
+                extra={"step_id": step.ticket_step_id, "parallel_pending": parallel_pending}
+            )
         
-        return False
+        return is_parallel_approver
     
-    def _can_act_task_step(
-        self,
-        actor: ActorContext,
-        ticket: Ticket,
-        step: TicketStep,
-        action: str,
-        all_steps: list = None
-    ) -> bool:
-        """Check permissions for task step"""
-        # Manager (or approver) can assign/reassign
-        if action in ["assign", "reassign"]:
-            if step.state not in [StepState.ACTIVE, StepState.WAITING_FOR_APPROVAL]:
-                return False
-            
-            # Allow if actor is the AD manager
-            if self._is_same_user(actor, ticket.manager_snapshot):
-                return True
-            
-            # Also allow if actor is the approver responsible for this task
-            # For parallel approvals: ONLY the primary approver can assign/reassign
-            # For single approvals: the assigned_to approver can assign/reassign
-            if all_steps:
-                for prev_step in all_steps:
-                    if prev_step.step_type == StepType.APPROVAL_STEP and prev_step.state == StepState.COMPLETED:
-                        if self._ticket_repo:
-                            step_raw = self._ticket_repo.get_step_raw(prev_step.ticket_step_id)
-                            primary_email = step_raw.get("primary_approver_email") if step_raw else None
-                            
-                            if primary_email:
-                                # Parallel approval: ONLY the primary approver can assign
-                                if primary_email.lower() == actor.email.lower():
-                                    logger.info(
-                                        f"Actor {actor.email} is primary approver, allowing task assignment",
-                                        extra={"prev_step_id": prev_step.ticket_step_id}
-                                    )
-                                    return True
-                                
-                                # Also check by AAD ID in parallel_approvers_info
-                                if actor.aad_id:
-                                    parallel_info = step_raw.get("parallel_approvers_info", [])
-                                    for info in parallel_info:
-                                        if info.get("email", "").lower() == primary_email.lower() and info.get("aad_id") == actor.aad_id:
-                                            logger.info(
-                                                f"Actor {actor.email} matched primary approver by AAD ID",
-                                                extra={"prev_step_id": prev_step.ticket_step_id}
-                                            )
-                                            return True
-                            else:
-                                # Single approver: check assigned_to
-                                if self._is_same_user(actor, prev_step.assigned_to):
-                                    return True
-            
+    def _is_task_approver(self, actor: ActorContext, all_steps: List[TicketStep]) -> bool:
+        """
+        Check if actor is the approver responsible for a task, who may (re)assign it
+        
+        For parallel approvals ONLY the primary approver qualifies; for single
+        approvals the assigned approver of the completed approval step does.
+        """
+        if not self._ticket_repo:
             return False
         
-        # Assigned agent can complete, add notes, and request info
-        if step.assigned_to:
-            is_same_user = self._is_same_user(actor, step.assigned_to)
-            logger.info(
-                f"Task step permission check: action={action}, step_id={step.step_id}, "
-                f"step_state={step.state}, has_assigned_to={step.assigned_to is not None}, "
-                f"actor_email={actor.email}, actor_aad_id={actor.aad_id}, "
-                f"assigned_to_email={step.assigned_to.email if step.assigned_to else None}, "
-                f"assigned_to_aad_id={step.assigned_to.aad_id if step.assigned_to else None}, "
-                f"is_same_user={is_same_user}, result={is_same_user and step.state == StepState.ACTIVE if action == 'complete_task' else False}"
-            )
-            
-            if is_same_user:
-                if action == "complete_task":
-                    return step.state == StepState.ACTIVE
-                if action == "add_note":
-                    # Allow adding notes in active, on hold, waiting for info, and waiting for CR states
-                    return step.state in [StepState.ACTIVE, StepState.ON_HOLD, StepState.WAITING_FOR_REQUESTER, StepState.WAITING_FOR_AGENT, StepState.WAITING_FOR_CR]
-                if action == "request_info":
-                    return step.state == StepState.ACTIVE
-        else:
-            logger.warning(
-                f"Task step has no assigned_to: step_id={step.step_id}, step_state={step.state}, "
-                f"action={action}, actor_email={actor.email}"
-            )
+        completed_approvals = self._completed_approval_steps(all_steps)
+        if not completed_approvals:
+            return False
+        step_raws = self._get_step_raws([prev_step.ticket_step_id for prev_step in completed_approvals])
         
-        # Manager/Approver can also add notes (for oversight)
-        if action == "add_note":
-            # Allow adding notes in active, on hold, waiting for info, and waiting for CR states
-            if step.state not in [StepState.ACTIVE, StepState.ON_HOLD, StepState.WAITING_FOR_REQUESTER, StepState.WAITING_FOR_AGENT, StepState.WAITING_FOR_CR]:
-                return False
+        for prev_step in completed_approvals:
+            step_raw = step_raws.get(prev_step.ticket_step_id)
+            primary_email = step_raw.get("primary_approver_email") if step_raw else None
             
-            # Allow if actor is the AD manager
-            if self._is_same_user(actor, ticket.manager_snapshot):
-                return True
-            
-            # Also allow if actor approved a previous approval step
-            if all_steps:
-                for prev_step in all_steps:
-                    if prev_step.step_type == StepType.APPROVAL_STEP and prev_step.state == StepState.COMPLETED:
-                        if self._is_same_user(actor, prev_step.assigned_to):
+            if primary_email:
+                # Parallel approval: ONLY the primary approver can assign
+                if primary_email.lower() == actor.email_lower:
+                    logger.info(
+                        f"Actor {actor.email} is primary approver, allowing task assignment",
+                        extra={"prev_step_id": prev_step.ticket_step_id}
+                    )
+                    return True
+                
+                # Also check by AAD ID in parallel_approvers_info
+                if actor.aad_id:
+                    parallel_info = step_raw.get("parallel_approvers_info", [])
+                    for info in parallel_info:
+                        if info.get("email", "").lower() == primary_email.lower() and info.get("aad_id") == actor.aad_id:
+                            logger.info(
+                                f"Actor {actor.email} matched primary approver by AAD ID",
+                                extra={"prev_step_id": prev_step.ticket_step_id}
+                            )
                             return True
-        
-        # Requester or targeted recipient can respond to info requests
-        if action == "respond_info":
-            # Check for BOTH waiting states - WAITING_FOR_REQUESTER (when asking requester)
-            # and WAITING_FOR_AGENT (when asking another agent/manager)
-            if step.state not in [StepState.WAITING_FOR_REQUESTER, StepState.WAITING_FOR_AGENT]:
-                return False
-            # Check if actor is the targeted recipient of the info request
-            if self._is_info_request_target(actor, step.ticket_step_id):
-                return True
-            # Requester can respond if the step is waiting for them
-            if step.state == StepState.WAITING_FOR_REQUESTER and self._is_same_user(actor, ticket.requester):
+            elif self._is_same_user(actor, prev_step.assigned_to):
+                # Single approver: check assigned_to
                 return True
-            return False
         
         return False
     
@@ -422,11 +589,59 @@ class PermissionGuard:
             return False
         
         # Can only cancel if not already in final state
-        return ticket.status not in [
-            TicketStatus.COMPLETED,
-            TicketStatus.REJECTED,
-            TicketStatus.CANCELLED
-        ]
+        return ticket.status not in _UNCANCELLABLE_TICKET_STATUSES
+    
+    def _resolve_actor_roles(
+        self,
+        actor: ActorContext,
+        ticket: Ticket,
+        step: TicketStep,
+        wanted: _ActorRole,
+        all_steps: Optional[List[TicketStep]] = None,
+        first_match: bool = False
+    ) -> _ActorRole:
+        """
+        Resolve which of the wanted roles actor holds for step
+        
+        Roles that were not asked for are left unset, so repository-backed checks
+        (parallel approvers, info request targets, previous approvers) only run
+        when a rule needs them. With first_match, resolution stops at the first
+        role found, which is all a single permission check needs.
+        """
+        roles = _ActorRole.NONE
+        if wanted & _ActorRole.REQUESTER and self._is_same_user(actor, ticket.requester):
+            roles |= _ActorRole.REQUESTER
+        if wanted & _ActorRole.MANAGER and self._is_same_user(actor, ticket.manager_snapshot):
+            roles |= _ActorRole.MANAGER
+        if wanted & _ActorRole.ASSIGNED and self._is_same_user(actor, step.assigned_to):
+            roles |= _ActorRole.ASSIGNED
+        if roles and first_match:
+            return roles
+        # Every rule accepting a parallel approver also accepts the assigned approver
+        if (
+            wanted & _ActorRole.PARALLEL_APPROVER
+            and not roles & _ActorRole.ASSIGNED
+            and self._is_parallel_approver(actor, step)
+        ):
+            if first_match:
+                return roles | _ActorRole.PARALLEL_APPROVER
+            roles |= _ActorRole.PARALLEL_APPROVER
+        if wanted & _ActorRole.INFO_TARGET and self._is_info_request_target(actor, step.ticket_step_id):
+            if first_match:
+                return roles | _ActorRole.INFO_TARGET
+            roles |= _ActorRole.INFO_TARGET
+        if wanted & _ActorRole.PENDING_APPROVER and self._is_pending_approver(actor, step):
+            if first_match:
+                return roles | _ActorRole.PENDING_APPROVER
+            roles |= _ActorRole.PENDING_APPROVER
+        if all_steps:
+            if wanted & _ActorRole.PREVIOUS_APPROVER and self._is_previous_approver(actor, all_steps):
+                if first_match:
+                    return roles | _ActorRole.PREVIOUS_APPROVER
+                roles |= _ActorRole.PREVIOUS_APPROVER
+            if wanted & _ActorRole.TASK_APPROVER and self._is_task_approver(actor, all_steps):
+                roles |= _ActorRole.TASK_APPROVER
+        return roles
     
     def get_available_actions(
         self,
@@ -434,32 +649,88 @@ class PermissionGuard:
         ticket: Ticket,
         step: TicketStep
     ) -> List[str]:
-        """Get list of actions actor can perform on step"""
-        actions = []
-        
-        if step.step_type == StepType.FORM_STEP:
-            if self.can_act_on_step(actor, ticket, step, "submit_form"):
-                actions.append("submit_form")
-        
-        elif step.step_type == StepType.APPROVAL_STEP:
-            if self.can_act_on_step(actor, ticket, step, "approve"):
-                actions.extend(["approve", "reject"])
-            if self.can_act_on_step(actor, ticket, step, "request_info"):
-                actions.append("request_info")
-            if self.can_act_on_step(actor, ticket, step, "respond_info"):
-                actions.append("respond_info")
-        
-        elif step.step_type == StepType.TASK_STEP:
-            if self.can_act_on_step(actor, ticket, step, "complete_task"):
-                actions.append("complete_task")
-            if self.can_act_on_step(actor, ticket, step, "request_info"):
-                actions.append("request_info")
-            if self.can_act_on_step(actor, ticket, step, "respond_info"):
-                actions.append("respond_info")
-            if self.can_act_on_step(actor, ticket, step, "assign"):
-                actions.append("assign")
-            if self.can_act_on_step(actor, ticket, step, "reassign"):
-                actions.append("reassign")
-        
-        return actions
+        """
+        Get list of actions actor can perform on step
+        
+        The actor's roles are resolved once and every action is then decided from
+        _LISTED_ACTION_ROLES, instead of running can_act_on_step per action.
+        """
+        if ticket.status in _LISTING_CLOSED_TICKET_STATUSES or step.state in _LISTING_CLOSED_STEP_STATES:
+            return []
+        
+        listed = _LISTED_ACTION_ROLES.get((step.step_type, step.state))
+        if not listed:
+            return []
+        
+        # Only resolve the roles that some listed action accepts in the step's current state
+        wanted = _ActorRole.NONE
+        for _, roles in listed:
+            wanted |= roles
+        
+        with self._step_raw_scope():
+            actor_roles = self._resolve_actor_roles(actor, ticket, step, wanted)
+        
+        return [action for action, roles in listed if actor_roles & roles]
+    
+    def get_available_actions_bulk(
+        self,
+        actor: ActorContext,
+        ticket: Ticket,
+        steps: List[TicketStep]
+    ) -> Dict[str, List[str]]:
+        """
+        Get the actions actor can perform on each step, keyed by ticket_step_id
+        
+        Same result as get_available_actions per step, but the ticket-level and
+        terminal-step checks (which deny every action) are made once up front, and
+        the documents role checks read are fetched with one query per collection
+        instead of one per step.
+        """
+        if ticket.status in _FINAL_TICKET_STATUSES:
+            return {step.ticket_step_id: [] for step in steps}
+        
+        with self._step_raw_scope():
+            # Steps waiting on an info request need its recipient for respond_info:
+            # read all of them in one query instead of one per step
+            waiting_step_ids = [
+                step.ticket_step_id for step in steps if step.state in _WAITING_FOR_INFO_STATES
+            ]
+            if self._ticket_repo and waiting_step_ids:
+                self._info_request_cache.update(
+                    self._ticket_repo.get_open_info_requests_for_steps(waiting_step_ids)
+                )
+            
+            # Approval steps the actor may decide as a parallel approver: read the raw
+            # documents of those whose model lacks the approver lists, and the approval
+            # tasks used for AAD ID matching, in one query each
+            approval_steps = [
+                step for step in steps
+                if step.step_type == StepType.APPROVAL_STEP
+                and step.state in _APPROVER_ACT_STATES
+                and not self._is_same_user(actor, step.assigned_to)
+            ]
+            if self._ticket_repo and approval_steps:
+                raw_step_ids = [
+                    step.ticket_step_id for step in approval_steps
+                    if not (step.parallel_pending_approvers and step.parallel_approvers_info)
+                ]
+                if raw_step_ids:
+                    self._step_raw_cache.update(self._ticket_repo.get_step_raws(raw_step_ids))
+                if actor.aad_id:
+                    parallel_step_ids = [
+                        step.ticket_step_id for step in approval_steps
+                        if step.parallel_pending_approvers
+                        or (self._step_raw_cache.get(step.ticket_step_id) or {}).get('parallel_pending_approvers')
+                    ]
+                    if parallel_step_ids:
+                        self._approval_tasks_cache.update(
+                            self._ticket_repo.get_approval_tasks_for_steps(parallel_step_ids)
+                        )
+            return {
+                step.ticket_step_id: (
+                    [] if step.state in _CLOSED_STEP_STATES
+                    else self.get_available_actions(actor, ticket, step)
+                )
+                for step in steps
+            }
 
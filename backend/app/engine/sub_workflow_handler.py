@@ -25,7 +25,9 @@ Key design decisions:
 =============================================================================
 """
 
-from typing import Any, Dict, List, Optional, Tuple
+import logging
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from datetime import datetime
 
 from ..domain.models import (
@@ -46,6 +48,79 @@ from ..utils.time import utc_now, calculate_due_at
 
 logger = get_logger(__name__)
 
+# Step states that are "done" and won't change
+_TERMINAL_STEP_STATES = frozenset({
+    StepState.COMPLETED,
+    StepState.SKIPPED,
+    StepState.CANCELLED,
+    StepState.REJECTED,
+})
+_TERMINAL_STEP_STATE_VALUES = frozenset(state.value for state in _TERMINAL_STEP_STATES)
+
+
+# ============================================================================
+# Step data builders (copy the type-specific step definition keys into data)
+# ============================================================================
+
+def _form_step_data(step_def: Dict[str, Any], step_data: Dict[str, Any]) -> None:
+    # Include form fields and sections
+    if step_def.get("fields"):
+        step_data["fields"] = step_def.get("fields", [])
+    if step_def.get("sections"):
+        step_data["sections"] = step_def.get("sections", [])
+
+
+def _task_step_data(step_def: Dict[str, Any], step_data: Dict[str, Any]) -> None:
+    # Include task instructions and output fields
+    step_data["instructions"] = step_def.get("instructions", "")
+    step_data["execution_notes_required"] = step_def.get("execution_notes_required", True)
+    if step_def.get("output_fields"):
+        step_data["output_fields"] = step_def.get("output_fields", [])
+    elif step_def.get("fields"):  # Backward compatibility
+        step_data["output_fields"] = step_def.get("fields", [])
+
+
+def _approval_step_data(step_def: Dict[str, Any], step_data: Dict[str, Any]) -> None:
+    # Include approval configuration
+    if step_def.get("parallel_approval"):
+        step_data["parallel_approval"] = step_def.get("parallel_approval")
+    if step_def.get("parallel_approvers"):
+        step_data["parallel_approvers"] = step_def.get("parallel_approvers", [])
+
+
+def _notify_step_data(step_def: Dict[str, Any], step_data: Dict[str, Any]) -> None:
+    # Include notification configuration
+    step_data["recipients"] = step_def.get("recipients", ["requester"])
+    step_data["notification_template"] = step_def.get("notification_template", "TICKET_COMPLETED")
+
+
+def _fork_step_data(step_def: Dict[str, Any], step_data: Dict[str, Any]) -> None:
+    # Include fork configuration
+    if step_def.get("branches"):
+        step_data["branches"] = step_def.get("branches", [])
+    if step_def.get("failure_policy"):
+        step_data["failure_policy"] = step_def.get("failure_policy")
+
+
+def _join_step_data(step_def: Dict[str, Any], step_data: Dict[str, Any]) -> None:
+    # Include join configuration
+    if step_def.get("join_mode"):
+        step_data["join_mode"] = step_def.get("join_mode")
+    # CRITICAL: Include source_fork_step_id so Join knows which Fork to wait for
+    if step_def.get("source_fork_step_id"):
+        step_data["source_fork_step_id"] = step_def.get("source_fork_step_id")
+
+
+# Keyed by StepType; str-valued members also match the raw step_type strings
+_STEP_DATA_BUILDERS: Dict[StepType, Callable[[Dict[str, Any], Dict[str, Any]], None]] = {
+    StepType.FORM_STEP: _form_step_data,
+    StepType.TASK_STEP: _task_step_data,
+    StepType.APPROVAL_STEP: _approval_step_data,
+    StepType.NOTIFY_STEP: _notify_step_data,
+    StepType.FORK_STEP: _fork_step_data,
+    StepType.JOIN_STEP: _join_step_data,
+}
+
 
 class SubWorkflowHandler:
     """
@@ -64,6 +139,18 @@ class SubWorkflowHandler:
     ):
         self.workflow_repo = workflow_repo
         self.ticket_repo = ticket_repo
+        # Per-handler (i.e. per-request) caches; published versions are immutable
+        self._version_cache: Dict[Tuple[str, int], Optional[WorkflowVersion]] = {}
+        self._branch_map_cache: Dict[Tuple[str, int], Dict[str, Tuple[str, str, str]]] = {}
+        # (ticket_id, parent step) -> (repo step write count, step_id -> sub-workflow step)
+        self._sub_steps_index_cache: Dict[Tuple[str, str], Tuple[int, Dict[str, TicketStep]]] = {}
+    
+    def _get_version(self, workflow_id: str, version_number: int) -> Optional[WorkflowVersion]:
+        """Get a workflow version by number, reading each (id, number) once per handler"""
+        key = (workflow_id, version_number)
+        if key not in self._version_cache:
+            self._version_cache[key] = self.workflow_repo.get_version_by_number(workflow_id, version_number)
+        return self._version_cache[key]
     
     def expand_sub_workflow(
         self,
@@ -104,21 +191,8 @@ class SubWorkflowHandler:
         sub_workflow_version_num = sub_workflow_step_def.get("sub_workflow_version")
         sub_workflow_name = sub_workflow_step_def.get("sub_workflow_name", "Sub-Workflow")
         
-        logger.info(
-            f"Expanding sub-workflow: {sub_workflow_id} v{sub_workflow_version_num}",
-            extra={
-                "ticket_id": ticket.ticket_id,
-                "parent_step_id": parent_step.ticket_step_id,
-                "sub_workflow_id": sub_workflow_id,
-                "sub_workflow_version": sub_workflow_version_num
-            }
-        )
-        
         # Load the sub-workflow version
-        sub_workflow_version = self.workflow_repo.get_version_by_number(
-            sub_workflow_id,
-            sub_workflow_version_num
-        )
+        sub_workflow_version = self._get_version(sub_workflow_id, sub_workflow_version_num)
         
         if not sub_workflow_version:
             raise WorkflowNotFoundError(
@@ -126,15 +200,15 @@ class SubWorkflowHandler:
             )
         
         # Validate: No nested sub-workflows (Level 1 only)
-        for step_def in sub_workflow_version.definition.steps:
-            if step_def.get("step_type") == StepType.SUB_WORKFLOW_STEP.value:
-                raise ValidationError(
-                    message="Nested sub-workflows are not allowed",
-                    details={
-                        "sub_workflow_id": sub_workflow_id,
-                        "nested_step_id": step_def.get("step_id")
-                    }
-                )
+        nested_step_def = sub_workflow_version.definition.first_sub_workflow_step
+        if nested_step_def:
+            raise ValidationError(
+                message="Nested sub-workflows are not allowed",
+                details={
+                    "sub_workflow_id": sub_workflow_id,
+                    "nested_step_id": nested_step_def.get("step_id")
+                }
+            )
         
         # Build branch map for sub-workflow (if it has fork/join)
         step_to_branch_map = self._build_sub_workflow_branch_map(sub_workflow_version)
@@ -194,15 +268,18 @@ class SubWorkflowHandler:
         # Get start step ID
         start_step_id = sub_workflow_version.definition.get_start_step_id()
         
-        logger.info(
-            f"Expanded sub-workflow with {len(created_steps)} steps",
-            extra={
-                "ticket_id": ticket.ticket_id,
-                "sub_workflow_id": sub_workflow_id,
-                "step_count": len(created_steps),
-                "start_step_id": start_step_id
-            }
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"Expanded sub-workflow {sub_workflow_id} v{sub_workflow_version_num} with {len(created_steps)} steps",
+                extra={
+                    "ticket_id": ticket.ticket_id,
+                    "parent_step_id": parent_step.ticket_step_id,
+                    "sub_workflow_id": sub_workflow_id,
+                    "sub_workflow_version": sub_workflow_version_num,
+                    "step_count": len(created_steps),
+                    "start_step_id": start_step_id
+                }
+            )
         
         return created_steps, sub_workflow_version, start_step_id
     
@@ -215,55 +292,64 @@ class SubWorkflowHandler:
         for steps that are part of branches within the sub-workflow.
         
         This is similar to the logic in engine._create_ticket_steps but
-        extracted for reuse.
+        extracted for reuse. Maps are cached per (workflow_id, version_number).
         """
+        cache_key = (workflow_version.workflow_id, workflow_version.version_number)
+        cached = self._branch_map_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         step_to_branch_map = {}
+        definition = workflow_version.definition
         
-        for step_def in workflow_version.definition.steps:
-            if step_def.get("step_type") == StepType.FORK_STEP.value:
-                fork_step_id = step_def.get("step_id")
-                branches = step_def.get("branches", [])
-                transitions = workflow_version.definition.transitions
+        fork_step_defs = [
+            step_def for step_def in definition.steps
+            if step_def.get("step_type") == StepType.FORK_STEP.value
+        ]
+        if not fork_step_defs:
+            self._branch_map_cache[cache_key] = step_to_branch_map
+            return step_to_branch_map
+        
+        # Use indexed transitions and join steps instead of scanning them per traced step
+        next_step_ids = definition.next_step_ids
+        join_step_ids = {
+            step_def.get("step_id") for step_def in definition.steps
+            if step_def.get("step_type") == StepType.JOIN_STEP.value
+        }
+        
+        for step_def in fork_step_defs:
+            fork_step_id = step_def.get("step_id")
+            branches = step_def.get("branches", [])
+            
+            for branch_def in branches:
+                branch_id = branch_def.get("branch_id")
+                branch_name = branch_def.get("branch_name", "")
+                start_step_id = branch_def.get("start_step_id")
                 
-                for branch_def in branches:
-                    branch_id = branch_def.get("branch_id")
-                    branch_name = branch_def.get("branch_name", "")
-                    start_step_id = branch_def.get("start_step_id")
-                    
-                    if not branch_id or not start_step_id:
+                if not branch_id or not start_step_id:
+                    continue
+                
+                # Trace steps in this branch (the join step is not part of it)
+                queue = deque([start_step_id])
+                visited = set()
+                
+                while queue:
+                    current_step_id = queue.popleft()
+                    if current_step_id in visited:
                         continue
+                    visited.add(current_step_id)
                     
-                    # Trace steps in this branch
-                    queue = [start_step_id]
-                    visited = set()
+                    step_to_branch_map[current_step_id] = (
+                        branch_id,
+                        branch_name,
+                        fork_step_id
+                    )
                     
-                    while queue:
-                        current_step_id = queue.pop(0)
-                        if current_step_id in visited:
-                            continue
-                        visited.add(current_step_id)
-                        
-                        step_to_branch_map[current_step_id] = (
-                            branch_id,
-                            branch_name,
-                            fork_step_id
-                        )
-                        
-                        # Find next steps
-                        for t in transitions:
-                            from_id = t.from_step_id if hasattr(t, 'from_step_id') else t.get("from_step_id")
-                            if from_id == current_step_id:
-                                to_id = t.to_step_id if hasattr(t, 'to_step_id') else t.get("to_step_id")
-                                if to_id and to_id not in visited:
-                                    next_step_def = next(
-                                        (s for s in workflow_version.definition.steps 
-                                         if s.get("step_id") == to_id), 
-                                        None
-                                    )
-                                    if next_step_def and next_step_def.get("step_type") == StepType.JOIN_STEP.value:
-                                        continue
-                                    queue.append(to_id)
+                    for to_id in next_step_ids.get(current_step_id, ()):
+                        if to_id and to_id not in visited and to_id not in join_step_ids:
+                            queue.append(to_id)
         
+        self._branch_map_cache[cache_key] = step_to_branch_map
         return step_to_branch_map
     
     def _build_step_data(
@@ -276,51 +362,12 @@ class SubWorkflowHandler:
         
         This mirrors the logic in engine._create_ticket_steps() to ensure
         sub-workflow steps have proper form fields, instructions, etc.
+        Dispatches through _STEP_DATA_BUILDERS.
         """
+        builder = _STEP_DATA_BUILDERS.get(step_type)
         step_data: Dict[str, Any] = {}
-        
-        if step_type == StepType.FORM_STEP:
-            # Include form fields and sections
-            if step_def.get("fields"):
-                step_data["fields"] = step_def.get("fields", [])
-            if step_def.get("sections"):
-                step_data["sections"] = step_def.get("sections", [])
-                
-        elif step_type == StepType.TASK_STEP:
-            # Include task instructions and output fields
-            step_data["instructions"] = step_def.get("instructions", "")
-            step_data["execution_notes_required"] = step_def.get("execution_notes_required", True)
-            if step_def.get("output_fields"):
-                step_data["output_fields"] = step_def.get("output_fields", [])
-            elif step_def.get("fields"):  # Backward compatibility
-                step_data["output_fields"] = step_def.get("fields", [])
-                
-        elif step_type == StepType.APPROVAL_STEP:
-            # Include approval configuration
-            if step_def.get("parallel_approval"):
-                step_data["parallel_approval"] = step_def.get("parallel_approval")
-            if step_def.get("parallel_approvers"):
-                step_data["parallel_approvers"] = step_def.get("parallel_approvers", [])
-                
-        elif step_type == StepType.NOTIFY_STEP:
-            # Include notification configuration
-            step_data["recipients"] = step_def.get("recipients", ["requester"])
-            step_data["notification_template"] = step_def.get("notification_template", "TICKET_COMPLETED")
-            
-        elif step_type == StepType.FORK_STEP:
-            # Include fork configuration
-            if step_def.get("branches"):
-                step_data["branches"] = step_def.get("branches", [])
-            if step_def.get("failure_policy"):
-                step_data["failure_policy"] = step_def.get("failure_policy")
-                
-        elif step_type == StepType.JOIN_STEP:
-            # Include join configuration
-            if step_def.get("join_mode"):
-                step_data["join_mode"] = step_def.get("join_mode")
-            # CRITICAL: Include source_fork_step_id so Join knows which Fork to wait for
-            if step_def.get("source_fork_step_id"):
-                step_data["source_fork_step_id"] = step_def.get("source_fork_step_id")
+        if builder:
+            builder(step_def, step_data)
         
         return step_data
     
@@ -339,11 +386,29 @@ class SubWorkflowHandler:
         Returns:
             List of TicketSteps belonging to this sub-workflow
         """
-        all_steps = self.ticket_repo.get_steps_for_ticket(ticket_id)
-        return [
-            step for step in all_steps
-            if step.parent_sub_workflow_step_id == parent_sub_workflow_step_id
-        ]
+        return self.ticket_repo.get_steps_by_parent_sub_workflow(ticket_id, parent_sub_workflow_step_id)
+    
+    def get_sub_workflow_steps_by_id(
+        self,
+        ticket_id: str,
+        parent_sub_workflow_step_id: str
+    ) -> Dict[str, TicketStep]:
+        """
+        Get the steps of a sub-workflow instance keyed by step_id (first wins on duplicates)
+        
+        The index is reused until the ticket repository writes steps again.
+        """
+        key = (ticket_id, parent_sub_workflow_step_id)
+        write_count = self.ticket_repo.step_write_count
+        cached = self._sub_steps_index_cache.get(key)
+        if cached is not None and cached[0] == write_count:
+            return cached[1]
+        
+        steps_by_id: Dict[str, TicketStep] = {}
+        for step in self.get_sub_workflow_steps(ticket_id, parent_sub_workflow_step_id):
+            steps_by_id.setdefault(step.step_id, step)
+        self._sub_steps_index_cache[key] = (write_count, steps_by_id)
+        return steps_by_id
     
     def is_sub_workflow_complete(
         self,
@@ -369,6 +434,17 @@ class SubWorkflowHandler:
             - "REJECTED" if failed (depends on failure policy)
             - None if not yet complete
         """
+        # Common case: still running and nothing rejected. Decide that from state
+        # counts before loading the steps, which the rejection policies need.
+        state_counts = self.ticket_repo.count_sub_workflow_steps_by_state(
+            ticket_id,
+            parent_sub_workflow_step_id
+        )
+        if not state_counts.get(StepState.REJECTED.value) and any(
+            state not in _TERMINAL_STEP_STATE_VALUES for state in state_counts
+        ):
+            return False, None
+        
         sub_steps = self.get_sub_workflow_steps(ticket_id, parent_sub_workflow_step_id)
         
         if not sub_steps:
@@ -377,61 +453,57 @@ class SubWorkflowHandler:
             )
             return True, "COMPLETED"  # Empty sub-workflow is considered complete
         
-        # Terminal states (steps that are "done" and won't change)
-        terminal_states = {
-            StepState.COMPLETED, 
-            StepState.SKIPPED, 
-            StepState.CANCELLED,
-            StepState.REJECTED
-        }
-        
-        # Find fork steps to check failure_policy
-        fork_steps = [s for s in sub_steps if s.step_type == StepType.FORK_STEP]
-        
-        # Check for rejected steps
-        rejected_steps = [s for s in sub_steps if s.state == StepState.REJECTED]
+        # Classify the steps in one pass
+        fork_steps = []
+        rejected_steps = []
+        all_terminal = True
+        has_completed = False
+        for step in sub_steps:
+            if step.step_type == StepType.FORK_STEP:
+                fork_steps.append(step)
+            if step.state == StepState.REJECTED:
+                rejected_steps.append(step)
+            elif step.state == StepState.COMPLETED:
+                has_completed = True
+            if step.state not in _TERMINAL_STEP_STATES:
+                all_terminal = False
         
         if rejected_steps:
+            # branch_id -> (fork step, failure_policy) of the (first) fork that owns the branch
+            branch_to_fork: Dict[str, Tuple[TicketStep, str]] = {}
+            for fork_step in fork_steps:
+                fork_data = fork_step.data or {}
+                failure_policy = fork_data.get('failure_policy', 'FAIL_ALL')
+                for b in fork_data.get('branches', []):
+                    branch_to_fork.setdefault(b.get('branch_id'), (fork_step, failure_policy))
+            
             # Check if any rejected step is in a branch with CONTINUE_OTHERS policy
+            continued_step_ids = []
             for rejected_step in rejected_steps:
-                branch_id = getattr(rejected_step, 'branch_id', None)
+                branch_id = rejected_step.branch_id
                 
                 if branch_id:
-                    # Find the fork that owns this branch
-                    for fork_step in fork_steps:
-                        fork_data = fork_step.data or {}
-                        branches = fork_data.get('branches', [])
-                        failure_policy = fork_data.get('failure_policy', 'FAIL_ALL')
-                        
-                        # Check if this branch belongs to this fork
-                        branch_ids = [b.get('branch_id') for b in branches]
-                        
-                        # Now using simple branch_ids consistently, no need for composite handling
-                        if branch_id in branch_ids:
-                            if failure_policy == 'CONTINUE_OTHERS':
-                                logger.info(
-                                    f"Sub-workflow has rejected step in branch with CONTINUE_OTHERS, checking if other branches are done",
-                                    extra={
-                                        "ticket_id": ticket_id,
-                                        "rejected_step": rejected_step.step_id,
-                                        "branch_id": branch_id,
-                                        "failure_policy": failure_policy
-                                    }
-                                )
-                                # Don't immediately fail - let other branches continue
-                                # We'll check completion below
-                                break
-                            else:
-                                # FAIL_ALL or CANCEL_OTHERS - immediate failure
-                                logger.info(
-                                    f"Sub-workflow failed: step {rejected_step.step_id} rejected with {failure_policy} policy",
-                                    extra={
-                                        "ticket_id": ticket_id,
-                                        "parent_sub_workflow_step_id": parent_sub_workflow_step_id,
-                                        "rejected_step_id": rejected_step.step_id
-                                    }
-                                )
-                                return True, "REJECTED"
+                    # Now using simple branch_ids consistently, no need for composite handling
+                    owner = branch_to_fork.get(branch_id)
+                    if owner is None:
+                        continue
+                    fork_step, failure_policy = owner
+                    if failure_policy == 'CONTINUE_OTHERS':
+                        # Don't immediately fail - let other branches continue
+                        # We'll check completion below
+                        continued_step_ids.append(rejected_step.step_id)
+                    else:
+                        # FAIL_ALL or CANCEL_OTHERS - immediate failure
+                        logger.info(
+                            f"Sub-workflow failed: step {rejected_step.step_id} rejected with {failure_policy} policy",
+                            extra={
+                                "ticket_id": ticket_id,
+                                "parent_sub_workflow_step_id": parent_sub_workflow_step_id,
+                                "rejected_step_id": rejected_step.step_id,
+                                "fork_step_id": fork_step.step_id
+                            }
+                        )
+                        return True, "REJECTED"
                 else:
                     # Rejected step not in a branch - immediate failure
                     logger.info(
@@ -443,23 +515,25 @@ class SubWorkflowHandler:
                         }
                     )
                     return True, "REJECTED"
+            
+            if continued_step_ids and logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    f"Sub-workflow has {len(continued_step_ids)} rejected step(s) in branches with CONTINUE_OTHERS, "
+                    f"checking if other branches are done",
+                    extra={
+                        "ticket_id": ticket_id,
+                        "parent_sub_workflow_step_id": parent_sub_workflow_step_id,
+                        "rejected_steps": continued_step_ids
+                    }
+                )
         
         # Check if all steps are in terminal states (including REJECTED for CONTINUE_OTHERS)
-        all_terminal = all(step.state in terminal_states for step in sub_steps)
-        
         if all_terminal:
             # Check if there are any rejected steps
             if rejected_steps:
-                # Sub-workflow completed but with rejections
-                # Check if any non-rejected path completed successfully
-                has_completed = any(step.state == StepState.COMPLETED for step in sub_steps)
-                
-                # Find join steps - if they completed, the sub-workflow succeeded despite branch rejections
-                join_steps = [s for s in sub_steps if s.step_type == StepType.JOIN_STEP]
-                join_completed = any(s.state == StepState.COMPLETED for s in join_steps)
-                
-                if join_completed or has_completed:
-                    # Join completed means workflow continued past the branches
+                # Sub-workflow completed but with rejections. A completed step (a
+                # completed join included) means the workflow continued past them.
+                if has_completed:
                     logger.info(
                         f"Sub-workflow completed despite branch rejection (CONTINUE_OTHERS)",
                         extra={"ticket_id": ticket_id}
@@ -469,7 +543,6 @@ class SubWorkflowHandler:
                     return True, "REJECTED"
             else:
                 # No rejections - check if at least one step is COMPLETED
-                has_completed = any(step.state == StepState.COMPLETED for step in sub_steps)
                 if has_completed:
                     return True, "COMPLETED"
                 else:
@@ -498,11 +571,7 @@ class SubWorkflowHandler:
         if not start_step_id:
             return None
         
-        sub_steps = self.get_sub_workflow_steps(ticket_id, parent_sub_workflow_step_id)
-        return next(
-            (step for step in sub_steps if step.step_id == start_step_id),
-            None
-        )
+        return self.get_sub_workflow_steps_by_id(ticket_id, parent_sub_workflow_step_id).get(start_step_id)
     
     def find_sub_workflow_ticket_step(
         self,
@@ -521,11 +590,7 @@ class SubWorkflowHandler:
         Returns:
             The TicketStep if found, None otherwise
         """
-        sub_steps = self.get_sub_workflow_steps(ticket_id, parent_sub_workflow_step_id)
-        return next(
-            (step for step in sub_steps if step.step_id == step_id),
-            None
-        )
+        return self.get_sub_workflow_steps_by_id(ticket_id, parent_sub_workflow_step_id).get(step_id)
     
     def load_sub_workflow_version(
         self,
@@ -542,10 +607,7 @@ class SubWorkflowHandler:
         Returns:
             The WorkflowVersion if found, None otherwise
         """
-        return self.workflow_repo.get_version_by_number(
-            sub_workflow_id,
-            sub_workflow_version_num
-        )
+        return self._get_version(sub_workflow_id, sub_workflow_version_num)
     
     def get_parent_sub_workflow_step(
         self,
@@ -613,29 +675,21 @@ def validate_sub_workflow_reference(
         return False, errors, warnings
     
     # Check for nested sub-workflows
-    for step_def in version.definition.steps:
-        if step_def.get("step_type") == StepType.SUB_WORKFLOW_STEP.value:
-            errors.append(
-                f"Cannot embed workflow '{workflow.name}': it contains nested sub-workflows "
-                f"(step: {step_def.get('step_name', step_def.get('step_id'))})"
-            )
-            return False, errors, warnings
+    nested_step_def = version.definition.first_sub_workflow_step
+    if nested_step_def:
+        errors.append(
+            f"Cannot embed workflow '{workflow.name}': it contains nested sub-workflows "
+            f"(step: {nested_step_def.get('step_name', nested_step_def.get('step_id'))})"
+        )
+        return False, errors, warnings
     
     # Check for circular reference
     if parent_workflow_id and sub_workflow_id == parent_workflow_id:
         errors.append("Circular reference: Cannot embed a workflow within itself")
         return False, errors, warnings
     
-    # Check if sub-workflow itself references the parent (indirect circular)
-    if parent_workflow_id:
-        for step_def in version.definition.steps:
-            if step_def.get("step_type") == StepType.SUB_WORKFLOW_STEP.value:
-                nested_id = step_def.get("sub_workflow_id")
-                if nested_id == parent_workflow_id:
-                    errors.append(
-                        f"Circular reference: '{workflow.name}' already references the current workflow"
-                    )
-                    return False, errors, warnings
+    # An indirect circular reference (the sub-workflow embedding the parent) needs a
+    # SUB_WORKFLOW_STEP in the sub-workflow, which the nested check above already rejects
     
     # Warnings
     if not version.definition.steps:
@@ -664,12 +718,6 @@ def get_sub_workflow_info(
     if not version:
         return None
     
-    # Count steps by type
-    step_counts = {}
-    for step_def in version.definition.steps:
-        step_type = step_def.get("step_type", "UNKNOWN")
-        step_counts[step_type] = step_counts.get(step_type, 0) + 1
-    
     return {
         "workflow_id": sub_workflow_id,
         "version": sub_workflow_version,
@@ -677,5 +725,6 @@ def get_sub_workflow_info(
         "description": version.description,
         "category": version.category,
         "total_steps": len(version.definition.steps),
-        "step_counts": step_counts
+        # Copy, so callers cannot modify the definition's cached counts
+        "step_counts": dict(version.definition.step_counts_by_type)
     }
@@ -1,7 +1,10 @@
 """Transition Resolver - Determine next step based on events and conditions"""
-from typing import Any, Dict, List, Optional
+import logging
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from ..domain.models import WorkflowVersion, TransitionTemplate
+from ..domain.models import WorkflowDefinition, WorkflowVersion, TransitionTemplate
 from ..domain.enums import TransitionEvent
 from ..domain.errors import TransitionNotFoundError
 from .condition_evaluator import ConditionEvaluator
@@ -9,6 +12,61 @@ from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Candidate transitions per (from_step_id, on_event), highest priority first, projected
+# to (to_step_id, compiled condition or None when unconditional) rows for the hot loop
+_CompiledCandidates = Dict[
+    Tuple[str, Optional[TransitionEvent]],
+    List[Tuple[str, Optional[Callable[[Dict[str, Any]], bool]]]]
+]
+
+# Definitions of published workflow versions, keyed by (workflow_id, version_number),
+# with their compiled candidates. Versions are insert-only, so an entry never goes
+# stale; reusing the first loaded definition keeps its cached indexes alive too.
+_DEFINITION_CACHE_SIZE = 512
+_definition_cache: "OrderedDict[Tuple[str, int], Tuple[WorkflowDefinition, _CompiledCandidates]]" = OrderedDict()
+_definition_cache_lock = Lock()
+_condition_compiler = ConditionEvaluator()
+
+
+def _compile_candidates(definition: WorkflowDefinition) -> _CompiledCandidates:
+    """Project every indexed transition to a (to_step_id, compiled condition) row once"""
+    return {
+        key: [
+            (t.to_step_id, None if t.condition is None else _condition_compiler.compile(t.condition))
+            for t in transitions
+        ]
+        for key, transitions in definition.transitions_by_key.items()
+    }
+
+
+def _get_version_index(workflow_version: WorkflowVersion) -> Tuple[WorkflowDefinition, _CompiledCandidates]:
+    """Definition and compiled candidates of a workflow version, shared process-wide"""
+    key = (workflow_version.workflow_id, workflow_version.version_number)
+    with _definition_cache_lock:
+        entry = _definition_cache.get(key)
+        if entry is not None:
+            _definition_cache.move_to_end(key)
+            return entry
+        entry = (workflow_version.definition, _compile_candidates(workflow_version.definition))
+        _definition_cache[key] = entry
+        if len(_definition_cache) > _DEFINITION_CACHE_SIZE:
+            _definition_cache.popitem(last=False)
+        return entry
+
+
+def warm_version_cache(versions: List[WorkflowVersion]) -> int:
+    """Load workflow versions into the resolver cache ahead of use. Returns how many were cached."""
+    warmed = 0
+    for workflow_version in versions[:_DEFINITION_CACHE_SIZE]:
+        if workflow_version.definition is None:
+            continue
+        definition, _ = _get_version_index(workflow_version)
+        # Build the remaining cached step/transition indexes up front too
+        for index in ("steps_by_id", "transitions_by_step", "events_by_step"):
+            getattr(definition, index)
+        warmed += 1
+    return warmed
+
 
 class TransitionResolver:
     """
@@ -16,8 +74,8 @@ class TransitionResolver:
     
     Given current step S and event E:
     1. Find candidate transitions where from_step_id=S and on_event=E
-    2. Evaluate conditions (simple DSL)
-    3. Choose highest priority if multiple
+    2. Evaluate conditions (simple DSL, compiled once per version)
+    3. Choose highest priority if multiple (candidates are pre-sorted)
     4. If none found -> raise TransitionNotFoundError
     """
     
@@ -46,14 +104,8 @@ class TransitionResolver:
         Raises:
             TransitionNotFoundError: If no valid transition found
         """
-        # Get transitions from workflow definition
-        transitions = workflow_version.definition.transitions
-        
-        # Find candidate transitions
-        candidates = [
-            t for t in transitions
-            if t.from_step_id == current_step_id and t.on_event == event
-        ]
+        # Find candidate transitions (indexed once per published version)
+        candidates = _get_version_index(workflow_version)[1].get((current_step_id, event), [])
         
         if not candidates:
             # Check if current step is terminal
@@ -72,17 +124,16 @@ class TransitionResolver:
                 }
             )
         
-        # Evaluate conditions and filter
-        valid_transitions = []
-        for t in candidates:
-            if t.condition is None:
-                valid_transitions.append((t, 0))  # No condition, priority 0
-            else:
-                # Evaluate condition
-                if self.condition_evaluator.evaluate(t.condition, ticket_context):
-                    valid_transitions.append((t, t.priority))
+        # Candidates are pre-sorted by priority: the first satisfied one wins
+        next_step_id = next(
+            (
+                to_step_id for to_step_id, condition in candidates
+                if condition is None or condition(ticket_context)
+            ),
+            None
+        )
         
-        if not valid_transitions:
+        if next_step_id is None:
             raise TransitionNotFoundError(
                 f"No valid transition (conditions not met) from step {current_step_id}",
                 details={
@@ -92,20 +143,17 @@ class TransitionResolver:
                 }
             )
         
-        # Sort by priority (higher first) and pick first
-        valid_transitions.sort(key=lambda x: x[1], reverse=True)
-        selected_transition = valid_transitions[0][0]
-        
-        logger.info(
-            f"Resolved transition: {current_step_id} -> {selected_transition.to_step_id}",
-            extra={
-                "from_step": current_step_id,
-                "to_step": selected_transition.to_step_id,
-                "event": event.value
-            }
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"Resolved transition: {current_step_id} -> {next_step_id}",
+                extra={
+                    "from_step": current_step_id,
+                    "to_step": next_step_id,
+                    "event": event.value
+                }
+            )
         
-        return selected_transition.to_step_id
+        return next_step_id
     
     def _find_step_definition(
         self,
@@ -113,10 +161,7 @@ class TransitionResolver:
         workflow_version: WorkflowVersion
     ) -> Optional[Dict[str, Any]]:
         """Find step definition by ID"""
-        for step in workflow_version.definition.steps:
-            if step.get("step_id") == step_id:
-                return step
-        return None
+        return _get_version_index(workflow_version)[0].steps_by_id.get(step_id)
     
     def get_outgoing_transitions(
         self,
@@ -124,10 +169,7 @@ class TransitionResolver:
         workflow_version: WorkflowVersion
     ) -> List[TransitionTemplate]:
         """Get all outgoing transitions from a step"""
-        return [
-            t for t in workflow_version.definition.transitions
-            if t.from_step_id == step_id
-        ]
+        return list(_get_version_index(workflow_version)[0].transitions_by_step.get(step_id, []))
     
     def get_events_for_step(
         self,
@@ -135,6 +177,5 @@ class TransitionResolver:
         workflow_version: WorkflowVersion
     ) -> List[TransitionEvent]:
         """Get all possible events for a step"""
-        transitions = self.get_outgoing_transitions(step_id, workflow_version)
-        return list(set(t.on_event for t in transitions))
+        return list(_get_version_index(workflow_version)[0].events_by_step.get(step_id, []))
 
@@ -5,6 +5,7 @@ This is the entry point for the FastAPI application.
 It configures middleware, routes, and lifecycle handlers.
 """
 
+import time
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -13,6 +14,8 @@ from .config.settings import settings
 from .api.routes import api_router
 from .api.middleware import CorrelationIdMiddleware, register_error_handlers
 from .repositories.mongo_client import create_indexes, close_connection, health_check
+from .repositories.workflow_repo import WorkflowRepository
+from .engine.transition_resolver import warm_version_cache
 from .scheduler.dev_scheduler import start_scheduler, stop_scheduler
 from .utils.logger import setup_logging, get_logger
 
@@ -32,6 +35,7 @@ async def lifespan(app: FastAPI):
     
     Startup:
         - Creates MongoDB indexes
+        - Warms the transition cache with current published workflow versions
         - Starts background scheduler (in dev mode)
     
     Shutdown:
@@ -48,6 +52,14 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Failed to create indexes: {e}")
     
+    # Build transition indexes for published workflows before the first ticket event
+    try:
+        started = time.perf_counter()
+        warmed = warm_version_cache(WorkflowRepository().list_current_published_versions())
+        logger.info(f"Transition cache warmed with {warmed} workflow versions in {time.perf_counter() - started:.2f}s")
+    except Exception as e:
+        logger.error(f"Failed to warm transition cache: {e}")
+    
     # Start scheduler in dev mode
     if settings.environment == "development":
         try:
@@ -96,6 +96,7 @@ def create_indexes() -> None:
     ticket_steps.create_index("ticket_id")
     ticket_steps.create_index([("assigned_to.email", ASCENDING), ("state", ASCENDING)])
     ticket_steps.create_index("state")
+    ticket_steps.create_index([("ticket_id", ASCENDING), ("parent_sub_workflow_step_id", ASCENDING)])
     
     # Approval tasks collection
     approval_tasks = db["approval_tasks"]
@@ -2,7 +2,8 @@
 from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 from pymongo.collection import Collection
-from pymongo import DESCENDING, ASCENDING
+from pymongo import DESCENDING, ASCENDING, ReturnDocument
+from pydantic_core import to_jsonable_python
 
 from .mongo_client import get_collection
 from ..domain.models import (
@@ -32,6 +33,8 @@ class TicketRepository:
         self._info_requests: Collection = get_collection("info_requests")
         self._handover_requests: Collection = get_collection("handover_requests")
         self._sla_acknowledgments: Collection = get_collection("sla_acknowledgments")
+        # Bumped on every step write so callers can tell whether cached step lists are stale
+        self.step_write_count = 0
     
     # =========================================================================
     # Ticket CRUD
@@ -96,6 +99,49 @@ class TicketRepository:
         logger.info(f"Updated ticket: {ticket_id}", extra={"ticket_id": ticket_id})
         return Ticket.model_validate(result)
     
+    def update_branches(
+        self,
+        ticket_id: str,
+        branch_ids: List[str],
+        fields: Dict[str, Any],
+        exclude_states: Optional[List[str]] = None
+    ) -> Optional[Ticket]:
+        """
+        Atomically set fields on the matching active_branches entries of a ticket
+        
+        The branches are patched in place by the database (filtered positional
+        update), so there is no read-modify-write cycle and nothing to retry when
+        parallel branches update the ticket at the same time. Branches whose state
+        is in exclude_states are left untouched.
+        
+        Returns the updated ticket, or None if no branch matched.
+        """
+        branch_filter: Dict[str, Any] = {"branch_id": {"$in": list(branch_ids)}}
+        if exclude_states:
+            branch_filter["state"] = {"$nin": list(exclude_states)}
+        
+        result = self._tickets.find_one_and_update(
+            {"ticket_id": ticket_id, "active_branches": {"$elemMatch": branch_filter}},
+            {
+                "$set": {
+                    **{
+                        f"active_branches.$[b].{name}": value
+                        for name, value in to_jsonable_python(fields).items()
+                    },
+                    "updated_at": datetime.utcnow()
+                },
+                "$inc": {"version": 1}
+            },
+            array_filters=[{f"b.{name}": cond for name, cond in branch_filter.items()}],
+            return_document=ReturnDocument.AFTER
+        )
+        if result is None:
+            return None
+        
+        result.pop("_id", None)
+        logger.info(f"Updated branches for ticket: {ticket_id}", extra={"ticket_id": ticket_id})
+        return Ticket.model_validate(result)
+    
     def list_tickets(
         self,
         requester_email: Optional[str] = None,
@@ -272,6 +318,7 @@ class TicketRepository:
         doc["_id"] = step.ticket_step_id
         
         self._steps.insert_one(doc)
+        self.step_write_count += 1
         logger.info(
             f"Created ticket step: {step.ticket_step_id}",
             extra={"ticket_id": step.ticket_id, "step_id": step.ticket_step_id}
@@ -290,6 +337,7 @@ class TicketRepository:
             docs.append(doc)
         
         self._steps.insert_many(docs)
+        self.step_write_count += 1
         logger.info(f"Created {len(steps)} ticket steps")
         return steps
     
@@ -309,6 +357,18 @@ class TicketRepository:
             return doc
         return None
     
+    def get_step_raws(self, ticket_step_ids: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Get raw documents of several steps in one query (None where a step is missing)"""
+        docs_by_step: Dict[str, Optional[Dict[str, Any]]] = {step_id: None for step_id in ticket_step_ids}
+        if not ticket_step_ids:
+            return docs_by_step
+        
+        for doc in self._steps.find({"ticket_step_id": {"$in": ticket_step_ids}}):
+            doc.pop("_id", None)
+            docs_by_step[doc["ticket_step_id"]] = doc
+        
+        return docs_by_step
+    
     def get_step_or_raise(self, ticket_step_id: str) -> TicketStep:
         """Get ticket step by ID or raise error"""
         step = self.get_step(ticket_step_id)
@@ -323,16 +383,38 @@ class TicketRepository:
         expected_version: Optional[int] = None
     ) -> TicketStep:
         """Update ticket step with optimistic concurrency"""
+        if expected_version is not None:
+            updates["version"] = expected_version + 1
+        
+        return self.update_step_raw(
+            ticket_step_id,
+            {"$set": updates},
+            expected_version=expected_version
+        )
+    
+    def update_step_raw(
+        self,
+        ticket_step_id: str,
+        update_doc: Dict[str, Any],
+        expected_version: Optional[int] = None
+    ) -> TicketStep:
+        """
+        Apply a fully-formed MongoDB update document to a ticket step
+        
+        The caller owns the document shape (e.g. {"$set": {...}, "$inc": {"version": 1}}),
+        so no translation is done here. Optimistic concurrency is enforced by
+        filtering on expected_version when given.
+        """
         filter_query = {"ticket_step_id": ticket_step_id}
         if expected_version is not None:
             filter_query["version"] = expected_version
-            updates["version"] = expected_version + 1
         
         result = self._steps.find_one_and_update(
             filter_query,
-            {"$set": updates},
+            update_doc,
             return_document=True
         )
+        self.step_write_count += 1
         
         if result is None:
             if expected_version is not None:
@@ -348,6 +430,68 @@ class TicketRepository:
         logger.info(f"Updated ticket step: {ticket_step_id}", extra={"step_id": ticket_step_id})
         return TicketStep.model_validate(result)
     
+    def bulk_update_steps(
+        self,
+        ticket_step_ids: List[str],
+        updates: Dict[str, Any],
+        exclude_states: Optional[List[str]] = None
+    ) -> int:
+        """
+        Apply the same update to many steps in one round-trip
+        
+        Steps whose state is in exclude_states are left untouched, which stands in
+        for the per-step expected_version guard. Each updated step's version is
+        incremented. Returns the number of steps modified.
+        """
+        if not ticket_step_ids:
+            return 0
+        
+        filter_query: Dict[str, Any] = {"ticket_step_id": {"$in": ticket_step_ids}}
+        if exclude_states:
+            filter_query["state"] = {"$nin": exclude_states}
+        
+        result = self._steps.update_many(filter_query, {"$set": updates, "$inc": {"version": 1}})
+        self.step_write_count += 1
+        logger.info(f"Bulk updated {result.modified_count} ticket steps")
+        return result.modified_count
+    
+    def get_step_ids_matching(
+        self,
+        ticket_step_ids: List[str],
+        match: Dict[str, Any]
+    ) -> List[str]:
+        """Get the ticket_step_ids among ticket_step_ids whose documents match every field in match"""
+        if not ticket_step_ids:
+            return []
+        
+        return self._steps.distinct(
+            "ticket_step_id",
+            {"ticket_step_id": {"$in": ticket_step_ids}, **match}
+        )
+    
+    def update_steps_in_states(
+        self,
+        ticket_id: str,
+        states: List[str],
+        updates: Dict[str, Any]
+    ) -> int:
+        """
+        Apply updates to every step of a ticket currently in one of states
+        
+        A single update_many; the state filter is evaluated by the database, so no
+        per-step read is needed. Returns the number of steps modified.
+        """
+        result = self._steps.update_many(
+            {"ticket_id": ticket_id, "state": {"$in": states}},
+            {"$set": updates, "$inc": {"version": 1}}
+        )
+        self.step_write_count += 1
+        logger.info(
+            f"Updated {result.modified_count} steps in states {states} for ticket: {ticket_id}",
+            extra={"ticket_id": ticket_id}
+        )
+        return result.modified_count
+    
     def get_steps_for_ticket(self, ticket_id: str) -> List[TicketStep]:
         """Get all steps for a ticket"""
         cursor = self._steps.find({"ticket_id": ticket_id}).sort("step_id", ASCENDING)
@@ -359,6 +503,61 @@ class TicketRepository:
         
         return steps
     
+    def get_steps_by_parent_sub_workflow(
+        self,
+        ticket_id: str,
+        parent_sub_workflow_step_id: str
+    ) -> List[TicketStep]:
+        """Get the steps of one sub-workflow instance of a ticket"""
+        cursor = self._steps.find({
+            "ticket_id": ticket_id,
+            "parent_sub_workflow_step_id": parent_sub_workflow_step_id
+        }).sort("step_id", ASCENDING)
+        
+        steps = []
+        for doc in cursor:
+            doc.pop("_id", None)
+            steps.append(TicketStep.model_validate(doc))
+        
+        return steps
+    
+    def count_sub_workflow_steps_by_state(
+        self,
+        ticket_id: str,
+        parent_sub_workflow_step_id: str
+    ) -> Dict[str, int]:
+        """Count the steps of one sub-workflow instance per state value"""
+        pipeline = [
+            {"$match": {
+                "ticket_id": ticket_id,
+                "parent_sub_workflow_step_id": parent_sub_workflow_step_id
+            }},
+            {"$group": {"_id": "$state", "count": {"$sum": 1}}}
+        ]
+        return {doc["_id"]: doc["count"] for doc in self._steps.aggregate(pipeline)}
+    
+    def has_non_terminal_branch_step(
+        self,
+        ticket_id: str,
+        branch_id: str,
+        terminal_states: List[str],
+        ignore_step_types: Optional[List[str]] = None
+    ) -> bool:
+        """
+        Check whether any step of a branch is outside terminal_states
+        
+        Answered by a single projected find_one, so no step documents are shipped.
+        Steps whose type is in ignore_step_types are not considered.
+        """
+        query: Dict[str, Any] = {
+            "ticket_id": ticket_id,
+            "branch_id": branch_id,
+            "state": {"$nin": terminal_states}
+        }
+        if ignore_step_types:
+            query["step_type"] = {"$nin": ignore_step_types}
+        return self._steps.find_one(query, {"_id": 1}) is not None
+    
     def get_assigned_steps(
         self,
         assignee_email: str,
@@ -543,6 +742,20 @@ class TicketRepository:
         
         return tasks
     
+    def get_approval_tasks_for_steps(self, ticket_step_ids: List[str]) -> Dict[str, List[ApprovalTask]]:
+        """Get approval tasks for several steps in one query, grouped by ticket_step_id"""
+        tasks_by_step: Dict[str, List[ApprovalTask]] = {step_id: [] for step_id in ticket_step_ids}
+        if not ticket_step_ids:
+            return tasks_by_step
+        
+        cursor = self._approval_tasks.find({"ticket_step_id": {"$in": ticket_step_ids}})
+        for doc in cursor:
+            doc.pop("_id", None)
+            task = ApprovalTask.model_validate(doc)
+            tasks_by_step.setdefault(task.ticket_step_id, []).append(task)
+        
+        return tasks_by_step
+    
     def get_approval_tasks_for_ticket(self, ticket_id: str) -> List[ApprovalTask]:
         """Get all approval tasks for a specific ticket"""
         cursor = self._approval_tasks.find({"ticket_id": ticket_id})
@@ -618,6 +831,24 @@ class TicketRepository:
         result.pop("_id", None)
         return ApprovalTask.model_validate(result)
     
+    def update_pending_approval_tasks_for_steps(
+        self,
+        ticket_step_ids: List[str],
+        updates: Dict[str, Any]
+    ) -> int:
+        """Update all PENDING approval tasks of the given steps in one round-trip"""
+        if not ticket_step_ids:
+            return 0
+        
+        result = self._approval_tasks.update_many(
+            {
+                "ticket_step_id": {"$in": ticket_step_ids},
+                "decision": ApprovalDecision.PENDING.value
+            },
+            {"$set": updates}
+        )
+        return result.modified_count
+    
     def get_completed_approvals_by_manager(
         self,
         manager_email: str,
@@ -827,6 +1058,26 @@ class TicketRepository:
             return InfoRequest.model_validate(doc)
         return None
     
+    def get_open_info_requests_for_steps(
+        self,
+        ticket_step_ids: List[str]
+    ) -> Dict[str, Optional[InfoRequest]]:
+        """Get the open info request of several steps in one query (None where there is none)"""
+        requests_by_step: Dict[str, Optional[InfoRequest]] = {step_id: None for step_id in ticket_step_ids}
+        if not ticket_step_ids:
+            return requests_by_step
+        
+        cursor = self._info_requests.find({
+            "ticket_step_id": {"$in": ticket_step_ids},
+            "status": InfoRequestStatus.OPEN.value
+        })
+        for doc in cursor:
+            doc.pop("_id", None)
+            if requests_by_step.get(doc.get("ticket_step_id")) is None:
+                requests_by_step[doc["ticket_step_id"]] = InfoRequest.model_validate(doc)
+        
+        return requests_by_step
+    
     def get_info_requests_for_ticket(self, ticket_id: str) -> List[InfoRequest]:
         """Get all info requests for a ticket"""
         cursor = self._info_requests.find({"ticket_id": ticket_id}).sort("requested_at", DESCENDING)
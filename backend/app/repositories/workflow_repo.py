@@ -1,5 +1,5 @@
 """Workflow Repository - Data access for workflows and versions"""
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
 from pymongo.collection import Collection
 from pymongo import DESCENDING
@@ -286,6 +286,42 @@ class WorkflowRepository:
                 return None
         return None
     
+    def get_versions_by_numbers(
+        self,
+        refs: List[Tuple[str, int]]
+    ) -> Dict[Tuple[str, int], WorkflowVersion]:
+        """Get several versions by (workflow_id, version_number) in one query. Skips corrupted records."""
+        versions: Dict[Tuple[str, int], WorkflowVersion] = {}
+        if not refs:
+            return versions
+        
+        cursor = self._versions.find({"$or": [
+            {"workflow_id": workflow_id, "version_number": version_number}
+            for workflow_id, version_number in set(refs)
+        ]})
+        for doc in cursor:
+            doc.pop("_id", None)
+            try:
+                version = WorkflowVersion.model_validate(doc)
+            except ValidationError as e:
+                logger.error(
+                    f"Corrupted version {doc.get('version_number')} for workflow {doc.get('workflow_id')}: {str(e)[:300]}",
+                    extra={"workflow_id": doc.get("workflow_id"), "version_number": doc.get("version_number")}
+                )
+                continue
+            versions[(version.workflow_id, version.version_number)] = version
+        
+        return versions
+    
+    def list_current_published_versions(self, limit: int = 500) -> List[WorkflowVersion]:
+        """Get the current version of each published workflow. Skips corrupted records."""
+        cursor = self._workflows.find(
+            {"status": WorkflowStatus.PUBLISHED.value, "current_version": {"$ne": None}},
+            {"_id": 0, "workflow_id": 1, "current_version": 1}
+        ).limit(limit)
+        refs = [(doc["workflow_id"], doc["current_version"]) for doc in cursor]
+        return list(self.get_versions_by_numbers(refs).values())
+    
     def list_versions(
         self,
         workflow_id: str,
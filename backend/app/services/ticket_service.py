@@ -301,9 +301,10 @@ class TicketService:
     ) -> List[Dict[str, Any]]:
         """Get tasks that actor can act on"""
         actionable = []
+        actions_by_step = self.engine.permission_guard.get_available_actions_bulk(actor, ticket, steps)
         
         for step in steps:
-            actions = self.engine.permission_guard.get_available_actions(actor, ticket, step)
+            actions = actions_by_step[step.ticket_step_id]
             if actions:
                 actionable.append({
                     "ticket_step_id": step.ticket_step_id,
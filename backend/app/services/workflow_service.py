@@ -666,18 +666,15 @@ class WorkflowService:
             return {"errors": errors, "warnings": warnings}
         
         # Check for nested sub-workflows (Level 1 only)
-        if version.definition and version.definition.steps:
-            for sub_step in version.definition.steps:
-                if sub_step.get("step_type") == StepType.SUB_WORKFLOW_STEP.value:
-                    errors.append({
-                        "type": "NESTED_SUB_WORKFLOW",
-                        "message": (
-                            f"Cannot embed workflow '{sub_workflow.name}': it contains nested sub-workflows. "
-                            f"Only single-level workflow embedding is supported."
-                        ),
-                        "path": f"{path_prefix}.sub_workflow_id"
-                    })
-                    break
+        if version.definition and version.definition.first_sub_workflow_step:
+            errors.append({
+                "type": "NESTED_SUB_WORKFLOW",
+                "message": (
+                    f"Cannot embed workflow '{sub_workflow.name}': it contains nested sub-workflows. "
+                    f"Only single-level workflow embedding is supported."
+                ),
+                "path": f"{path_prefix}.sub_workflow_id"
+            })
         
         # Check if sub-workflow has valid structure
         if version.definition: